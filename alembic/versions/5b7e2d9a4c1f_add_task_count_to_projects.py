@@ -0,0 +1,43 @@
+"""add task_count to projects
+
+Revision ID: 5b7e2d9a4c1f
+Revises: 28908415c323
+Create Date: 2026-10-18 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e2d9a4c1f'
+down_revision: Union[str, Sequence[str], None] = '28908415c323'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'projects',
+        sa.Column('task_count', sa.Integer(), server_default='0', nullable=False),
+    )
+    op.execute(
+        """
+        UPDATE projects
+        SET task_count = counts.task_count
+        FROM (
+            SELECT project_id, count(*) AS task_count
+            FROM tasks
+            GROUP BY project_id
+        ) AS counts
+        WHERE counts.project_id = projects.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('projects', 'task_count')
@@ -0,0 +1,31 @@
+"""add version to projects
+
+Revision ID: 7e93a1b5d820
+Revises: c41d8f0e6a27
+Create Date: 2026-10-18 13:41:05.184437
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e93a1b5d820'
+down_revision: Union[str, Sequence[str], None] = 'c41d8f0e6a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'projects',
+        sa.Column('version', sa.Integer(), server_default='1', nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('projects', 'version')
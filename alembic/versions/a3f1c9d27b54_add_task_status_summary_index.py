@@ -0,0 +1,40 @@
+"""add task status summary index
+
+Revision ID: a3f1c9d27b54
+Revises: 7e93a1b5d820
+Create Date: 2026-10-18 15:12:44.301862
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f1c9d27b54'
+down_revision: Union[str, Sequence[str], None] = '7e93a1b5d820'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Covers every column the project summaries read, so the
+    # GROUP BY project_id, status aggregate is an index-only scan.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_project_id_status_deadline',
+            'tasks',
+            ['project_id', 'status', 'deadline'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tasks_project_id_status_deadline',
+            table_name='tasks',
+            postgresql_concurrently=True,
+        )
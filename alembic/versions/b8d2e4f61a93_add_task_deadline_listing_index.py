@@ -0,0 +1,40 @@
+"""add task deadline listing index
+
+Revision ID: b8d2e4f61a93
+Revises: a3f1c9d27b54
+Create Date: 2026-10-18 16:27:09.518234
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d2e4f61a93'
+down_revision: Union[str, Sequence[str], None] = 'a3f1c9d27b54'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Serves task listings sorted by deadline in either direction; listings
+    # sorted by created_at use ix_tasks_project_id_created_at_id.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_project_id_deadline_id',
+            'tasks',
+            ['project_id', 'deadline', 'id'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tasks_project_id_deadline_id',
+            table_name='tasks',
+            postgresql_concurrently=True,
+        )
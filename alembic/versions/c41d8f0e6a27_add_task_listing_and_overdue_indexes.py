@@ -0,0 +1,64 @@
+"""add task listing and overdue indexes
+
+Revision ID: c41d8f0e6a27
+Revises: 5b7e2d9a4c1f
+Create Date: 2026-10-18 10:03:17.552910
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d8f0e6a27'
+down_revision: Union[str, Sequence[str], None] = '5b7e2d9a4c1f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction block, and keeps
+    # writes to `tasks` flowing while the indexes are built.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_project_id_created_at_id',
+            'tasks',
+            ['project_id', 'created_at', 'id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_tasks_open_deadline',
+            'tasks',
+            ['deadline'],
+            postgresql_where=sa.text("status <> 'done'"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_projects_created_at_id',
+            'projects',
+            ['created_at', 'id'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_projects_created_at_id',
+            table_name='projects',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_tasks_open_deadline',
+            table_name='tasks',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_tasks_project_id_created_at_id',
+            table_name='tasks',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,56 @@
+"""add task search vector
+
+Revision ID: c5e9a7b3d146
+Revises: b8d2e4f61a93
+Create Date: 2026-10-18 17:48:31.902517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e9a7b3d146'
+down_revision: Union[str, Sequence[str], None] = 'b8d2e4f61a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A stored generated column is filled for existing rows by the ALTER
+    # itself and kept current by PostgreSQL on every INSERT/UPDATE.
+    op.add_column(
+        'tasks',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('simple', "
+                "coalesce(title, '') || ' ' || coalesce(description, ''))",
+                persisted=True,
+            ),
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_search_vector',
+            'tasks',
+            ['search_vector'],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tasks_search_vector',
+            table_name='tasks',
+            postgresql_concurrently=True,
+        )
+    op.drop_column('tasks', 'search_vector')
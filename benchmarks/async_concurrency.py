@@ -0,0 +1,178 @@
+"""
+Compare request throughput and latency of the sync (threadpool +
+psycopg2) and async (async def + asyncpg) API stacks under rising
+concurrency.
+
+Both stacks are started as separate uvicorn processes against the
+configured PostgreSQL database, seeded with one project, and then
+driven by a small keep-alive HTTP client on asyncio:
+
+    poetry run python benchmarks/async_concurrency.py --requests 2000
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+import uuid
+
+HOST = "127.0.0.1"
+
+
+def start_server(port: int, async_stack: bool) -> subprocess.Popen:
+    env = dict(os.environ, API_ASYNC_STACK="true" if async_stack else "false")
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "todo_list.api.main:app",
+            "--host", HOST, "--port", str(port), "--log-level", "warning",
+        ],
+        env=env,
+    )
+
+
+def wait_until_ready(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"http://{HOST}:{port}/api/health")
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def post_json(port: int, path: str, payload: dict) -> dict:
+    request = urllib.request.Request(
+        f"http://{HOST}:{port}{path}",
+        data=json.dumps(payload).encode(),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())
+
+
+def delete(port: int, path: str) -> None:
+    request = urllib.request.Request(
+        f"http://{HOST}:{port}{path}", method="DELETE"
+    )
+    urllib.request.urlopen(request).close()
+
+
+async def fetch(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    path: str,
+) -> None:
+    writer.write(
+        f"GET {path} HTTP/1.1\r\nHost: {HOST}\r\n\r\n".encode()
+    )
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    length = 0
+    for line in head.split(b"\r\n"):
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":", 1)[1])
+    await reader.readexactly(length)
+
+
+async def drive(
+    port: int,
+    paths: list[str],
+    concurrency: int,
+    total: int,
+) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+    counter = iter(range(total))
+
+    async def worker() -> None:
+        reader, writer = await asyncio.open_connection(HOST, port)
+        try:
+            for i in counter:
+                start = time.perf_counter()
+                await fetch(reader, writer, paths[i % len(paths)])
+                latencies.append((time.perf_counter() - start) * 1000)
+        finally:
+            writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started, latencies
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 16, 64, 256]
+    )
+    parser.add_argument("--tasks", type=int, default=200)
+    args = parser.parse_args()
+
+    stacks = {"sync": 8101, "async": 8102}
+    servers = [
+        start_server(port, async_stack=(name == "async"))
+        for name, port in stacks.items()
+    ]
+    try:
+        for port in stacks.values():
+            wait_until_ready(port)
+
+        seed_port = stacks["sync"]
+        project = post_json(
+            seed_port,
+            "/api/projects",
+            {"name": f"bench-{uuid.uuid4().hex[:8]}", "description": "bench"},
+        )
+        post_json(
+            seed_port,
+            f"/api/tasks/projects/{project['id']}/batch",
+            {
+                "tasks": [
+                    {"title": f"task {i}", "description": "bench"}
+                    for i in range(args.tasks)
+                ]
+            },
+        )
+        paths = [
+            f"/api/projects/{project['id']}",
+            f"/api/tasks/projects/{project['id']}?limit=50",
+        ]
+
+        print(
+            f"{'stack':<6} {'conc':>5} {'req/s':>10} "
+            f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+        )
+        try:
+            for concurrency in args.concurrency:
+                for name, port in stacks.items():
+                    asyncio.run(drive(port, paths, concurrency, 50))
+                    elapsed, latencies = asyncio.run(
+                        drive(port, paths, concurrency, args.requests)
+                    )
+                    print(
+                        f"{name:<6} {concurrency:>5} "
+                        f"{len(latencies) / elapsed:>10.1f} "
+                        f"{statistics.median(latencies):>9.2f} "
+                        f"{percentile(latencies, 0.95):>9.2f} "
+                        f"{percentile(latencies, 0.99):>9.2f}"
+                    )
+        finally:
+            delete(seed_port, f"/api/projects/{project['id']}")
+    finally:
+        for server in servers:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
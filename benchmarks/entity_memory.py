@@ -0,0 +1,124 @@
+"""
+Memory per task of the in-memory representation.
+
+--tasks task entities with realistic field values (unique titles, a third
+of them without a deadline, some closed) are allocated while tracemalloc
+counts the bytes. The compact slotted `Task` is compared with the plain
+dataclass it replaced, which is reproduced below (`DataclassTask`): a
+__dict__ per instance, ISO strings for every timestamp and deadline, and
+a fresh status string per task as parsed input would give.
+
+The last row fills a whole InMemoryStorage, so it includes the indexes
+(status, tokens, deadlines, owner map) on top of the entities.
+
+    poetry run python benchmarks/entity_memory.py --tasks 100000 1000000
+"""
+import argparse
+import gc
+import os
+import tracemalloc
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Callable, Optional
+
+# The storage reads its limits at import time.
+os.environ["MAX_NUMBER_OF_TASKS"] = str(10**9)
+os.environ["MAX_NUMBER_OF_PROJECTS"] = str(10**9)
+
+from todo_list.core.entities import Project, Task  # noqa: E402
+from todo_list.in_memory.storage.in_memory_storage import (  # noqa: E402
+    InMemoryStorage,
+)
+
+
+@dataclass
+class DataclassTask:
+    id: int
+    title: str
+    description: str
+    status: str = "todo"
+    deadline: Optional[str] = None
+    created_at: str = ""
+    project_id: Optional[int] = None
+    closed_at: Optional[str] = None
+
+
+def fields(i: int) -> tuple:
+    today = date.today()
+    created = datetime(2024, 1, 1) + timedelta(seconds=i * 7, microseconds=i)
+    deadline = (today + timedelta(days=i % 90)).isoformat() if i % 3 else None
+    closed = (created + timedelta(days=2)).isoformat() if i % 5 == 0 else None
+    # "".join builds a new string object, like a value parsed from input.
+    status = "".join(("todo", "doing", "done")[i % 3])
+    return (
+        i + 1,
+        f"task {i}",
+        f"description of task {i}",
+        status,
+        deadline,
+        created.isoformat(),
+        i // 1000 + 1,
+        closed,
+    )
+
+
+def measure(count: int, build: Callable[[tuple], object]) -> float:
+    # The input rows are allocated while tracing and dropped before the
+    # reading: the values an entity keeps are counted, nothing else is.
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    rows = [fields(i) for i in range(count)]
+    kept = [build(row) for row in rows]
+    del rows
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # The list holding the entities is not part of them.
+    container = kept.__sizeof__()
+    del kept
+    return (after - before - container) / count
+
+
+def measure_storage(count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    rows = [fields(i) for i in range(count)]
+    storage = InMemoryStorage()
+    for project_id in range(1, rows[-1][6] + 1):
+        storage._insert_project(
+            Project.restore(
+                project_id, f"project {project_id}", "", rows[0][5], 1
+            )
+        )
+    storage._insert_tasks(Task.restore(*row) for row in rows)
+    del rows
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del storage
+    return (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--tasks", type=int, nargs="+", default=[100_000, 1_000_000]
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'tasks':>10} {'dataclass B':>12} {'slotted B':>10} "
+        f"{'saved':>6} {'storage B':>10}"
+    )
+    for count in args.tasks:
+        legacy = measure(count, lambda row: DataclassTask(*row))
+        compact = measure(count, lambda row: Task.restore(*row))
+        storage = measure_storage(count)
+        print(
+            f"{count:>10,} {legacy:>12.0f} {compact:>10.0f} "
+            f"{1 - compact / legacy:>6.0%} {storage:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
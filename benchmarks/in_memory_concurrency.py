@@ -0,0 +1,314 @@
+"""
+Multi-threaded stress test and throughput benchmark for InMemoryStorage.
+
+Stress: --threads threads hammer a shared storage with project creates,
+renames (fighting over a small pool of names) and deletes, and task
+creates, updates, status changes and deletes. Afterwards every secondary
+index is checked against the primary dicts; any mismatch aborts the run.
+Then the same threads race to create tasks against a small task limit,
+which must be reached exactly and never overshot.
+
+Throughput: the same mixed workload (by default 80% reads: project pages,
+status lookups, searches; 20% task writes, each thread mostly in its own
+projects) for each thread count, once with a single lock stripe (every
+task write serialised, as with one global lock) and once with the
+default striping. Read latency is sampled alongside: readers take no
+locks, so it does not depend on the striping.
+
+On an interpreter with the GIL the totals can only stay level as threads
+are added; run it on a free-threaded build (python3.13t and later) to see
+them scale with the cores:
+
+    poetry run python benchmarks/in_memory_concurrency.py --threads 1 2 4 8
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from collections import Counter
+
+# The storage reads its limits at import time.
+os.environ["MAX_NUMBER_OF_TASKS"] = str(10**9)
+os.environ["MAX_NUMBER_OF_PROJECTS"] = str(10**9)
+
+from todo_list.core.exceptions import (  # noqa: E402
+    DuplicateError,
+    LimitExceededError,
+    NotFoundError,
+)
+from todo_list.in_memory.storage.in_memory_storage import (  # noqa: E402
+    DEFAULT_LOCK_STRIPES,
+    InMemoryStorage,
+    _task_tokens,
+)
+
+STATUSES = ("todo", "doing", "done")
+WORDS = ("alpha", "beta", "gamma", "delta", "report", "deploy", "review")
+
+
+def run_threads(count: int, target) -> float:
+    barrier = threading.Barrier(count + 1)
+    errors: list[BaseException] = []
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        try:
+            target(index)
+        except BaseException as exc:
+            errors.append(exc)
+
+    threads = [
+        threading.Thread(target=worker, args=(i,)) for i in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+    if errors:
+        raise errors[0]
+    return seconds
+
+
+def check_invariants(storage: InMemoryStorage) -> None:
+    projects = storage._projects
+    tasks = storage._tasks
+
+    names = [p.name for p in projects.values()]
+    assert len(names) == len(set(names)), "duplicate project names"
+    assert storage._project_names == set(names), "name set out of step"
+
+    owned = {}
+    stripe_counts = Counter()
+    for project in projects.values():
+        for task_id, task in project.tasks.items():
+            assert tasks.get(task_id) is task, f"task {task_id} not stored"
+            owned[task_id] = project.id
+        stripe_counts[id(storage._stripe(project.id))] += len(project.tasks)
+    assert owned.keys() == tasks.keys(), "tasks without a project"
+    assert storage._task_slots == len(tasks), "task limit count out of step"
+    assert storage._task_projects == owned, "owner map out of step"
+    for stripe in storage._stripes:
+        assert stripe.task_count == stripe_counts[id(stripe)], (
+            "stripe task count out of step"
+        )
+
+    indexed = {
+        task_id: status
+        for status, ids in storage._status_index.items()
+        for task_id in ids
+    }
+    assert indexed == {t.id: t.status for t in tasks.values()}, (
+        "status index out of step"
+    )
+
+    postings = Counter()
+    for token, ids in storage._token_index.items():
+        assert ids, f"empty postings for {token!r}"
+        for task_id in ids:
+            postings[task_id, token] += 1
+    expected = Counter(
+        (task.id, token)
+        for task in tasks.values()
+        for token in set(_task_tokens(task))
+    )
+    assert postings == expected, "token index out of step"
+
+
+def stress(threads: int, operations: int, seed: int) -> None:
+    storage = InMemoryStorage(lock_stripes=8)
+    for i in range(threads * 4):
+        storage.create_project(f"seed {i}", "stress")
+    conflicts = Counter()
+
+    def work(index: int) -> None:
+        rng = random.Random(seed + index)
+        for _ in range(operations):
+            projects = storage.get_all_projects()
+            roll = rng.random()
+            try:
+                if roll < 0.04:
+                    storage.create_project(f"name {rng.randrange(20)}", "x")
+                elif roll < 0.08 and projects:
+                    storage.update_project(
+                        rng.choice(projects).id,
+                        name=f"name {rng.randrange(20)}",
+                    )
+                elif roll < 0.09 and len(projects) > threads:
+                    storage.delete_project(rng.choice(projects).id)
+                elif roll < 0.60 and projects:
+                    storage.create_task(
+                        rng.choice(projects).id,
+                        " ".join(rng.sample(WORDS, 2)),
+                        rng.choice(WORDS),
+                        status=rng.choice(STATUSES),
+                    )
+                else:
+                    task_ids = list(storage._tasks)
+                    if not task_ids:
+                        continue
+                    task_id = rng.choice(task_ids)
+                    if roll < 0.78:
+                        storage.update_task(
+                            task_id,
+                            title=" ".join(rng.sample(WORDS, 2)),
+                            status=rng.choice(STATUSES),
+                        )
+                    elif roll < 0.92:
+                        storage.change_task_status(
+                            task_id, rng.choice(STATUSES)
+                        )
+                    else:
+                        storage.delete_task(task_id)
+            except DuplicateError:
+                conflicts["duplicate name"] += 1
+            except NotFoundError:
+                conflicts["gone meanwhile"] += 1
+
+    seconds = run_threads(threads, work)
+    check_invariants(storage)
+    print(
+        f"stress: {threads} threads x {operations:,} ops in {seconds:.2f}s, "
+        f"{len(storage._projects)} projects, {len(storage._tasks):,} tasks, "
+        f"invariants hold ({dict(conflicts)})"
+    )
+
+
+def stress_task_limit(threads: int, seed: int, max_tasks: int = 50) -> None:
+    storage = InMemoryStorage(max_tasks=max_tasks, lock_stripes=8)
+    project_ids = [
+        storage.create_project(f"limit {i}", "stress").id
+        for i in range(threads * 2)
+    ]
+    # Creates for a project that does not exist must give their slot back.
+    missing = max(project_ids) + 1
+    outcomes = Counter()
+
+    def work(index: int) -> None:
+        rng = random.Random(seed + index)
+        for _ in range(max_tasks):
+            try:
+                if rng.random() < 0.1:
+                    storage.create_task(missing, "gone", "x")
+                else:
+                    storage.create_task(rng.choice(project_ids), "t", "x")
+                outcomes["created"] += 1
+            except LimitExceededError:
+                outcomes["over limit"] += 1
+            except NotFoundError:
+                outcomes["no project"] += 1
+
+    run_threads(threads, work)
+    check_invariants(storage)
+    assert len(storage._tasks) == max_tasks, (
+        f"task limit {max_tasks} not kept: {len(storage._tasks)} tasks"
+    )
+    print(
+        f"task limit: {threads} threads, {len(storage._tasks)} of "
+        f"{max_tasks} tasks created ({dict(outcomes)})"
+    )
+
+
+def fill(lock_stripes: int, projects: int, per_project: int) -> InMemoryStorage:
+    storage = InMemoryStorage(lock_stripes=lock_stripes)
+    rng = random.Random(0)
+    for p in range(projects):
+        project_id = storage.create_project(f"project {p}", "bench").id
+        for i in range(per_project):
+            storage.create_task(
+                project_id,
+                " ".join(rng.sample(WORDS, 2)),
+                f"task {i}",
+                status=rng.choice(STATUSES),
+            )
+    return storage
+
+
+def throughput(
+    storage: InMemoryStorage,
+    threads: int,
+    operations: int,
+    read_share: float,
+) -> tuple[float, float, float]:
+    project_ids = [p.id for p in storage.get_all_projects()]
+    latencies: list[float] = []
+
+    def work(index: int) -> None:
+        rng = random.Random(index)
+        # Each thread writes mostly to its own slice of the projects, as
+        # requests for different users' projects would.
+        own = project_ids[index::threads] or project_ids
+        sampled = []
+        for n in range(operations):
+            if rng.random() < read_share:
+                start = time.perf_counter()
+                roll = rng.random()
+                project_id = rng.choice(project_ids)
+                if roll < 0.5:
+                    storage.get_project_tasks(project_id)
+                elif roll < 0.8:
+                    storage.get_tasks_by_status(
+                        rng.choice(STATUSES), project_id
+                    )
+                else:
+                    storage.search_tasks_ranked(rng.choice(WORDS), project_id)
+                if n % 16 == 0:
+                    sampled.append(time.perf_counter() - start)
+            else:
+                project_id = rng.choice(own)
+                task = storage.create_task(project_id, "bench write", "x")
+                storage.change_task_status(task.id, "done")
+                storage.delete_task(task.id)
+        latencies.extend(sampled)
+
+    seconds = run_threads(threads, work)
+    percentiles = statistics.quantiles(latencies, n=100)
+    return (
+        threads * operations / seconds,
+        percentiles[49] * 1e6,
+        percentiles[98] * 1e6,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--projects", type=int, default=64)
+    parser.add_argument("--per-project", type=int, default=200)
+    parser.add_argument("--operations", type=int, default=5_000)
+    parser.add_argument("--read-share", type=float, default=0.8)
+    parser.add_argument("--stress-operations", type=int, default=3_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python {sys.version.split()[0]}, GIL {'on' if gil else 'off'}, "
+          f"{os.cpu_count()} CPUs")
+
+    stress(max(args.threads), args.stress_operations, args.seed)
+    stress_task_limit(max(*args.threads, 16), args.seed)
+
+    print()
+    print(
+        f"{'threads':>8} {'stripes':>8} {'ops/s':>12} "
+        f"{'read p50':>10} {'read p99':>10}"
+    )
+    for lock_stripes in (1, DEFAULT_LOCK_STRIPES):
+        for threads in args.threads:
+            storage = fill(lock_stripes, args.projects, args.per_project)
+            ops, p50, p99 = throughput(
+                storage, threads, args.operations, args.read_share
+            )
+            print(
+                f"{threads:>8} {lock_stripes:>8} {ops:>12,.0f} "
+                f"{p50:>8.0f}us {p99:>8.0f}us"
+            )
+
+
+if __name__ == "__main__":
+    main()
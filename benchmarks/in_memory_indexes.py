@@ -0,0 +1,106 @@
+"""
+Micro-benchmarks for the secondary indexes of InMemoryStorage.
+
+For each size the storage is filled with projects of --per-project tasks
+(about 2% of them overdue) and then timed on the operations the indexes
+serve. The "scan" column repeats the owner lookup delete_task used to do
+(a walk over every project) to show what the reverse map replaced:
+
+    poetry run python benchmarks/in_memory_indexes.py --tasks 10000 100000 1000000
+"""
+import argparse
+import os
+import random
+import statistics
+import time
+from datetime import date, timedelta
+from typing import Callable
+
+# The storage reads its limits at import time.
+os.environ["MAX_NUMBER_OF_TASKS"] = str(10**9)
+os.environ["MAX_NUMBER_OF_PROJECTS"] = str(10**9)
+
+from todo_list.in_memory.storage.in_memory_storage import (  # noqa: E402
+    InMemoryStorage,
+)
+
+
+def fill(tasks: int, per_project: int) -> InMemoryStorage:
+    storage = InMemoryStorage()
+    today = date.today()
+    project_id = 0
+    for i in range(tasks):
+        if i % per_project == 0:
+            project_id = storage.create_project(f"p{i}", "bench").id
+        if i % 50 == 0:
+            deadline = (today - timedelta(days=1 + i % 7)).isoformat()
+        else:
+            deadline = (today + timedelta(days=1 + i % 90)).isoformat()
+        storage.create_task(project_id, f"task {i}", "bench", deadline=deadline)
+    return storage
+
+
+def per_call_us(fn: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1e6
+
+
+def scan_for_owner(storage: InMemoryStorage, task_id: int) -> None:
+    for project in storage._projects.values():
+        if task_id in project.tasks:
+            break
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--tasks", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--per-project", type=int, default=1000)
+    parser.add_argument("--deletes", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(
+        f"{'tasks':>9} {'fill s':>7} {'delete us':>10} {'scan us':>10} "
+        f"{'projects us':>12} {'project tasks us':>17} "
+        f"{'overdue 1st ms':>15} {'overdue next us':>16}"
+    )
+    for size in args.tasks:
+        started = time.perf_counter()
+        storage = fill(size, args.per_project)
+        fill_seconds = time.perf_counter() - started
+
+        rng = random.Random(size)
+        victims = rng.sample(sorted(storage._tasks), args.deletes)
+        scan = statistics.median(
+            per_call_us(lambda: scan_for_owner(storage, task_id), 1)
+            for task_id in victims[:100]
+        )
+        start = time.perf_counter()
+        for task_id in victims:
+            storage.delete_task(task_id)
+        delete = (time.perf_counter() - start) / len(victims) * 1e6
+
+        project_id = next(iter(storage._projects))
+        projects = per_call_us(storage.get_all_projects, 5)
+        project_tasks = per_call_us(
+            lambda: storage.get_project_tasks(project_id), 50
+        )
+        start = time.perf_counter()
+        storage.get_overdue_tasks()
+        overdue_first = (time.perf_counter() - start) * 1000
+        overdue_next = per_call_us(storage.get_overdue_tasks, 20)
+
+        print(
+            f"{size:>9} {fill_seconds:>7.1f} {delete:>10.2f} {scan:>10.2f} "
+            f"{projects:>12.1f} {project_tasks:>17.1f} "
+            f"{overdue_first:>15.2f} {overdue_next:>16.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
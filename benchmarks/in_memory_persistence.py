@@ -0,0 +1,160 @@
+"""
+Startup and write-path benchmarks for PersistentInMemoryStorage.
+
+A data directory with --tasks tasks is seeded and checkpointed, then the
+script reports:
+
+* the snapshot: write time and size on disk;
+* startup: opening the directory (memory-mapped snapshot, trusted
+  `from_row()` of every entity, index rebuild), and the same with a log
+  tail of --tail operations to replay;
+* the cost of the trusted paths: building the task entities from their
+  compact rows with `Task.from_row()`, from ISO strings with
+  `Task.restore()`, and with the validating `Task(...)` constructor;
+* log appends per second for the given fsync batch sizes (group commit).
+
+    poetry run python benchmarks/in_memory_persistence.py --tasks 1000000
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from datetime import date, timedelta
+
+# The storage reads its limits at import time.
+os.environ["MAX_NUMBER_OF_TASKS"] = str(10**9)
+os.environ["MAX_NUMBER_OF_PROJECTS"] = str(10**9)
+
+from todo_list.core.entities import Project, Task  # noqa: E402
+from todo_list.in_memory.storage.persistent_storage import (  # noqa: E402
+    SNAPSHOT_FILE,
+    PersistentInMemoryStorage,
+)
+
+
+def seed(data_dir: str, tasks: int, per_project: int) -> None:
+    # Seeded through the trusted path so large sizes stay quick to set up;
+    # the benchmark is about what happens after the checkpoint.
+    storage = PersistentInMemoryStorage(data_dir)
+    today = date.today()
+    project_id = 0
+    for i in range(tasks):
+        if i % per_project == 0:
+            project_id += 1
+            storage._insert_project(
+                Project.restore(
+                    project_id, f"project {project_id}", "bench", "2024-01-01T00:00:00", 1
+                )
+            )
+        deadline = (
+            (today + timedelta(days=i % 90 - 7)).isoformat() if i % 3 else None
+        )
+        storage._insert_task(
+            Task.restore(
+                i + 1,
+                f"task {i}",
+                f"description of task {i}",
+                ("todo", "doing", "done")[i % 3],
+                deadline,
+                "2024-01-01T00:00:00",
+                project_id,
+                None,
+            )
+        )
+    storage._project_counter = project_id
+    storage._task_counter = tasks
+    storage.checkpoint()
+    storage.close()
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--per-project", type=int, default=1000)
+    parser.add_argument("--tail", type=int, default=100_000)
+    parser.add_argument("--appends", type=int, default=20_000)
+    parser.add_argument(
+        "--fsync-batch", type=int, nargs="+", default=[1, 64, 1024]
+    )
+    args = parser.parse_args()
+
+    data_dir = tempfile.mkdtemp(prefix="todo-storage-")
+    try:
+        _, seconds = timed(lambda: seed(data_dir, args.tasks, args.per_project))
+        size = os.path.getsize(os.path.join(data_dir, SNAPSHOT_FILE))
+        print(f"tasks                      {args.tasks:>12,}")
+        print(f"seed + snapshot write      {seconds:>11.2f}s")
+        print(
+            f"snapshot size              {size / 2**20:>10.1f}MB "
+            f"({size / args.tasks:.0f} bytes/task)"
+        )
+
+        storage, seconds = timed(lambda: PersistentInMemoryStorage(data_dir))
+        print(f"startup, snapshot only     {seconds:>11.2f}s")
+
+        compact = [t.to_row() for t in storage._tasks.values()]
+        rows = [
+            (t.id, t.title, t.description, t.status, t.deadline,
+             t.created_at, t.project_id, t.closed_at)
+            for t in storage._tasks.values()
+        ]
+        _, from_rows = timed(lambda: [Task.from_row(row) for row in compact])
+        _, trusted = timed(lambda: [Task.restore(*row) for row in rows])
+        _, validated = timed(
+            lambda: [
+                Task(
+                    id=r[0], title=r[1], description=r[2], status=r[3],
+                    deadline=r[4], created_at=r[5], project_id=r[6],
+                )
+                for r in rows
+            ]
+        )
+        rows = compact = None
+        print(f"  entities via from_row()  {from_rows:>11.2f}s")
+        print(f"  entities via restore()   {trusted:>11.2f}s")
+        print(f"  entities via Task(...)   {validated:>11.2f}s")
+
+        storage._snapshot_every = 10**12
+        project_ids = [p.id for p in storage.get_all_projects()]
+        for i in range(args.tail):
+            storage.create_task(
+                project_ids[i % len(project_ids)], f"tail {i}", "replayed"
+            )
+        storage.close()
+        storage, seconds = timed(lambda: PersistentInMemoryStorage(data_dir))
+        print(
+            f"startup + {args.tail:,} log records "
+            f"{seconds:>8.2f}s"
+        )
+        storage.close()
+        del storage
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    print()
+    print(f"{'fsync batch':>12} {'appends/s':>12}")
+    for batch in args.fsync_batch:
+        data_dir = tempfile.mkdtemp(prefix="todo-storage-")
+        try:
+            storage = PersistentInMemoryStorage(data_dir, fsync_batch=batch)
+            project = storage.create_project("appends", "bench")
+            start = time.perf_counter()
+            for i in range(args.appends):
+                storage.create_task(project.id, f"append {i}", "bench")
+            storage.sync()
+            seconds = time.perf_counter() - start
+            storage.close()
+            print(f"{batch:>12} {args.appends / seconds:>12,.0f}")
+        finally:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Show query plans and timings for the hot task queries before and after
+the indexes added in revisions c41d8f0e6a27 and a3f1c9d27b54.
+
+The benchmark works in a throw-away schema of the configured PostgreSQL
+database, so it never touches the application tables:
+
+    poetry run python benchmarks/index_plans.py --projects 200 --tasks 1000
+"""
+import argparse
+import statistics
+import time
+from datetime import date, datetime
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from todo_list.db.base import Base
+from todo_list.db.session import engine
+from todo_list.models import project, task  # noqa: F401
+
+SCHEMA = "bench_index_plans"
+
+INDEXES = [
+    "ix_tasks_project_id_created_at_id",
+    "ix_tasks_open_deadline",
+    "ix_projects_created_at_id",
+    "ix_tasks_project_id_status_deadline",
+]
+
+QUERIES = {
+    "list_page_by_project": (
+        "SELECT * FROM tasks WHERE project_id = :project_id "
+        "ORDER BY created_at, id LIMIT 101"
+    ),
+    "close_overdue candidates": (
+        "SELECT id FROM tasks WHERE deadline IS NOT NULL "
+        "AND deadline < :today AND status <> 'done' "
+        "ORDER BY id LIMIT 1000"
+    ),
+    "get_overdue_tasks": (
+        "SELECT * FROM tasks WHERE deadline IS NOT NULL "
+        "AND deadline < :today AND status <> 'done' ORDER BY deadline"
+    ),
+    "project summaries": (
+        "SELECT p.id, t.status, count(t.project_id), "
+        "count(t.project_id) FILTER (WHERE t.deadline < :today "
+        "AND t.status <> 'done') "
+        "FROM projects AS p LEFT OUTER JOIN tasks AS t ON t.project_id = p.id "
+        "GROUP BY p.id, t.status ORDER BY p.id"
+    ),
+    "delete project (cascade)": (
+        "DELETE FROM projects WHERE id = :project_id"
+    ),
+}
+
+
+def seed(conn: Connection, projects: int, tasks_per_project: int) -> None:
+    conn.execute(
+        text(
+            "INSERT INTO projects (name, description, created_at, task_count) "
+            "SELECT 'project-' || g, 'seeded', now() - g * interval '1 minute', "
+            ":tasks FROM generate_series(1, :projects) AS g"
+        ),
+        {"projects": projects, "tasks": tasks_per_project},
+    )
+    # Roughly 2% of tasks are open and past their deadline, the rest are
+    # done or due in the future, which mirrors a healthy production table.
+    conn.execute(
+        text(
+            "INSERT INTO tasks (title, description, status, deadline, "
+            "created_at, project_id) "
+            "SELECT 'task-' || t, 'seeded', "
+            "CASE WHEN t % 50 = 0 THEN 'todo' "
+            "WHEN t % 3 = 0 THEN 'doing' ELSE 'done' END, "
+            "CASE WHEN t % 50 = 0 THEN current_date - 7 "
+            "ELSE current_date + (t % 30) END, "
+            "now() - t * interval '1 second', p.id "
+            "FROM projects AS p, generate_series(1, :tasks) AS t"
+        ),
+        {"tasks": tasks_per_project},
+    )
+    conn.execute(text("ANALYZE projects"))
+    conn.execute(text("ANALYZE tasks"))
+
+
+def vacuum_analyze(conn: Connection) -> None:
+    # VACUUM sets the visibility map that index-only scans rely on (a real
+    # table gets it from autovacuum). It cannot run inside a transaction,
+    # so the seeded data is committed first.
+    conn.commit()
+    with engine.connect().execution_options(
+        isolation_level="AUTOCOMMIT"
+    ) as vacuum_conn:
+        for table in ("tasks", "projects"):
+            vacuum_conn.execute(text(f"VACUUM ANALYZE {SCHEMA}.{table}"))
+
+
+def measure(
+    conn: Connection,
+    params: dict,
+    repeat: int,
+) -> dict[str, tuple[str, float]]:
+    results = {}
+    for name, sql in QUERIES.items():
+        timings = []
+        plan = ""
+        for attempt in range(repeat + 1):
+            # Each statement runs in a savepoint that is rolled back, so the
+            # DELETE can be measured repeatedly on the same data.
+            savepoint = conn.begin_nested()
+            try:
+                if attempt == 0:
+                    rows = conn.execute(
+                        text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"), params
+                    ).scalars().all()
+                    plan = "\n".join(rows)
+                    continue
+                start = time.perf_counter()
+                conn.execute(text(sql), params)
+                timings.append((time.perf_counter() - start) * 1000)
+            finally:
+                savepoint.rollback()
+        results[name] = (plan, statistics.median(timings))
+    return results
+
+
+def report(title: str, results: dict[str, tuple[str, float]]) -> None:
+    print("=" * 72)
+    print(title)
+    print("=" * 72)
+    for name, (plan, median_ms) in results.items():
+        print(f"\n--- {name}: median {median_ms:.2f} ms")
+        print(plan)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--tasks", type=int, default=1000,
+                        help="tasks per project")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    params = {"project_id": args.projects // 2, "today": date.today()}
+
+    with engine.connect() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        conn.execute(text(f"SET search_path TO {SCHEMA}"))
+        try:
+            Base.metadata.create_all(conn)
+            for index in INDEXES:
+                conn.execute(text(f"DROP INDEX {index}"))
+
+            started = datetime.now()
+            seed(conn, args.projects, args.tasks)
+            print(
+                f"Seeded {args.projects * args.tasks} tasks in "
+                f"{(datetime.now() - started).total_seconds():.1f}s"
+            )
+            vacuum_analyze(conn)
+            before = measure(conn, params, args.repeat)
+
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    if index.name in INDEXES:
+                        index.create(conn)
+            vacuum_analyze(conn)
+            after = measure(conn, params, args.repeat)
+        finally:
+            conn.rollback()
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            conn.commit()
+
+    report("Before (no secondary indexes)", before)
+    report("After (revisions c41d8f0e6a27 and a3f1c9d27b54)", after)
+
+    print("\nSummary (median ms)")
+    for name in QUERIES:
+        print(
+            f"  {name:<28} {before[name][1]:>10.2f} -> {after[name][1]:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
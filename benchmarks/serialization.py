@@ -0,0 +1,101 @@
+"""
+Compare the default FastAPI serialization of a task list page with the
+PydanticJSONResponse fast path used by the list endpoints.
+
+The default path mirrors what FastAPI does for a `response_model` route:
+validate every ORM row into a model, validate the returned value again
+against the response model, dump it to Python objects and encode them
+with the stdlib json module. The fast path validates the page once and
+encodes it with pydantic-core. No database is needed; rows are plain
+attribute objects shaped like `Task`:
+
+    poetry run python benchmarks/serialization.py --rows 1000 10000 100000
+"""
+import argparse
+import json
+import statistics
+import time
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from typing import Callable
+
+from pydantic import TypeAdapter
+
+from todo_list.api.controller_schemas.responses import (
+    TaskPageResponse,
+    TaskResponse,
+)
+from todo_list.api.responses import PydanticJSONResponse
+from todo_list.repositories.pagination import Page
+
+task_list_adapter = TypeAdapter(list[TaskResponse])
+
+
+def fake_tasks(count: int) -> list[SimpleNamespace]:
+    now = datetime(2025, 1, 1, 12, 0, 0)
+    return [
+        SimpleNamespace(
+            id=i,
+            title=f"task {i}",
+            description="a reasonably sized task description " * 2,
+            status=("todo", "doing", "done")[i % 3],
+            deadline=date(2025, 1, 1) + timedelta(days=i % 90),
+            created_at=now + timedelta(seconds=i),
+            closed_at=now if i % 3 == 2 else None,
+            project_id=1 + i % 10,
+        )
+        for i in range(count)
+    ]
+
+
+def default_path(page: Page) -> bytes:
+    items = [TaskResponse.model_validate(t) for t in page.items]
+    items = task_list_adapter.validate_python(items)
+    content = {
+        "items": task_list_adapter.dump_python(items, mode="json"),
+        "next_cursor": page.next_cursor,
+    }
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def fast_path(page: Page) -> bytes:
+    return PydanticJSONResponse(TaskPageResponse.model_validate(page)).body
+
+
+def measure(fn: Callable[[Page], bytes], page: Page, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(page)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'default rows/s':>16} {'fast rows/s':>14} {'speedup':>8}")
+    for count in args.rows:
+        page = Page(items=fake_tasks(count), next_cursor="cursor")
+        assert json.loads(default_path(page)) == json.loads(fast_path(page))
+        default = measure(default_path, page, args.repeat)
+        fast = measure(fast_path, page, args.repeat)
+        print(
+            f"{count:>8} {count / default:>16,.0f} {count / fast:>14,.0f} "
+            f"{default / fast:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
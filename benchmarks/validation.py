@@ -0,0 +1,214 @@
+"""
+CPU time per request of task input validation.
+
+Each request body is parsed from JSON by its request schema and handed to
+TaskService over the in-memory storage, as the task endpoints do (without
+the HTTP layer). The single-pass pipeline (the schema runs the task rules
+and the service takes the typed `TaskFields` / `TaskChanges`) is compared
+with the one it replaced, reproduced below: a schema that only checked
+JSON types, then the service's checks (strptime and fromisoformat for the
+deadline), then the same checks again in the entity constructor.
+
+The same body is sent every time, so the numbers are the per-request cost
+with warm caches; the first rows isolate the validation itself.
+
+    poetry run python benchmarks/validation.py --requests 100000
+"""
+import argparse
+import os
+import time
+from datetime import date, datetime
+from typing import Callable, Optional
+
+from pydantic import BaseModel
+
+# The storage reads its limits at import time.
+os.environ["MAX_NUMBER_OF_TASKS"] = str(10**9)
+os.environ["MAX_NUMBER_OF_PROJECTS"] = str(10**9)
+
+from todo_list.api.controller_schemas.requests import (  # noqa: E402
+    TaskCreateRequest,
+    TaskUpdateRequest,
+)
+from todo_list.core.exceptions import ValidationError  # noqa: E402
+from todo_list.core.task_fields import TaskChanges, TaskFields  # noqa: E402
+from todo_list.core.validators import Validator  # noqa: E402
+from todo_list.in_memory.repositories import (  # noqa: E402
+    InMemoryProjectRepository,
+    InMemoryTaskRepository,
+)
+from todo_list.in_memory.storage.in_memory_storage import (  # noqa: E402
+    InMemoryStorage,
+)
+from todo_list.services.task_service import TaskService  # noqa: E402
+
+CREATE_BODY = (
+    b'{"title": "Write report", "description": "quarterly numbers", '
+    b'"status": "doing", "deadline": "2026-11-30"}'
+)
+UPDATE_BODY = b'{"title": "Write report v2", "deadline": "2026-12-01"}'
+
+
+class LegacyCreateRequest(BaseModel):
+    title: str
+    description: str
+    status: str | None = "todo"
+    deadline: str | None = None
+
+
+class LegacyUpdateRequest(BaseModel):
+    title: str | None = None
+    description: str | None = None
+    status: str | None = None
+    deadline: str | None = None
+
+
+def legacy_deadline(deadline: Optional[str]) -> None:
+    if deadline is None:
+        return
+    try:
+        datetime.strptime(deadline, "%Y-%m-%d")
+    except ValueError:
+        raise ValidationError("Deadline must be in format YYYY-MM-DD")
+
+
+def legacy_checks(
+    title: Optional[str],
+    description: Optional[str],
+    status: Optional[str],
+    deadline: Optional[str],
+) -> Optional[date]:
+    # What the service and then the entity checked for every task; the
+    # rest of the legacy request runs the current service and storage.
+    if title is not None:
+        Validator.validate_text(title, "Task title", 30)
+    if description is not None:
+        Validator.validate_text(description, "Task description", 150)
+    if status is not None:
+        Validator.validate_status(status)
+    legacy_deadline(deadline)
+    parsed = date.fromisoformat(deadline) if deadline is not None else None
+
+    if title is not None:
+        Validator.validate_text(title, "task", 30)
+    if description is not None:
+        Validator.validate_text(description, "dicripition", 150, True)
+    if status is not None:
+        Validator.validate_status(status)
+    legacy_deadline(deadline)
+    return parsed
+
+
+def per_request(count: int, fn: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=100_000)
+    args = parser.parse_args()
+    count = args.requests
+
+    storage = InMemoryStorage()
+    projects = InMemoryProjectRepository(storage)
+    service = TaskService(
+        InMemoryTaskRepository(storage),
+        projects,
+        max_tasks_per_project=10**9,
+    )
+    project_id = projects.create("bench", "validation").id
+    task_id = service.create_task(project_id, "seed", "seed").id
+
+    def legacy_validate_create() -> None:
+        request = LegacyCreateRequest.model_validate_json(CREATE_BODY)
+        legacy_checks(
+            request.title,
+            request.description,
+            request.status or "todo",
+            request.deadline,
+        )
+
+    def legacy_validate_update() -> None:
+        request = LegacyUpdateRequest.model_validate_json(UPDATE_BODY)
+        legacy_checks(
+            request.title, request.description, request.status, request.deadline
+        )
+
+    def legacy_create() -> None:
+        request = LegacyCreateRequest.model_validate_json(CREATE_BODY)
+        deadline = legacy_checks(
+            request.title,
+            request.description,
+            request.status or "todo",
+            request.deadline,
+        )
+        service.create_validated_task(
+            project_id,
+            TaskFields(
+                request.title,
+                request.description,
+                request.status or "todo",
+                deadline,
+            ),
+        )
+
+    def legacy_update() -> None:
+        request = LegacyUpdateRequest.model_validate_json(UPDATE_BODY)
+        deadline = legacy_checks(
+            request.title, request.description, request.status, request.deadline
+        )
+        service.update_validated_task(
+            task_id,
+            TaskChanges(
+                request.title, request.description, request.status, deadline
+            ),
+        )
+
+    def single_pass_create() -> None:
+        request = TaskCreateRequest.model_validate_json(CREATE_BODY)
+        service.create_validated_task(project_id, request.to_fields())
+
+    def single_pass_update() -> None:
+        request = TaskUpdateRequest.model_validate_json(UPDATE_BODY)
+        service.update_validated_task(task_id, request.to_changes())
+
+    def cli_create() -> None:
+        service.create_task(
+            project_id,
+            "Write report",
+            "quarterly numbers",
+            status="doing",
+            deadline="2026-11-30",
+        )
+
+    rows = [
+        (
+            "validate create",
+            legacy_validate_create,
+            lambda: TaskCreateRequest.model_validate_json(CREATE_BODY),
+        ),
+        (
+            "validate update",
+            legacy_validate_update,
+            lambda: TaskUpdateRequest.model_validate_json(UPDATE_BODY),
+        ),
+        ("create request", legacy_create, single_pass_create),
+        ("update request", legacy_update, single_pass_update),
+    ]
+    print(f"{'us per request':<18} {'legacy':>8} {'single':>8} {'saved':>6}")
+    for name, legacy, single in rows:
+        legacy_us = per_request(count, legacy)
+        single_us = per_request(count, single)
+        print(
+            f"{name:<18} {legacy_us:>8.2f} {single_us:>8.2f} "
+            f"{1 - single_us / legacy_us:>6.0%}"
+        )
+    cli_us = per_request(count, cli_create)
+    print(f"{'create_task (CLI)':<18} {'':>8} {cli_us:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
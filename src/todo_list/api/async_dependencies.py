@@ -0,0 +1,33 @@
+from collections.abc import AsyncGenerator
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db.async_session import AsyncSessionLocal
+from .dependencies import get_deadline_observer
+from ..services.async_project_service import AsyncProjectService
+from ..services.async_task_service import AsyncTaskService
+
+
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    # Same unit-of-work contract as the sync stack: one commit at the end
+    # of the request, rollback if the endpoint raised.
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception:
+            await db.rollback()
+            raise
+        await db.commit()
+
+
+async def get_async_project_service(
+    db: AsyncSession = Depends(get_async_db_session),
+) -> AsyncProjectService:
+    return AsyncProjectService(db)
+
+
+async def get_async_task_service(
+    db: AsyncSession = Depends(get_async_db_session),
+) -> AsyncTaskService:
+    return AsyncTaskService(db, deadline_observer=get_deadline_observer())
@@ -1,14 +1,18 @@
 from .project import ProjectCreateRequest, ProjectUpdateRequest
 from .task import (
     TaskCreateRequest,
+    TaskBatchCreateRequest,
     TaskUpdateRequest,
     TaskStatusChangeRequest,
+    TaskBulkStatusChangeRequest,
 )
 
 __all__ = [
     "ProjectCreateRequest",
     "ProjectUpdateRequest",
     "TaskCreateRequest",
+    "TaskBatchCreateRequest",
     "TaskUpdateRequest",
     "TaskStatusChangeRequest",
+    "TaskBulkStatusChangeRequest",
 ]
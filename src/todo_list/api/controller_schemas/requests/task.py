@@ -1,40 +1,139 @@
-from pydantic import BaseModel, Field
+from typing import Annotated, Any
+
+from pydantic import AfterValidator, BaseModel, Field, field_validator
+from pydantic import ValidationError as SchemaValidationError
+
+from ....core.exceptions import ValidationError
+from ....core.task_fields import (
+    TaskChanges,
+    TaskFields,
+    validate_description,
+    validate_title,
+)
+from ....core.validators import Validator
+
+# The task rules run here, once per request, with the validators the
+# services use. They raise the domain ValidationError, which Pydantic lets
+# through, so a bad value still gets a 400 with the services' message; a
+# value of the wrong JSON type is still a 422. The deadline is parsed to a
+# date (the OpenAPI schema keeps the string).
+TaskTitle = Annotated[str, AfterValidator(validate_title)]
+TaskDescription = Annotated[str, AfterValidator(validate_description)]
+TaskStatus = Annotated[str, AfterValidator(Validator.validate_status)]
+TaskDeadline = Annotated[str, AfterValidator(Validator.parse_deadline)]
 
 
 class TaskCreateRequest(BaseModel):
-    title: str = Field(..., description="Task title")
-    description: str = Field(..., description="Task description")
-    status: str | None = Field(
+    title: TaskTitle = Field(..., description="Task title")
+    description: TaskDescription = Field(..., description="Task description")
+    status: TaskStatus | None = Field(
         default="todo",
         description="Task status (todo / doing / done)",
     )
-    deadline: str | None = Field(
+    deadline: TaskDeadline | None = Field(
         default=None,
         description="Deadline in YYYY-MM-DD format (optional)",
     )
 
+    def to_fields(self) -> TaskFields:
+        return TaskFields(
+            title=self.title,
+            description=self.description,
+            status=self.status or "todo",
+            deadline=self.deadline,
+        )
+
+
+MAX_TASK_BATCH_SIZE = 1000
+
+
+class TaskBatchCreateRequest(BaseModel):
+    tasks: list[TaskCreateRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_TASK_BATCH_SIZE,
+        description="Tasks to create; the batch is applied all-or-nothing",
+    )
+
+    @field_validator("tasks", mode="before")
+    @classmethod
+    def _validate_items(cls, items: Any) -> Any:
+        # Items one by one, so that a rule violation names its item and all
+        # of them are reported, as TaskService.create_tasks does.
+        if not isinstance(items, list) or len(items) > MAX_TASK_BATCH_SIZE:
+            return items
+        validated: list[Any] = []
+        errors: list[str] = []
+        for index, item in enumerate(items):
+            try:
+                validated.append(TaskCreateRequest.model_validate(item))
+            except ValidationError as exc:
+                errors.append(f"item {index}: {exc}")
+            except SchemaValidationError:
+                # Left for the list validation to report with its location.
+                validated.append(item)
+        if errors:
+            raise ValidationError("; ".join(errors))
+        return validated
+
 
 class TaskUpdateRequest(BaseModel):
-    title: str | None = Field(
+    title: TaskTitle | None = Field(
         default=None,
         description="New title (optional)",
     )
-    description: str | None = Field(
+    description: TaskDescription | None = Field(
         default=None,
         description="New description (optional)",
     )
-    status: str | None = Field(
+    status: TaskStatus | None = Field(
         default=None,
         description="New status (todo / doing / done) (optional)",
     )
-    deadline: str | None = Field(
+    deadline: TaskDeadline | None = Field(
         default=None,
         description="New deadline in YYYY-MM-DD (optional)",
     )
 
+    def to_changes(self) -> TaskChanges:
+        return TaskChanges(
+            title=self.title,
+            description=self.description,
+            status=self.status,
+            deadline=self.deadline,
+        )
+
 
 class TaskStatusChangeRequest(BaseModel):
     status: str = Field(
         ...,
         description="New status (todo / doing / done)",
     )
+
+
+class TaskBulkStatusChangeRequest(BaseModel):
+    status: str = Field(
+        ...,
+        description="New status (todo / doing / done)",
+    )
+    ids: list[int] | None = Field(
+        default=None,
+        max_length=10000,
+        description="Task ids to update (optional if a filter is given)",
+    )
+    project_id: int | None = Field(
+        default=None,
+        description="Only tasks of this project (optional)",
+    )
+    current_status: str | None = Field(
+        default=None,
+        description="Only tasks currently in this status (optional)",
+    )
+    deadline_from: str | None = Field(
+        default=None,
+        description="Only tasks with deadline on or after YYYY-MM-DD (optional)",
+    )
+    deadline_to: str | None = Field(
+        default=None,
+        description="Only tasks with deadline on or before YYYY-MM-DD (optional)",
+    )
@@ -1,7 +1,27 @@
-from .project import ProjectResponse
-from .task import TaskResponse
+from .project import (
+    ProjectResponse,
+    ProjectPageResponse,
+    ProjectSummaryResponse,
+    ProjectSummaryListResponse,
+)
+from .task import (
+    TaskResponse,
+    TaskPageResponse,
+    TaskListResponse,
+    TaskBulkStatusChangeResponse,
+    TaskImportRejectResponse,
+    TaskImportResponse,
+)
 
 __all__ = [
     "ProjectResponse",
+    "ProjectPageResponse",
+    "ProjectSummaryResponse",
+    "ProjectSummaryListResponse",
     "TaskResponse",
+    "TaskPageResponse",
+    "TaskListResponse",
+    "TaskBulkStatusChangeResponse",
+    "TaskImportRejectResponse",
+    "TaskImportResponse",
 ]
@@ -1,6 +1,7 @@
 from datetime import datetime
+from typing import Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, RootModel
 
 
 class ProjectResponse(BaseModel):
@@ -8,5 +9,28 @@ class ProjectResponse(BaseModel):
     name: str
     description: str
     created_at: datetime
+    task_count: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ProjectPageResponse(BaseModel):
+    items: list[ProjectResponse]
+    next_cursor: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ProjectSummaryResponse(BaseModel):
+    project_id: int
+    todo: int
+    doing: int
+    done: int
+    total: int
+    overdue: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ProjectSummaryListResponse(RootModel[list[ProjectSummaryResponse]]):
+    model_config = ConfigDict(from_attributes=True)
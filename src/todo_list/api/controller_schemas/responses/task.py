@@ -1,7 +1,7 @@
 from datetime import datetime, date
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, RootModel
 
 
 class TaskResponse(BaseModel):
@@ -15,3 +15,35 @@ class TaskResponse(BaseModel):
     project_id: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class TaskListResponse(RootModel[list[TaskResponse]]):
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TaskPageResponse(BaseModel):
+    items: list[TaskResponse]
+    next_cursor: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TaskBulkStatusChangeResponse(BaseModel):
+    updated: int
+    ids: list[int]
+
+
+class TaskImportRejectResponse(BaseModel):
+    line: int
+    error: str
+    raw: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TaskImportResponse(BaseModel):
+    imported: int
+    rejected: int
+    seconds: float
+    rows_per_second: float
+    rejects: list[TaskImportRejectResponse]
@@ -0,0 +1,165 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Header, Request, Response, status
+
+from ..controller_schemas.requests import (
+    ProjectCreateRequest,
+    ProjectUpdateRequest,
+)
+from ..controller_schemas.responses import (
+    ProjectResponse,
+    ProjectPageResponse,
+    ProjectSummaryResponse,
+    ProjectSummaryListResponse,
+)
+from ..etag import (
+    etag_matches,
+    not_modified,
+    project_etag,
+    project_list_etag,
+    project_summaries_etag,
+    project_summary_etag,
+)
+from ..query_params import PageQuery
+from ..responses import PydanticJSONResponse
+from ..async_dependencies import get_async_project_service
+from ...services.async_project_service import AsyncProjectService
+
+router = APIRouter(prefix="/projects", tags=["projects"])
+
+
+@router.post(
+    "",
+    response_model=ProjectResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_project(
+    payload: ProjectCreateRequest,
+    project_service: AsyncProjectService = Depends(get_async_project_service),
+) -> ProjectResponse:
+    project = await project_service.create_project(
+        name=payload.name,
+        description=payload.description,
+    )
+    return ProjectResponse.model_validate(project)
+
+
+@router.get(
+    "",
+    response_model=ProjectPageResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def list_projects(
+    request: Request,
+    query: PageQuery = Depends(),
+    if_none_match: str | None = Header(default=None),
+    project_service: AsyncProjectService = Depends(get_async_project_service),
+) -> ProjectPageResponse | Response:
+    fingerprint = await project_service.get_projects_fingerprint()
+    etag = project_list_etag(request, fingerprint)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    page = await project_service.list_projects_page(
+        limit=query.limit, after=query.after
+    )
+    return PydanticJSONResponse(
+        ProjectPageResponse.model_validate(page),
+        headers={"ETag": etag},
+    )
+
+
+# Registered before "/{project_id}" so "summary" is not parsed as an id.
+@router.get(
+    "/summary",
+    response_model=ProjectSummaryListResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def list_project_summaries(
+    if_none_match: str | None = Header(default=None),
+    project_service: AsyncProjectService = Depends(get_async_project_service),
+) -> ProjectSummaryListResponse | Response:
+    today = datetime.utcnow().date()
+    fingerprint = await project_service.get_projects_fingerprint()
+    etag = project_summaries_etag(fingerprint, today)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    summaries = await project_service.list_project_summaries(today=today)
+    return PydanticJSONResponse(
+        ProjectSummaryListResponse.model_validate(summaries),
+        headers={"ETag": etag},
+    )
+
+
+@router.get(
+    "/{project_id}/summary",
+    response_model=ProjectSummaryResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_project_summary(
+    project_id: int,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    project_service: AsyncProjectService = Depends(get_async_project_service),
+) -> ProjectSummaryResponse | Response:
+    today = datetime.utcnow().date()
+    version = await project_service.get_project_version(project_id)
+    etag = project_summary_etag(project_id, version, today)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    summary = await project_service.get_project_summary(project_id, today=today)
+    response.headers["ETag"] = etag
+    return ProjectSummaryResponse.model_validate(summary)
+
+
+@router.get(
+    "/{project_id}",
+    response_model=ProjectResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_project(
+    project_id: int,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    project_service: AsyncProjectService = Depends(get_async_project_service),
+) -> ProjectResponse | Response:
+    version = await project_service.get_project_version(project_id)
+    etag = project_etag(project_id, version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    project = await project_service.get_project(project_id, version=version)
+    response.headers["ETag"] = etag
+    return ProjectResponse.model_validate(project)
+
+
+@router.patch(
+    "/{project_id}",
+    response_model=ProjectResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def update_project(
+    project_id: int,
+    payload: ProjectUpdateRequest,
+    project_service: AsyncProjectService = Depends(get_async_project_service),
+) -> ProjectResponse:
+    project = await project_service.update_project(
+        project_id=project_id,
+        name=payload.name,
+        description=payload.description,
+    )
+    return ProjectResponse.model_validate(project)
+
+
+@router.delete(
+    "/{project_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def delete_project(
+    project_id: int,
+    project_service: AsyncProjectService = Depends(get_async_project_service),
+) -> None:
+    await project_service.delete_project(project_id)
+    return None
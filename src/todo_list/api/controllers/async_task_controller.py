@@ -0,0 +1,240 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
+
+from ..controller_schemas.requests import (
+    TaskCreateRequest,
+    TaskBatchCreateRequest,
+    TaskUpdateRequest,
+    TaskStatusChangeRequest,
+    TaskBulkStatusChangeRequest,
+)
+from ..controller_schemas.responses import (
+    TaskResponse,
+    TaskPageResponse,
+    TaskBulkStatusChangeResponse,
+    TaskListResponse,
+    TaskImportResponse,
+)
+from ..etag import etag_matches, not_modified, task_etag, task_list_etag
+from ..query_params import TaskListQuery, TaskSearchQuery
+from ..responses import NDJSONResponse, PydanticJSONResponse, ndjson_lines
+from ..uploads import RejectCollector, spool_request_body
+from ..async_dependencies import get_async_task_service
+from ...db.async_session import AsyncSessionLocal
+from ...services.task_import import read_records
+from ...services.async_task_service import AsyncTaskService
+
+router = APIRouter(prefix="/tasks", tags=["tasks"])
+
+
+@router.post(
+    "/projects/{project_id}",
+    response_model=TaskResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_task_for_project(
+    project_id: int,
+    payload: TaskCreateRequest,
+    task_service: AsyncTaskService = Depends(get_async_task_service),
+) -> TaskResponse:
+    task = await task_service.create_validated_task(
+        project_id, payload.to_fields()
+    )
+    return TaskResponse.model_validate(task)
+
+
+@router.post(
+    "/projects/{project_id}/batch",
+    response_model=TaskListResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_tasks_for_project(
+    project_id: int,
+    payload: TaskBatchCreateRequest,
+    task_service: AsyncTaskService = Depends(get_async_task_service),
+) -> TaskListResponse | Response:
+    tasks = await task_service.create_tasks(
+        project_id=project_id,
+        tasks=[item.to_fields() for item in payload.tasks],
+    )
+    return PydanticJSONResponse(
+        TaskListResponse.model_validate(tasks),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+@router.get(
+    "/projects/{project_id}",
+    response_model=TaskPageResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def list_tasks_for_project(
+    project_id: int,
+    request: Request,
+    query: TaskListQuery = Depends(),
+    if_none_match: str | None = Header(default=None),
+    task_service: AsyncTaskService = Depends(get_async_task_service),
+) -> TaskPageResponse | Response:
+    now = datetime.utcnow()
+    version = await task_service.get_project_version(project_id)
+    etag = task_list_etag(request, project_id, version, query.overdue, now)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    page = await task_service.list_tasks_page(
+        project_id, **query.arguments(now)
+    )
+    return PydanticJSONResponse(
+        TaskPageResponse.model_validate(page),
+        headers={"ETag": etag},
+    )
+
+
+async def _export_stream(project_id: int) -> AsyncIterator[bytes]:
+    # The request's session is closed by its dependency before a
+    # StreamingResponse sends anything, so the export owns its session.
+    async with AsyncSessionLocal() as db:
+        async for rows in AsyncTaskService(db).export_tasks(project_id):
+            yield ndjson_lines(TaskResponse, rows)
+
+
+@router.post(
+    "/projects/{project_id}/import",
+    response_model=TaskImportResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def import_tasks_for_project(
+    project_id: int,
+    request: Request,
+    fmt: Literal["ndjson", "csv"] = Query(default="ndjson", alias="format"),
+    task_service: AsyncTaskService = Depends(get_async_task_service),
+) -> TaskImportResponse:
+    # The body is the raw NDJSON or CSV document, not a multipart form.
+    with await spool_request_body(request) as body:
+        rejects = RejectCollector()
+        report = await task_service.import_tasks(
+            project_id,
+            read_records(body, fmt),
+            on_reject=rejects,
+        )
+    return rejects.response(report)
+
+
+@router.get(
+    "/projects/{project_id}/export",
+    response_class=NDJSONResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def export_tasks_for_project(
+    project_id: int,
+    task_service: AsyncTaskService = Depends(get_async_task_service),
+) -> NDJSONResponse:
+    # Unknown projects fail with 404 here rather than mid-stream.
+    await task_service.get_project_version(project_id)
+    return NDJSONResponse(_export_stream(project_id))
+
+
+# Registered before "/{task_id}" so "search" is not parsed as an id.
+@router.get(
+    "/search",
+    response_model=TaskPageResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def search_tasks(
+    query: TaskSearchQuery = Depends(),
+    task_service: AsyncTaskService = Depends(get_async_task_service),
+) -> TaskPageResponse | Response:
+    page = await task_service.search_tasks(query.q, **query.arguments())
+    return PydanticJSONResponse(TaskPageResponse.model_validate(page))
+
+
+@router.patch(
+    "/status",
+    response_model=TaskBulkStatusChangeResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def change_task_status_bulk(
+    payload: TaskBulkStatusChangeRequest,
+    task_service: AsyncTaskService = Depends(get_async_task_service),
+) -> TaskBulkStatusChangeResponse:
+    updated_ids = await task_service.change_status_bulk(
+        status=payload.status,
+        ids=payload.ids,
+        project_id=payload.project_id,
+        current_status=payload.current_status,
+        deadline_from=payload.deadline_from,
+        deadline_to=payload.deadline_to,
+    )
+    return TaskBulkStatusChangeResponse(
+        updated=len(updated_ids),
+        ids=updated_ids,
+    )
+
+
+@router.get(
+    "/{task_id}",
+    response_model=TaskResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_task(
+    task_id: int,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    task_service: AsyncTaskService = Depends(get_async_task_service),
+) -> TaskResponse | Response:
+    project_id, version = await task_service.get_task_version(task_id)
+    etag = task_etag(task_id, project_id, version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    task = await task_service.get_task(task_id, version=version)
+    response.headers["ETag"] = etag
+    return TaskResponse.model_validate(task)
+
+
+@router.patch(
+    "/{task_id}",
+    response_model=TaskResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def update_task(
+    task_id: int,
+    payload: TaskUpdateRequest,
+    task_service: AsyncTaskService = Depends(get_async_task_service),
+) -> TaskResponse:
+    task = await task_service.update_validated_task(
+        task_id, payload.to_changes()
+    )
+    return TaskResponse.model_validate(task)
+
+
+@router.patch(
+    "/{task_id}/status",
+    response_model=TaskResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def change_task_status(
+    task_id: int,
+    payload: TaskStatusChangeRequest,
+    task_service: AsyncTaskService = Depends(get_async_task_service),
+) -> TaskResponse:
+    task = await task_service.change_status(
+        task_id=task_id,
+        status=payload.status,
+    )
+    return TaskResponse.model_validate(task)
+
+
+@router.delete(
+    "/{task_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def delete_task(
+    task_id: int,
+    task_service: AsyncTaskService = Depends(get_async_task_service),
+) -> None:
+    await task_service.delete_task(task_id)
+    return None
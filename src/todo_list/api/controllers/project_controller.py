@@ -1,14 +1,28 @@
-from typing import List
+from datetime import datetime
 
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, Request, Response, status
 
 from ..controller_schemas.requests import (
     ProjectCreateRequest,
     ProjectUpdateRequest,
 )
-from ..controller_schemas.responses import ProjectResponse
-from ..dependencies import get_db_session, get_project_service
+from ..controller_schemas.responses import (
+    ProjectResponse,
+    ProjectPageResponse,
+    ProjectSummaryResponse,
+    ProjectSummaryListResponse,
+)
+from ..etag import (
+    etag_matches,
+    not_modified,
+    project_etag,
+    project_list_etag,
+    project_summaries_etag,
+    project_summary_etag,
+)
+from ..query_params import PageQuery
+from ..responses import PydanticJSONResponse
+from ..dependencies import get_project_service
 from ...services.project_service import ProjectService
 
 router = APIRouter(prefix="/projects", tags=["projects"])
@@ -32,14 +46,72 @@ def create_project(
 
 @router.get(
     "",
-    response_model=list[ProjectResponse],
+    response_model=ProjectPageResponse,
     status_code=status.HTTP_200_OK,
 )
 def list_projects(
+    request: Request,
+    query: PageQuery = Depends(),
+    if_none_match: str | None = Header(default=None),
     project_service: ProjectService = Depends(get_project_service),
-) -> list[ProjectResponse]:
-    projects = project_service.list_projects()
-    return [ProjectResponse.model_validate(p) for p in projects]
+) -> ProjectPageResponse | Response:
+    fingerprint = project_service.get_projects_fingerprint()
+    etag = project_list_etag(request, fingerprint)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    page = project_service.list_projects_page(
+        limit=query.limit, after=query.after
+    )
+    return PydanticJSONResponse(
+        ProjectPageResponse.model_validate(page),
+        headers={"ETag": etag},
+    )
+
+
+# Registered before "/{project_id}" so "summary" is not parsed as an id.
+@router.get(
+    "/summary",
+    response_model=ProjectSummaryListResponse,
+    status_code=status.HTTP_200_OK,
+)
+def list_project_summaries(
+    if_none_match: str | None = Header(default=None),
+    project_service: ProjectService = Depends(get_project_service),
+) -> ProjectSummaryListResponse | Response:
+    today = datetime.utcnow().date()
+    fingerprint = project_service.get_projects_fingerprint()
+    etag = project_summaries_etag(fingerprint, today)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    summaries = project_service.list_project_summaries(today=today)
+    return PydanticJSONResponse(
+        ProjectSummaryListResponse.model_validate(summaries),
+        headers={"ETag": etag},
+    )
+
+
+@router.get(
+    "/{project_id}/summary",
+    response_model=ProjectSummaryResponse,
+    status_code=status.HTTP_200_OK,
+)
+def get_project_summary(
+    project_id: int,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    project_service: ProjectService = Depends(get_project_service),
+) -> ProjectSummaryResponse | Response:
+    today = datetime.utcnow().date()
+    version = project_service.get_project_version(project_id)
+    etag = project_summary_etag(project_id, version, today)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    summary = project_service.get_project_summary(project_id, today=today)
+    response.headers["ETag"] = etag
+    return ProjectSummaryResponse.model_validate(summary)
 
 
 @router.get(
@@ -49,9 +121,17 @@ def list_projects(
 )
 def get_project(
     project_id: int,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
     project_service: ProjectService = Depends(get_project_service),
-) -> ProjectResponse:
-    project = project_service.get_project(project_id)
+) -> ProjectResponse | Response:
+    version = project_service.get_project_version(project_id)
+    etag = project_etag(project_id, version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    project = project_service.get_project(project_id, version=version)
+    response.headers["ETag"] = etag
     return ProjectResponse.model_validate(project)
 
 
@@ -1,14 +1,30 @@
-from typing import List
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Literal
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 
 from ..controller_schemas.requests import (
     TaskCreateRequest,
+    TaskBatchCreateRequest,
     TaskUpdateRequest,
     TaskStatusChangeRequest,
+    TaskBulkStatusChangeRequest,
 )
-from ..controller_schemas.responses import TaskResponse
-from ..dependencies import get_db_session, get_task_service
+from ..controller_schemas.responses import (
+    TaskResponse,
+    TaskPageResponse,
+    TaskBulkStatusChangeResponse,
+    TaskListResponse,
+    TaskImportResponse,
+)
+from ..etag import etag_matches, not_modified, task_etag, task_list_etag
+from ..query_params import TaskListQuery, TaskSearchQuery
+from ..responses import NDJSONResponse, PydanticJSONResponse, ndjson_lines
+from ..uploads import RejectCollector, spool_request_body
+from ..dependencies import get_task_service, task_service_scope
+from ...services.task_import import read_records
 from ...services.task_service import TaskService
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
@@ -24,27 +40,141 @@ def create_task_for_project(
     payload: TaskCreateRequest,
     task_service: TaskService = Depends(get_task_service),
 ) -> TaskResponse:
-    task = task_service.create_task(
-        project_id=project_id,
-        title=payload.title,
-        description=payload.description,
-        status=payload.status or "todo",
-        deadline=payload.deadline,
+    task = task_service.create_validated_task(
+        project_id, payload.to_fields()
     )
     return TaskResponse.model_validate(task)
 
 
+@router.post(
+    "/projects/{project_id}/batch",
+    response_model=TaskListResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+def create_tasks_for_project(
+    project_id: int,
+    payload: TaskBatchCreateRequest,
+    task_service: TaskService = Depends(get_task_service),
+) -> TaskListResponse | Response:
+    tasks = task_service.create_tasks(
+        project_id=project_id,
+        tasks=[item.to_fields() for item in payload.tasks],
+    )
+    return PydanticJSONResponse(
+        TaskListResponse.model_validate(tasks),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
 @router.get(
     "/projects/{project_id}",
-    response_model=List[TaskResponse],
+    response_model=TaskPageResponse,
     status_code=status.HTTP_200_OK,
 )
 def list_tasks_for_project(
+    project_id: int,
+    request: Request,
+    query: TaskListQuery = Depends(),
+    if_none_match: str | None = Header(default=None),
+    task_service: TaskService = Depends(get_task_service),
+) -> TaskPageResponse | Response:
+    now = datetime.utcnow()
+    version = task_service.get_project_version(project_id)
+    etag = task_list_etag(request, project_id, version, query.overdue, now)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    page = task_service.list_tasks_page(
+        project_id, **query.arguments(now)
+    )
+    return PydanticJSONResponse(
+        TaskPageResponse.model_validate(page),
+        headers={"ETag": etag},
+    )
+
+
+def _export_stream(project_id: int) -> Iterator[bytes]:
+    # The request's session is closed by its dependency before a
+    # StreamingResponse sends anything, so the export owns its session.
+    with task_service_scope() as task_service:
+        for rows in task_service.export_tasks(project_id):
+            yield ndjson_lines(TaskResponse, rows)
+
+
+@router.post(
+    "/projects/{project_id}/import",
+    response_model=TaskImportResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def import_tasks_for_project(
+    project_id: int,
+    request: Request,
+    fmt: Literal["ndjson", "csv"] = Query(default="ndjson", alias="format"),
+    task_service: TaskService = Depends(get_task_service),
+) -> TaskImportResponse:
+    # The body is the raw NDJSON or CSV document, not a multipart form.
+    # Reading it needs an async endpoint; the import itself is blocking and
+    # runs in the threadpool like every other endpoint of this stack.
+    with await spool_request_body(request) as body:
+        rejects = RejectCollector()
+        report = await run_in_threadpool(
+            task_service.import_tasks,
+            project_id,
+            read_records(body, fmt),
+            on_reject=rejects,
+        )
+    return rejects.response(report)
+
+
+@router.get(
+    "/projects/{project_id}/export",
+    response_class=NDJSONResponse,
+    status_code=status.HTTP_200_OK,
+)
+def export_tasks_for_project(
     project_id: int,
     task_service: TaskService = Depends(get_task_service),
-) -> list[TaskResponse]:
-    tasks = task_service.list_tasks_for_project(project_id)
-    return [TaskResponse.model_validate(t) for t in tasks]
+) -> NDJSONResponse:
+    # Unknown projects fail with 404 here rather than mid-stream.
+    task_service.get_project_version(project_id)
+    return NDJSONResponse(_export_stream(project_id))
+
+
+# Registered before "/{task_id}" so "search" is not parsed as an id.
+@router.get(
+    "/search",
+    response_model=TaskPageResponse,
+    status_code=status.HTTP_200_OK,
+)
+def search_tasks(
+    query: TaskSearchQuery = Depends(),
+    task_service: TaskService = Depends(get_task_service),
+) -> TaskPageResponse | Response:
+    page = task_service.search_tasks(query.q, **query.arguments())
+    return PydanticJSONResponse(TaskPageResponse.model_validate(page))
+
+
+@router.patch(
+    "/status",
+    response_model=TaskBulkStatusChangeResponse,
+    status_code=status.HTTP_200_OK,
+)
+def change_task_status_bulk(
+    payload: TaskBulkStatusChangeRequest,
+    task_service: TaskService = Depends(get_task_service),
+) -> TaskBulkStatusChangeResponse:
+    updated_ids = task_service.change_status_bulk(
+        status=payload.status,
+        ids=payload.ids,
+        project_id=payload.project_id,
+        current_status=payload.current_status,
+        deadline_from=payload.deadline_from,
+        deadline_to=payload.deadline_to,
+    )
+    return TaskBulkStatusChangeResponse(
+        updated=len(updated_ids),
+        ids=updated_ids,
+    )
 
 
 @router.get(
@@ -54,9 +184,17 @@ def list_tasks_for_project(
 )
 def get_task(
     task_id: int,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
     task_service: TaskService = Depends(get_task_service),
-) -> TaskResponse:
-    task = task_service.get_task(task_id)
+) -> TaskResponse | Response:
+    project_id, version = task_service.get_task_version(task_id)
+    etag = task_etag(task_id, project_id, version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    task = task_service.get_task(task_id, version=version)
+    response.headers["ETag"] = etag
     return TaskResponse.model_validate(task)
 
 
@@ -70,12 +208,8 @@ def update_task(
     payload: TaskUpdateRequest,
     task_service: TaskService = Depends(get_task_service),
 ) -> TaskResponse:
-    task = task_service.update_task(
-        task_id=task_id,
-        title=payload.title,
-        description=payload.description,
-        status=payload.status,
-        deadline=payload.deadline,
+    task = task_service.update_validated_task(
+        task_id, payload.to_changes()
     )
     return TaskResponse.model_validate(task)
 
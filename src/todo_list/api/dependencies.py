@@ -1,36 +1,124 @@
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
+from typing import Optional
 
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
+from ..backend import get_default_storage, uses_in_memory_storage
+from ..cache import get_default_cache
 from ..db.session import SessionLocal
+from ..db.unit_of_work import UnitOfWork
+from ..in_memory.repositories import (
+    InMemoryProjectRepository,
+    InMemoryTaskRepository,
+)
 from ..repositories.project_repository import ProjectRepository
 from ..repositories.task_repository import TaskRepository
 from ..services.project_service import ProjectService
-from ..services.task_service import TaskService
+from ..services.task_service import DeadlineObserver, TaskService
 
+# Set while the app runs a deadline scheduler (see api.scheduler).
+_deadline_observer: Optional[DeadlineObserver] = None
 
-def get_db_session() -> Generator[Session, None, None]:
+
+def set_deadline_observer(observer: Optional[DeadlineObserver]) -> None:
+    global _deadline_observer
+    _deadline_observer = observer
+
+
+def get_deadline_observer() -> Optional[DeadlineObserver]:
+    return _deadline_observer
+
+
+def get_unit_of_work() -> Generator[Optional[UnitOfWork], None, None]:
+    if uses_in_memory_storage():
+        # InMemoryStorage applies every change at once; there is no
+        # transaction to own.
+        yield None
+        return
+
+    # One transaction per request: committed after the endpoint (and its
+    # response serialization) finished, rolled back if anything raised.
     db: Session = SessionLocal()
     try:
-        yield db
+        with UnitOfWork(db) as uow:
+            yield uow
     finally:
         db.close()
 
 
+def get_db_session(
+    uow: Optional[UnitOfWork] = Depends(get_unit_of_work),
+) -> Optional[Session]:
+    return uow.session if uow is not None else None
+
+
+def build_project_service(session: Optional[Session]) -> ProjectService:
+    if session is None:
+        return ProjectService(
+            project_repository=InMemoryProjectRepository(get_default_storage())
+        )
+    project_repo = ProjectRepository(session, get_default_cache())
+    return ProjectService(project_repository=project_repo)
+
+
 def get_project_service(
-    db: Session = Depends(get_db_session),
+    session: Optional[Session] = Depends(get_db_session),
 ) -> ProjectService:
-    project_repo = ProjectRepository(db)
-    return ProjectService(project_repository=project_repo)
+    return build_project_service(session)
 
 
-def get_task_service(
-    db: Session = Depends(get_db_session),
+def build_task_service(
+    session: Optional[Session],
+    unit_of_work: Optional[UnitOfWork] = None,
 ) -> TaskService:
-    project_repo = ProjectRepository(db)
-    task_repo = TaskRepository(db)
+    if session is None:
+        storage = get_default_storage()
+        return TaskService(
+            task_repository=InMemoryTaskRepository(storage),
+            project_repository=InMemoryProjectRepository(storage),
+            deadline_observer=_deadline_observer,
+        )
+
+    cache = get_default_cache()
+    project_repo = ProjectRepository(session, cache)
+    task_repo = TaskRepository(session, cache)
     return TaskService(
         task_repository=task_repo,
         project_repository=project_repo,
+        unit_of_work=unit_of_work,
+        deadline_observer=_deadline_observer,
     )
+
+
+def get_task_service(
+    uow: Optional[UnitOfWork] = Depends(get_unit_of_work),
+) -> TaskService:
+    return build_task_service(uow.session if uow is not None else None, uow)
+
+
+@contextmanager
+def task_service_scope() -> Iterator[TaskService]:
+    # For work that outlives the request, such as a streamed response:
+    # a service with a session of its own, or the shared in-memory storage.
+    if uses_in_memory_storage():
+        yield build_task_service(None)
+        return
+    with SessionLocal() as db:
+        yield build_task_service(db)
+
+
+@contextmanager
+def task_service_transaction() -> Iterator[TaskService]:
+    # For background jobs that write: like task_service_scope, with a unit
+    # of work the service commits through.
+    if uses_in_memory_storage():
+        yield build_task_service(None)
+        return
+    db: Session = SessionLocal()
+    try:
+        with UnitOfWork(db) as uow:
+            yield build_task_service(db, uow)
+    finally:
+        db.close()
@@ -0,0 +1,74 @@
+import hashlib
+from datetime import date, datetime
+from typing import Any, Optional, Sequence
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: Any) -> str:
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def query_digest(request: Request) -> str:
+    """Short digest of the query string, so each page/filter gets its own tag."""
+    query = "&".join(sorted(str(request.query_params).split("&")))
+    return hashlib.blake2s(query.encode(), digest_size=6).hexdigest()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    return "*" in candidates or any(
+        c.removeprefix("W/") == etag for c in candidates
+    )
+
+
+def not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag},
+    )
+
+
+# The tags of each resource, shared by the sync and the async controllers.
+
+
+def task_etag(task_id: int, project_id: int, version: Any) -> str:
+    # Tasks carry no version of their own; the owning project's version
+    # changes whenever any of its tasks does.
+    return make_etag("task", task_id, project_id, version)
+
+
+def task_list_etag(
+    request: Request,
+    project_id: int,
+    version: Any,
+    overdue: bool,
+    now: datetime,
+) -> str:
+    # The overdue filter moves with the date even when no task changes.
+    return make_etag(
+        "tasks",
+        project_id,
+        version,
+        query_digest(request),
+        *((now.date(),) if overdue else ()),
+    )
+
+
+def project_etag(project_id: int, version: Any) -> str:
+    return make_etag("project", project_id, version)
+
+
+def project_list_etag(request: Request, fingerprint: Sequence[Any]) -> str:
+    return make_etag("projects", *fingerprint, query_digest(request))
+
+
+def project_summary_etag(project_id: int, version: Any, today: date) -> str:
+    # Overdue counts change with the date even when no task does.
+    return make_etag("summary", project_id, version, today)
+
+
+def project_summaries_etag(fingerprint: Sequence[Any], today: date) -> str:
+    return make_etag("summaries", *fingerprint, today)
@@ -1,6 +1,9 @@
+import os
+
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
+from ..backend import uses_in_memory_storage
 from ..core.exceptions import (
     ValidationError as DomainValidationError,
     DuplicateError,
@@ -9,16 +12,36 @@ from ..core.exceptions import (
     TodoListError,
 )
 from .routers import register_routers
+from .scheduler import deadline_scheduler_enabled, deadline_scheduler_lifespan
+
 
+def create_app(
+    async_stack: bool | None = None,
+    deadline_scheduler: bool | None = None,
+) -> FastAPI:
+    if async_stack is None:
+        async_stack = os.getenv("API_ASYNC_STACK", "false").lower() in {
+            "1",
+            "true",
+            "yes",
+        }
+    if uses_in_memory_storage():
+        # The async controllers are built on AsyncSession; the in-memory
+        # backend never waits on I/O and is served by the sync stack.
+        async_stack = False
+    if deadline_scheduler is None:
+        deadline_scheduler = deadline_scheduler_enabled()
 
-def create_app() -> FastAPI:
     app = FastAPI(
         title="ToDo List API",
         version="1.0.0",
         description="Web API for managing projects and tasks.",
+        # Closes overdue tasks as they fall due, in place of (or next to)
+        # the autoclose command run from cron.
+        lifespan=deadline_scheduler_lifespan if deadline_scheduler else None,
     )
 
-    register_routers(app)
+    register_routers(app, async_stack=async_stack)
     register_exception_handlers(app)
 
     return app
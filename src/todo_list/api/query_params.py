@@ -0,0 +1,107 @@
+from datetime import datetime
+from typing import Any, Literal
+
+from fastapi import Depends, Query
+
+from ..core.filters import TASK_SORT_KEYS
+from ..repositories.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+# Query parameters shared by the sync and the async controllers, declared
+# once as class dependencies: `query: TaskListQuery = Depends()`.
+
+
+class PageQuery:
+    def __init__(
+        self,
+        limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        after: str | None = Query(
+            default=None,
+            description="Opaque cursor returned as next_cursor by the previous page",
+        ),
+    ) -> None:
+        self.limit = limit
+        self.after = after
+
+
+class TaskListQuery:
+    def __init__(
+        self,
+        page: PageQuery = Depends(),
+        statuses: list[str] | None = Query(
+            default=None,
+            alias="status",
+            description="Only tasks in these statuses; repeat to give several",
+        ),
+        deadline_from: str | None = Query(
+            default=None,
+            description="Only tasks with deadline on or after YYYY-MM-DD",
+        ),
+        deadline_to: str | None = Query(
+            default=None,
+            description="Only tasks with deadline on or before YYYY-MM-DD",
+        ),
+        created_from: str | None = Query(
+            default=None,
+            description="Only tasks created at or after this ISO 8601 datetime",
+        ),
+        created_to: str | None = Query(
+            default=None,
+            description="Only tasks created at or before this ISO 8601 datetime",
+        ),
+        overdue: bool = Query(
+            default=False,
+            description="Only open tasks whose deadline has passed",
+        ),
+        sort: Literal[TASK_SORT_KEYS] = Query(
+            default="created_at",
+            description="Sort key; prefix with '-' for descending order",
+        ),
+    ) -> None:
+        self.page = page
+        self.statuses = statuses
+        self.deadline_from = deadline_from
+        self.deadline_to = deadline_to
+        self.created_from = created_from
+        self.created_to = created_to
+        self.overdue = overdue
+        self.sort = sort
+
+    def arguments(self, now: datetime) -> dict[str, Any]:
+        # The keyword arguments of list_tasks_page on either task service.
+        return {
+            "limit": self.page.limit,
+            "after": self.page.after,
+            "statuses": self.statuses,
+            "deadline_from": self.deadline_from,
+            "deadline_to": self.deadline_to,
+            "created_from": self.created_from,
+            "created_to": self.created_to,
+            "overdue": self.overdue,
+            "sort": self.sort,
+            "now": now,
+        }
+
+
+class TaskSearchQuery:
+    def __init__(
+        self,
+        q: str = Query(
+            ...,
+            description="Words to find in task titles and descriptions",
+        ),
+        project_id: int | None = Query(
+            default=None,
+            description="Only tasks of this project (optional)",
+        ),
+        page: PageQuery = Depends(),
+    ) -> None:
+        self.q = q
+        self.project_id = project_id
+        self.page = page
+
+    def arguments(self) -> dict[str, Any]:
+        return {
+            "limit": self.page.limit,
+            "after": self.page.after,
+            "project_id": self.project_id,
+        }
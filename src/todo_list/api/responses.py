@@ -0,0 +1,32 @@
+from typing import Any, Iterable
+
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+        JSON response for already validated Pydantic models.
+
+        The model is encoded straight to bytes by pydantic-core's Rust
+        serializer. Returning this response from an endpoint also skips
+        FastAPI's second validation against `response_model` and the
+        stdlib `json.dumps` pass, which dominate large list responses.
+        `response_model` stays on the route for the OpenAPI schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return super().render(content)
+
+
+class NDJSONResponse(StreamingResponse):
+    media_type = "application/x-ndjson"
+
+
+def ndjson_lines(model: type[BaseModel], rows: Iterable[Any]) -> bytes:
+    serializer = model.__pydantic_serializer__
+    return b"".join(
+        serializer.to_json(model.model_validate(row)) + b"\n" for row in rows
+    )
@@ -1,9 +1,15 @@
-from fastapi import APIRouter, FastAPI
+from fastapi import APIRouter, FastAPI, status
+from fastapi.responses import JSONResponse
 
+from ..backend import uses_in_memory_storage
+from ..cache import get_default_cache
+from ..db.check_connection import cached_check_connection
+from ..db.pool_metrics import pool_status
+from ..db.session import engine
 from .controllers import project_router, task_router
 
 
-def register_routers(app: FastAPI) -> None:
+def register_routers(app: FastAPI, async_stack: bool = False) -> None:
     api_router = APIRouter(prefix="/api")
 
     @api_router.get("/health", tags=["system"])
@@ -11,7 +17,48 @@ def register_routers(app: FastAPI) -> None:
         """Simple health check endpoint."""
         return {"status": "ok"}
 
-    api_router.include_router(project_router)
-    api_router.include_router(task_router)
+    @api_router.get("/ready", tags=["system"])
+    def readiness_check() -> JSONResponse:
+        """Readiness probe: cached database check plus pool and cache statistics."""
+        if uses_in_memory_storage():
+            return JSONResponse(
+                status_code=status.HTTP_200_OK,
+                content={"status": "ok", "storage": "memory"},
+            )
+
+        probe = cached_check_connection()
+        pools = {"sync": pool_status(engine)}
+        if async_stack:
+            from ..db.async_session import async_engine
+
+            pools["async"] = pool_status(async_engine.sync_engine)
+        cache = get_default_cache()
+
+        return JSONResponse(
+            status_code=status.HTTP_200_OK
+            if probe.ok
+            else status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={
+                "status": "ok" if probe.ok else "unavailable",
+                "database": probe.to_dict(),
+                "pools": pools,
+                "cache": cache.stats() if cache is not None else None,
+            },
+        )
+
+    if async_stack:
+        # Imported lazily: loading these modules creates the asyncpg engine.
+        from .controllers.async_project_controller import (
+            router as async_project_router,
+        )
+        from .controllers.async_task_controller import (
+            router as async_task_router,
+        )
+
+        api_router.include_router(async_project_router)
+        api_router.include_router(async_task_router)
+    else:
+        api_router.include_router(project_router)
+        api_router.include_router(task_router)
 
     app.include_router(api_router)
@@ -0,0 +1,86 @@
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from fastapi import FastAPI
+
+from ..backend import uses_in_memory_storage
+from ..core.exceptions import ValidationError
+from ..db.advisory_lock import AdvisoryLock
+from ..db.session import engine
+from ..services.deadline_scheduler import (
+    DEFAULT_RESYNC_INTERVAL,
+    DEFAULT_RETRY_INTERVAL,
+    DeadlineScheduler,
+)
+from ..services.task_service import DEFAULT_CLOSE_CHUNK_SIZE
+from .dependencies import set_deadline_observer, task_service_transaction
+
+# pg_try_advisory_lock key shared by every replica: "todo" in ASCII.
+DEFAULT_SCHEDULER_LOCK_KEY = 0x746F646F
+
+
+def deadline_scheduler_enabled() -> bool:
+    return os.getenv("DEADLINE_SCHEDULER", "false").lower() in {
+        "1",
+        "true",
+        "yes",
+    }
+
+
+def build_deadline_scheduler() -> DeadlineScheduler:
+    try:
+        chunk_size = int(
+            os.getenv("AUTOCLOSE_CHUNK_SIZE", str(DEFAULT_CLOSE_CHUNK_SIZE))
+        )
+        resync_interval = float(
+            os.getenv(
+                "DEADLINE_SCHEDULER_RESYNC_SECONDS",
+                str(DEFAULT_RESYNC_INTERVAL),
+            )
+        )
+        retry_interval = float(
+            os.getenv(
+                "DEADLINE_SCHEDULER_RETRY_SECONDS",
+                str(DEFAULT_RETRY_INTERVAL),
+            )
+        )
+        lock_key = int(
+            os.getenv(
+                "DEADLINE_SCHEDULER_LOCK_KEY", str(DEFAULT_SCHEDULER_LOCK_KEY)
+            )
+        )
+    except ValueError:
+        raise ValidationError(
+            "AUTOCLOSE_CHUNK_SIZE, DEADLINE_SCHEDULER_RESYNC_SECONDS, "
+            "DEADLINE_SCHEDULER_RETRY_SECONDS and DEADLINE_SCHEDULER_LOCK_KEY "
+            "must be numbers"
+        )
+
+    # The in-memory storage lives in this process only: it has no other
+    # replica to coordinate with.
+    leader_lock: Optional[AdvisoryLock] = None
+    if not uses_in_memory_storage():
+        leader_lock = AdvisoryLock(engine, lock_key)
+
+    return DeadlineScheduler(
+        task_service_transaction,
+        leader_lock=leader_lock,
+        chunk_size=chunk_size,
+        resync_interval=resync_interval,
+        retry_interval=retry_interval,
+    )
+
+
+@asynccontextmanager
+async def deadline_scheduler_lifespan(app: FastAPI) -> AsyncIterator[None]:
+    scheduler = build_deadline_scheduler()
+    scheduler.start()
+    set_deadline_observer(scheduler.notice)
+    app.state.deadline_scheduler = scheduler
+    try:
+        yield
+    finally:
+        set_deadline_observer(None)
+        await scheduler.stop()
@@ -0,0 +1,51 @@
+from tempfile import SpooledTemporaryFile
+
+from fastapi import Request
+
+from ..services.task_import import ImportReport, RejectedRow
+from .controller_schemas.responses import (
+    TaskImportRejectResponse,
+    TaskImportResponse,
+)
+
+SPOOL_MAX_MEMORY = 8 * 1024 * 1024
+MAX_REPORTED_REJECTS = 100
+
+
+async def spool_request_body(request: Request) -> SpooledTemporaryFile:
+    # The raw body is read chunk by chunk and kept in memory only up to
+    # SPOOL_MAX_MEMORY; larger uploads roll over to a temporary file.
+    spool = SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY, mode="w+b")
+    async for chunk in request.stream():
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
+
+
+class RejectCollector:
+    """
+        Keeps the first rejected rows of an upload for the response.
+
+        The total number of rejects is always reported; only the details
+        are capped so a bad file cannot blow up the response size.
+    """
+
+    def __init__(self, limit: int = MAX_REPORTED_REJECTS) -> None:
+        self._limit = limit
+        self.rows: list[RejectedRow] = []
+
+    def __call__(self, row: RejectedRow) -> None:
+        if len(self.rows) < self._limit:
+            self.rows.append(row)
+
+    def response(self, report: ImportReport) -> TaskImportResponse:
+        return TaskImportResponse(
+            imported=report.imported,
+            rejected=report.rejected,
+            seconds=report.seconds,
+            rows_per_second=report.rows_per_second,
+            rejects=[
+                TaskImportRejectResponse.model_validate(row)
+                for row in self.rows
+            ],
+        )
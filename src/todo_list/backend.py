@@ -0,0 +1,70 @@
+import atexit
+import os
+from functools import lru_cache
+
+from .core.exceptions import ValidationError
+from .in_memory.storage.in_memory_storage import InMemoryStorage
+from .in_memory.storage.persistent_storage import (
+    DEFAULT_SNAPSHOT_EVERY,
+    PersistentInMemoryStorage,
+)
+
+STORAGE_BACKENDS = ("sql", "memory")
+
+
+@lru_cache(maxsize=None)
+def get_storage_backend() -> str:
+    # Read once, on first use, so `main` can load .env before choosing.
+    backend = os.getenv("STORAGE_BACKEND", "sql").strip().lower()
+    if backend not in STORAGE_BACKENDS:
+        raise ValidationError(
+            f"STORAGE_BACKEND must be one of: {', '.join(STORAGE_BACKENDS)}"
+        )
+    return backend
+
+
+def uses_in_memory_storage() -> bool:
+    return get_storage_backend() == "memory"
+
+
+@lru_cache(maxsize=None)
+def get_default_storage() -> InMemoryStorage:
+    # The services enforce both limits themselves, MAX_NUMBER_OF_TASKS per
+    # project; the storage's own caps (its task cap is global) only have to
+    # stay out of their way.
+    try:
+        max_projects = int(os.getenv("MAX_NUMBER_OF_PROJECTS", "100"))
+        max_tasks = int(os.getenv("MAX_NUMBER_OF_TASKS", "1000"))
+    except ValueError:
+        raise ValidationError(
+            "MAX_NUMBER_OF_PROJECTS and MAX_NUMBER_OF_TASKS must be integers"
+        )
+    data_dir = os.getenv("STORAGE_DATA_DIR")
+    if not data_dir:
+        return InMemoryStorage(
+            max_projects=max_projects,
+            max_tasks=max_projects * max_tasks,
+        )
+
+    try:
+        fsync_batch = int(os.getenv("STORAGE_FSYNC_BATCH", "64"))
+        fsync_interval_ms = float(os.getenv("STORAGE_FSYNC_INTERVAL_MS", "50"))
+        snapshot_every = int(
+            os.getenv("STORAGE_SNAPSHOT_EVERY", str(DEFAULT_SNAPSHOT_EVERY))
+        )
+    except ValueError:
+        raise ValidationError(
+            "STORAGE_FSYNC_BATCH, STORAGE_FSYNC_INTERVAL_MS and "
+            "STORAGE_SNAPSHOT_EVERY must be numbers"
+        )
+    storage = PersistentInMemoryStorage(
+        data_dir,
+        fsync_batch=fsync_batch,
+        fsync_interval=fsync_interval_ms / 1000,
+        snapshot_every=snapshot_every,
+        max_projects=max_projects,
+        max_tasks=max_projects * max_tasks,
+    )
+    # Flushes the records still waiting for their group fsync.
+    atexit.register(storage.close)
+    return storage
@@ -0,0 +1,31 @@
+import os
+from typing import Optional
+
+from ..core.exceptions import ValidationError
+from .base import Cache
+from .lru import LRUCache
+
+
+def _build_default_cache() -> Optional[Cache]:
+    # One cache per process, evicted only by this process's writes; see
+    # CACHE_ENABLED in .env.example for what other writers leave behind.
+    if os.getenv("CACHE_ENABLED", "true").lower() not in {"1", "true", "yes"}:
+        return None
+    try:
+        max_size = int(os.getenv("CACHE_MAX_SIZE", "10000"))
+        ttl_seconds = float(os.getenv("CACHE_TTL_SECONDS", "30"))
+    except ValueError:
+        raise ValidationError(
+            "CACHE_MAX_SIZE and CACHE_TTL_SECONDS must be numbers"
+        )
+    return LRUCache(max_size=max_size, ttl_seconds=ttl_seconds)
+
+
+_default_cache = _build_default_cache()
+
+
+def get_default_cache() -> Optional[Cache]:
+    return _default_cache
+
+
+__all__ = ["Cache", "LRUCache", "get_default_cache"]
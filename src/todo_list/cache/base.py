@@ -0,0 +1,19 @@
+from typing import Any, Hashable, Optional, Protocol
+
+
+class Cache(Protocol):
+    """Read-through cache of the repositories; `LRUCache` by default."""
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        ...
+
+    # Values are plain picklable data, never ORM objects, so a Redis or
+    # memcached wrapper can stand in for the LRUCache.
+    def set(self, key: Hashable, value: Any) -> None:
+        ...
+
+    def delete(self, *keys: Hashable) -> None:
+        ...
+
+    def stats(self) -> dict[str, Any]:
+        ...
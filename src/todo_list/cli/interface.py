@@ -7,6 +7,7 @@ from ..core.exceptions import (
     LimitExceededError,
     NotFoundError,
 )
+from ..db.unit_of_work import UnitOfWork
 from ..services.project_service import ProjectService
 from ..services.task_service import TaskService
 
@@ -23,11 +24,17 @@ class CLIInterface:
         self,
         project_service: ProjectService,
         task_service: TaskService,
+        unit_of_work: Optional[UnitOfWork] = None,
     ) -> None:
         self.project_service = project_service
         self.task_service = task_service
+        self.unit_of_work = unit_of_work
         self.running = True
 
+    def commit(self) -> None:
+        if self.unit_of_work is not None:
+            self.unit_of_work.commit()
+
 
     def get_user_input(self, prompt: str) -> str:
         while True:
@@ -70,6 +77,9 @@ class CLIInterface:
                 print("Invalid number. Please enter a valid integer.")
 
     def handle_error(self, error: Exception) -> None:
+        if self.unit_of_work is not None:
+            self.unit_of_work.rollback()
+
         if isinstance(error, ValidationError):
             print(f"Validation error: {error}")
         elif isinstance(error, DuplicateError):
@@ -177,6 +187,7 @@ class CLIInterface:
                 name=name,
                 description=description,
             )
+            self.commit()
             print(f"Project created successfully with ID: {project.id}")
         except Exception as exc:
             self.handle_error(exc)
@@ -223,6 +234,7 @@ class CLIInterface:
                 name=new_name,
                 description=new_description,
             )
+            self.commit()
             print(f"Project with ID {project.id} updated successfully.")
         except Exception as exc:
             self.handle_error(exc)
@@ -235,6 +247,7 @@ class CLIInterface:
 
         try:
             self.project_service.delete_project(project_id)
+            self.commit()
             print(f"Project with ID {project_id} deleted successfully.")
         except Exception as exc:
             self.handle_error(exc)
@@ -299,6 +312,7 @@ class CLIInterface:
                 status=status,
                 deadline=deadline,
             )
+            self.commit()
             print(f"Task created successfully with ID: {task.id}")
         except Exception as exc:
             self.handle_error(exc)
@@ -373,6 +387,7 @@ class CLIInterface:
                 status=new_status,
                 deadline=new_deadline,
             )
+            self.commit()
             print(f"Task with ID {task.id} updated successfully.")
         except Exception as exc:
             self.handle_error(exc)
@@ -394,6 +409,7 @@ class CLIInterface:
                 task_id=task_id,
                 status=new_status,
             )
+            self.commit()
             print(
                 f"Status of task with ID {task.id} "
                 f"changed to '{task.status}'."
@@ -409,6 +425,7 @@ class CLIInterface:
 
         try:
             self.task_service.delete_task(task_id)
+            self.commit()
             print(f"Task with ID {task_id} deleted successfully.")
         except Exception as exc:
             self.handle_error(exc)
@@ -1,36 +1,323 @@
+import argparse
+import json
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
 
 from sqlalchemy.orm import Session
 
-from ..db.session import SessionLocal
+from ..core.exceptions import ValidationError
+from ..core.filters import TaskShard
+from ..db.session import SessionLocal, engine
+from ..db.unit_of_work import UnitOfWork
 from ..repositories.project_repository import ProjectRepository
 from ..repositories.task_repository import TaskRepository
-from ..services.task_service import TaskService
+from ..services.task_service import (
+    DEFAULT_CLOSE_CHUNK_SIZE,
+    OVERDUE_SHARD_KEYS,
+    TaskService,
+)
 
+POOL_KINDS = ("thread", "process")
+DEFAULT_WORKERS = 4
+DEFAULT_ID_SHARD_SIZE = 100_000
+DEFAULT_PROJECT_SHARD_SIZE = 1
 
-def run(now: datetime | None = None) -> int:
-    if now is None:
-        now = datetime.utcnow()
 
-    session: Session = SessionLocal()
+def _chunk_size_from_env() -> int:
+    raw = os.getenv("AUTOCLOSE_CHUNK_SIZE", str(DEFAULT_CLOSE_CHUNK_SIZE))
     try:
-        project_repo = ProjectRepository(session)
-        task_repo = TaskRepository(session)
-        task_service = TaskService(
-            task_repository=task_repo,
-            project_repository=project_repo,
-        )
+        return int(raw)
+    except ValueError:
+        raise ValidationError("AUTOCLOSE_CHUNK_SIZE must be an integer")
+
 
-        updated_count = task_service.close_overdue_tasks(now=now)
-        return updated_count
+@contextmanager
+def _task_service() -> Iterator[TaskService]:
+    session: Session = SessionLocal()
+    try:
+        with UnitOfWork(session) as uow:
+            yield TaskService(
+                task_repository=TaskRepository(session),
+                project_repository=ProjectRepository(session),
+                unit_of_work=uow,
+            )
     finally:
         session.close()
 
 
+def run(
+    now: datetime | None = None,
+    chunk_size: int | None = None,
+) -> list[int]:
+    if now is None:
+        now = datetime.utcnow()
+    if chunk_size is None:
+        chunk_size = _chunk_size_from_env()
+
+    with _task_service() as task_service:
+        return task_service.close_overdue_tasks(
+            now=now,
+            chunk_size=chunk_size,
+        )
+
+
+@dataclass
+class ShardedReport:
+    shards: int = 0
+    # Shards a previous, interrupted run had finished already.
+    resumed: int = 0
+    # Tasks closed by this run, or found overdue with dry_run.
+    tasks: int = 0
+    seconds: float = 0.0
+
+
+def process_shard(
+    shard: TaskShard,
+    now: datetime,
+    chunk_size: int,
+    dry_run: bool,
+) -> int:
+    # Runs in a pool worker, with a session of its own; every chunk of a
+    # shard is committed separately, so no transaction outgrows it.
+    with _task_service() as task_service:
+        if dry_run:
+            return task_service.count_overdue_tasks(now=now, shard=shard)
+        closed = task_service.close_overdue_tasks(
+            now=now, chunk_size=chunk_size, shard=shard
+        )
+        return len(closed)
+
+
+def _init_worker_process() -> None:
+    # A forked worker must not share the parent's pooled connections.
+    engine.dispose(close=False)
+
+
+def _shard_to_json(shard: TaskShard) -> list:
+    project_ids = None if shard.project_ids is None else list(shard.project_ids)
+    return [shard.min_id, shard.max_id, project_ids]
+
+
+def _shard_from_json(value: list) -> TaskShard:
+    min_id, max_id, project_ids = value
+    return TaskShard(
+        min_id=min_id,
+        max_id=max_id,
+        project_ids=None if project_ids is None else tuple(project_ids),
+    )
+
+
+def _write_checkpoint(path: Path, state: dict) -> None:
+    # Replaced in one step, so an interruption leaves the old or the new.
+    partial = path.with_name(path.name + ".partial")
+    partial.write_text(json.dumps(state), encoding="utf-8")
+    os.replace(partial, path)
+
+
+def run_sharded(
+    shard_by: str | None = "id",
+    shard_size: int | None = None,
+    *,
+    workers: int = DEFAULT_WORKERS,
+    pool: str = "thread",
+    chunk_size: int | None = None,
+    now: datetime | None = None,
+    dry_run: bool = False,
+    checkpoint: str | Path | None = None,
+    on_progress: Optional[Callable[[int, int, TaskShard, int], None]] = None,
+) -> ShardedReport:
+    """
+    Close overdue tasks shard by shard on a pool of `workers`.
+
+    `shard_by` is "id" (ranges of `shard_size` task ids), "project"
+    (`shard_size` projects per shard) or None for a single shard. With a
+    `checkpoint` file the finished shards are recorded as they complete;
+    running again with the same file resumes with the same shards and the
+    same cutoff time, and the file is removed once every shard is done.
+    `on_progress(done, total, shard, tasks)` follows each shard.
+    """
+    if shard_by is not None and shard_by not in OVERDUE_SHARD_KEYS:
+        raise ValidationError(
+            f"shard_by must be one of: {', '.join(OVERDUE_SHARD_KEYS)}"
+        )
+    if pool not in POOL_KINDS:
+        raise ValidationError(f"pool must be one of: {', '.join(POOL_KINDS)}")
+    if workers < 1:
+        raise ValidationError("workers must be a positive integer")
+    if chunk_size is None:
+        chunk_size = _chunk_size_from_env()
+    if chunk_size < 1:
+        raise ValidationError("chunk_size must be a positive integer")
+    if shard_size is None:
+        shard_size = (
+            DEFAULT_PROJECT_SHARD_SIZE
+            if shard_by == "project"
+            else DEFAULT_ID_SHARD_SIZE
+        )
+
+    started = time.perf_counter()
+    checkpoint_path = Path(checkpoint) if checkpoint is not None else None
+    if dry_run:
+        # Counting changes nothing, so there is nothing to resume.
+        checkpoint_path = None
+
+    if checkpoint_path is not None and checkpoint_path.exists():
+        state = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+        if state["shard_by"] != shard_by:
+            raise ValidationError(
+                f"Checkpoint {checkpoint_path} belongs to a run sharded by "
+                f"{state['shard_by']}; resume with the same sharding or "
+                "remove the file"
+            )
+        now = datetime.fromisoformat(state["now"])
+        shards = [_shard_from_json(value) for value in state["shards"]]
+        done = set(state["done"])
+    else:
+        if now is None:
+            now = datetime.utcnow()
+        if shard_by is None:
+            shards = [TaskShard()]
+        else:
+            with _task_service() as task_service:
+                shards = task_service.plan_overdue_shards(
+                    shard_by, shard_size, now
+                )
+        done = set()
+        state = {
+            "shard_by": shard_by,
+            "now": now.isoformat(),
+            "shards": [_shard_to_json(shard) for shard in shards],
+            "done": [],
+        }
+        if checkpoint_path is not None:
+            _write_checkpoint(checkpoint_path, state)
+
+    report = ShardedReport(shards=len(shards), resumed=len(done))
+    if pool == "process":
+        executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker_process
+        )
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers)
+
+    with executor:
+        futures: dict[Future, int] = {
+            executor.submit(
+                process_shard, shards[index], now, chunk_size, dry_run
+            ): index
+            for index in range(len(shards))
+            if index not in done
+        }
+        try:
+            for future in as_completed(futures):
+                index = futures[future]
+                count = future.result()
+                report.tasks += count
+                done.add(index)
+                if checkpoint_path is not None:
+                    state["done"] = sorted(done)
+                    _write_checkpoint(checkpoint_path, state)
+                if on_progress is not None:
+                    on_progress(len(done), len(shards), shards[index], count)
+        except BaseException:
+            # Shards not started yet are left to the resumed run. The running
+            # ones are waited for but not recorded: resuming runs them again
+            # and finds only what they had not committed.
+            for future in futures:
+                future.cancel()
+            raise
+
+    if checkpoint_path is not None:
+        checkpoint_path.unlink()
+    report.seconds = time.perf_counter() - started
+    return report
+
+
 def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Close overdue tasks, optionally in parallel shards."
+    )
+    parser.add_argument(
+        "--shard-by",
+        choices=OVERDUE_SHARD_KEYS,
+        help="split the work by task id ranges or by project "
+        "(default: a single pass)",
+    )
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        help=f"task ids per shard (default {DEFAULT_ID_SHARD_SIZE:,}) or "
+        f"projects per shard (default {DEFAULT_PROJECT_SHARD_SIZE})",
+    )
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--pool", choices=POOL_KINDS, default="thread")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        help="tasks closed per transaction (default: AUTOCLOSE_CHUNK_SIZE)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="only count the overdue tasks of every shard",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        help="file recording finished shards; an interrupted run started "
+        "again with the same file resumes where it stopped",
+    )
+    args = parser.parse_args()
+
+    verb = "overdue" if args.dry_run else "closed"
+
+    def print_progress(
+        done: int, total: int, shard: TaskShard, count: int
+    ) -> None:
+        print(f"[{done}/{total}] {shard}: {count} task(s) {verb}")
+
     print("Running auto-close for overdue tasks...")
     try:
-        count = run()
-        print(f"Auto-close completed. Updated {count} task(s).")
+        report = run_sharded(
+            args.shard_by,
+            args.shard_size,
+            workers=args.workers,
+            pool=args.pool,
+            chunk_size=args.chunk_size,
+            dry_run=args.dry_run,
+            checkpoint=args.checkpoint,
+            on_progress=print_progress,
+        )
+        resumed = (
+            f", {report.resumed} finished before resuming"
+            if report.resumed
+            else ""
+        )
+        if args.dry_run:
+            print(
+                f"Dry run: {report.tasks} overdue task(s) in "
+                f"{report.shards} shard(s)."
+            )
+        else:
+            print(
+                f"Auto-close completed. Updated {report.tasks} task(s) in "
+                f"{report.shards} shard(s){resumed}, "
+                f"{report.seconds:.2f}s."
+            )
     except Exception as exc:
         print(f"Error while auto-closing overdue tasks: {exc}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+import argparse
+import json
+from pathlib import Path
+
+from sqlalchemy.orm import Session
+
+from ..db.session import SessionLocal
+from ..db.unit_of_work import UnitOfWork
+from ..repositories.project_repository import ProjectRepository
+from ..repositories.task_repository import TaskRepository
+from ..services.task_import import (
+    IMPORT_FORMATS,
+    ImportReport,
+    RejectedRow,
+    format_from_filename,
+    read_records,
+)
+from ..services.task_service import DEFAULT_IMPORT_BATCH_SIZE, TaskService
+
+
+def default_reject_path(path: str | Path) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + ".rejects.ndjson")
+
+
+def run(
+    project_id: int,
+    path: str | Path,
+    *,
+    fmt: str | None = None,
+    reject_path: str | Path | None = None,
+    batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+) -> ImportReport:
+    path = Path(path)
+    if fmt is None:
+        fmt = format_from_filename(path.name)
+    if reject_path is None:
+        reject_path = default_reject_path(path)
+
+    session: Session = SessionLocal()
+    try:
+        with (
+            UnitOfWork(session) as uow,
+            path.open("rb") as source,
+            open(reject_path, "w", encoding="utf-8") as rejects,
+        ):
+            def write_reject(row: RejectedRow) -> None:
+                rejects.write(
+                    json.dumps(
+                        {"line": row.line, "error": row.error, "raw": row.raw},
+                        ensure_ascii=False,
+                    )
+                    + "\n"
+                )
+
+            task_service = TaskService(
+                task_repository=TaskRepository(session),
+                project_repository=ProjectRepository(session),
+                unit_of_work=uow,
+            )
+            return task_service.import_tasks(
+                project_id,
+                read_records(source, fmt),
+                batch_size=batch_size,
+                on_reject=write_reject,
+            )
+    finally:
+        session.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Import tasks into a project from an NDJSON or CSV file."
+    )
+    parser.add_argument("project_id", type=int)
+    parser.add_argument("path")
+    parser.add_argument(
+        "--format",
+        choices=IMPORT_FORMATS,
+        help="input format (default: from the file extension)",
+    )
+    parser.add_argument(
+        "--rejects",
+        help="where rejected rows are written (default: <path>.rejects.ndjson)",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=DEFAULT_IMPORT_BATCH_SIZE
+    )
+    args = parser.parse_args()
+
+    print(f"Importing tasks from {args.path}...")
+    try:
+        report = run(
+            args.project_id,
+            args.path,
+            fmt=args.format,
+            reject_path=args.rejects,
+            batch_size=args.batch_size,
+        )
+        print(
+            f"Import completed. Imported {report.imported} task(s), "
+            f"rejected {report.rejected} in {report.seconds:.2f}s "
+            f"({report.rows_per_second:,.0f} rows/s)."
+        )
+        if report.rejected:
+            reject_path = args.rejects or default_reject_path(args.path)
+            print(f"Rejected rows were written to {reject_path}.")
+    except Exception as exc:
+        print(f"Error while importing tasks: {exc}")
+
+
+if __name__ == "__main__":
+    main()
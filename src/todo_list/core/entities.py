@@ -1,27 +1,218 @@
-from datetime import datetime
-from typing import Optional
-from dataclasses import dataclass, field
-from .validators import Validator
+from datetime import date, datetime, timedelta
+from typing import Any, Optional
+from .validators import (
+    PROJECT_DESCRIPTION_MAX_LENGTH,
+    PROJECT_NAME_MAX_LENGTH,
+    TASK_DESCRIPTION_MAX_LENGTH,
+    TASK_STATUSES,
+    TASK_TITLE_MAX_LENGTH,
+    Validator,
+)
 from .exceptions import NotFoundError
 
+# One shared string object per status, however a task got its value.
+_STATUSES = {status: status for status in TASK_STATUSES}
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _encode_timestamp(value: Optional[str]) -> Optional[int]:
+    # ISO timestamp -> microseconds since 1970-01-01 on the same (local,
+    # naive) clock, so decoding gives back the same string exactly.
+    if value is None:
+        return None
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is not None:
+        moment = moment.astimezone().replace(tzinfo=None)
+    return (moment - _EPOCH) // _MICROSECOND
+
+
+def _decode_timestamp(value: Optional[int]) -> Optional[str]:
+    if value is None:
+        return None
+    return (_EPOCH + timedelta(microseconds=value)).isoformat()
+
+
+def _now() -> int:
+    return (datetime.now() - _EPOCH) // _MICROSECOND
+
+
+def _encode_day(value: Optional[str | date]) -> Optional[int]:
+    # YYYY-MM-DD (or a date) -> proleptic Gregorian ordinal.
+    if value is None:
+        return None
+    if isinstance(value, date):
+        return value.toordinal()
+    return Validator.parse_deadline(value).toordinal()
+
+
+def _decode_day(value: Optional[int]) -> Optional[str]:
+    if value is None:
+        return None
+    return date.fromordinal(value).isoformat()
+
 
-@dataclass
 class Task:
+    """
+        A task, kept compact for storages holding millions of them.
+
+        Instances have slots instead of a __dict__, statuses share one
+        string object per value, and timestamps and the deadline are
+        stored as integers. `created_at`, `deadline` and `closed_at` are
+        still read and assigned as ISO strings; they are converted on
+        access, so hot loops should prefer `deadline_day`.
+    """
 
-    id: int
-    title: str
-    description: str
-    status: str = "todo"
-    deadline: Optional[str] = None
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    # Not a @dataclass(slots=True): its fields and __init__ parameters
+    # would be the stored integers, and a property cannot share a slotted
+    # field's name, so `deadline=` and friends could not stay ISO strings.
+    __slots__ = (
+        "id",
+        "title",
+        "description",
+        "status",
+        "project_id",
+        "_deadline",
+        "_created_at",
+        "_closed_at",
+    )
 
-    def __post_init__(self) -> None:
-        self.title = Validator.validate_text(self.title, "task", 30)
+    def __init__(
+        self,
+        id: int,
+        title: str,
+        description: str,
+        status: str = "todo",
+        deadline: Optional[str] = None,
+        created_at: Optional[str] = None,
+        project_id: Optional[int] = None,
+        closed_at: Optional[str] = None,
+    ) -> None:
+        self.id = id
+        self.title = Validator.validate_text(
+            title, "task", TASK_TITLE_MAX_LENGTH
+        )
         self.description = Validator.validate_text(
-            self.description, "dicripition", 150, allow_empty=True
+            description,
+            "dicripition",
+            TASK_DESCRIPTION_MAX_LENGTH,
+            allow_empty=True,
         )
-        self.status = Validator.validate_status(self.status)
-        self.deadline = Validator.validate_deadline(self.deadline)
+        self.status = _STATUSES[Validator.validate_status(status)]
+        self._deadline = _encode_day(deadline)
+        self._created_at = (
+            _now() if created_at is None else _encode_timestamp(created_at)
+        )
+        self.project_id = project_id
+        self._closed_at = _encode_timestamp(closed_at)
+
+    @classmethod
+    def restore(
+        cls,
+        id: int,
+        title: str,
+        description: str,
+        status: str,
+        deadline: Optional[str],
+        created_at: str,
+        project_id: Optional[int],
+        closed_at: Optional[str],
+    ) -> "Task":
+        # Trusted path for data this application wrote itself (storage
+        # snapshots and logs): no validation, no default factories.
+        task = cls.__new__(cls)
+        task.id = id
+        task.title = title
+        task.description = description
+        task.status = _STATUSES[status]
+        task._deadline = _encode_day(deadline)
+        task._created_at = _encode_timestamp(created_at)
+        task.project_id = project_id
+        task._closed_at = _encode_timestamp(closed_at)
+        return task
+
+    @classmethod
+    def create_trusted(
+        cls,
+        id: int,
+        title: str,
+        description: str,
+        status: str,
+        deadline: Optional[str | date],
+        project_id: Optional[int],
+    ) -> "Task":
+        # A new task from values the services already validated (see
+        # core.task_fields), created now.
+        task = cls.__new__(cls)
+        task.id = id
+        task.title = title
+        task.description = description
+        task.status = _STATUSES[status]
+        task._deadline = _encode_day(deadline)
+        task._created_at = _now()
+        task.project_id = project_id
+        task._closed_at = None
+        return task
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "Task":
+        # Inverse of to_row, trusted like restore.
+        task = cls.__new__(cls)
+        (
+            task.id,
+            task.title,
+            task.description,
+            status,
+            task._deadline,
+            task._created_at,
+            task.project_id,
+            task._closed_at,
+        ) = row
+        task.status = _STATUSES[status]
+        return task
+
+    def to_row(self) -> tuple:
+        # The stored values as they are, integers included.
+        return (
+            self.id,
+            self.title,
+            self.description,
+            self.status,
+            self._deadline,
+            self._created_at,
+            self.project_id,
+            self._closed_at,
+        )
+
+    @property
+    def deadline(self) -> Optional[str]:
+        return _decode_day(self._deadline)
+
+    @deadline.setter
+    def deadline(self, value: Optional[str | date]) -> None:
+        self._deadline = _encode_day(value)
+
+    @property
+    def deadline_day(self) -> Optional[int]:
+        """The deadline as a date ordinal; orders like `deadline`."""
+        return self._deadline
+
+    @property
+    def created_at(self) -> str:
+        return _decode_timestamp(self._created_at)
+
+    @created_at.setter
+    def created_at(self, value: str) -> None:
+        self._created_at = _encode_timestamp(value)
+
+    @property
+    def closed_at(self) -> Optional[str]:
+        return _decode_timestamp(self._closed_at)
+
+    @closed_at.setter
+    def closed_at(self, value: Optional[str]) -> None:
+        self._closed_at = _encode_timestamp(value)
 
     def update(
         self,
@@ -31,15 +222,37 @@ class Task:
         deadline: Optional[str] = None,
     ) -> None:
         if title is not None:
-            self.title = Validator.validate_text(title, "update", 30)
+            self.title = Validator.validate_text(
+                title, "update", TASK_TITLE_MAX_LENGTH
+            )
         if description is not None:
             self.description = Validator.validate_text(
-                description, "discription", 150, allow_empty=True
+                description,
+                "discription",
+                TASK_DESCRIPTION_MAX_LENGTH,
+                allow_empty=True,
             )
         if status is not None:
-            self.status = Validator.validate_status(status)
+            self.status = _STATUSES[Validator.validate_status(status)]
         if deadline is not None:
-            self.deadline = Validator.validate_deadline(deadline)
+            self.deadline = deadline
+
+    def update_trusted(
+        self,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[str] = None,
+        deadline: Optional[str | date] = None,
+    ) -> None:
+        # update() for values the services already validated.
+        if title is not None:
+            self.title = title
+        if description is not None:
+            self.description = description
+        if status is not None:
+            self.status = _STATUSES[status]
+        if deadline is not None:
+            self._deadline = _encode_day(deadline)
 
     def to_dict(self) -> dict:
         return {
@@ -49,34 +262,127 @@ class Task:
             "status": self.status,
             "deadline": self.deadline,
             "created_at": self.created_at,
+            "closed_at": self.closed_at,
+            "project_id": self.project_id,
         }
 
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.to_row() == other.to_row()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"Task(id={self.id!r}, title={self.title!r}, "
+            f"description={self.description!r}, status={self.status!r}, "
+            f"deadline={self.deadline!r}, created_at={self.created_at!r}, "
+            f"project_id={self.project_id!r}, closed_at={self.closed_at!r})"
+        )
+
 
-@dataclass
 class Project:
+    """
+        A project and its tasks, slotted like Task; `created_at` is stored
+        as an integer and read and assigned as an ISO string.
+    """
 
-    id: int
-    name: str
-    description: str
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    tasks: dict[int, Task] = field(default_factory=dict)
+    # Hand-written rather than a dataclass for the same reason as Task.
+    __slots__ = ("id", "name", "description", "tasks", "version", "_created_at")
 
-    def __post_init__(self) -> None:
-        self.name = Validator.validate_text(self.name, "project name", 30)
+    def __init__(
+        self,
+        id: int,
+        name: str,
+        description: str,
+        created_at: Optional[str] = None,
+        tasks: Optional[dict[int, Task]] = None,
+        version: int = 1,
+    ) -> None:
+        self.id = id
+        self.name = Validator.validate_text(
+            name, "project name", PROJECT_NAME_MAX_LENGTH
+        )
         self.description = Validator.validate_text(
-            self.description, "discription project", 150, allow_empty=True
+            description,
+            "discription project",
+            PROJECT_DESCRIPTION_MAX_LENGTH,
+            allow_empty=True,
+        )
+        self._created_at = (
+            _now() if created_at is None else _encode_timestamp(created_at)
+        )
+        self.tasks: dict[int, Task] = {} if tasks is None else tasks
+        # Bumped on every change to the project or any of its tasks, like the
+        # version column of the SQL model.
+        self.version = version
+
+    @classmethod
+    def restore(
+        cls,
+        id: int,
+        name: str,
+        description: str,
+        created_at: str,
+        version: int,
+    ) -> "Project":
+        # Trusted counterpart of __init__, see Task.restore.
+        project = cls.__new__(cls)
+        project.id = id
+        project.name = name
+        project.description = description
+        project._created_at = _encode_timestamp(created_at)
+        project.tasks = {}
+        project.version = version
+        return project
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "Project":
+        # Inverse of to_row, without the tasks; see Task.from_row.
+        project = cls.__new__(cls)
+        (
+            project.id,
+            project.name,
+            project.description,
+            project._created_at,
+            project.version,
+        ) = row
+        project.tasks = {}
+        return project
+
+    def to_row(self) -> tuple:
+        return (
+            self.id,
+            self.name,
+            self.description,
+            self._created_at,
+            self.version,
         )
 
+    @property
+    def created_at(self) -> str:
+        return _decode_timestamp(self._created_at)
+
+    @created_at.setter
+    def created_at(self, value: str) -> None:
+        self._created_at = _encode_timestamp(value)
+
     @property
     def task_count(self) -> int:
         return len(self.tasks)
 
     def update(self, name: Optional[str] = None, description: Optional[str] = None) -> None:
         if name is not None:
-            self.name = Validator.validate_text(name, "project name", 30)
+            self.name = Validator.validate_text(
+                name, "project name", PROJECT_NAME_MAX_LENGTH
+            )
         if description is not None:
             self.description = Validator.validate_text(
-                description, "discription project", 150, allow_empty=True
+                description,
+                "discription project",
+                PROJECT_DESCRIPTION_MAX_LENGTH,
+                allow_empty=True,
             )
 
     def add_task(self, task: Task) -> None:
@@ -100,3 +406,20 @@ class Project:
             "created_at": self.created_at,
             "task_count": self.task_count,
         }
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.to_row() == other.to_row() and self.tasks == other.tasks
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"Project(id={self.id!r}, name={self.name!r}, "
+            f"description={self.description!r}, "
+            f"created_at={self.created_at!r}, tasks={self.tasks!r}, "
+            f"version={self.version!r})"
+        )
@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional
+
+TASK_SORT_KEYS = ("created_at", "-created_at", "deadline", "-deadline")
+
+
+@dataclass(frozen=True)
+class TaskFilter:
+    """
+        Listing criteria shared by the SQL and the in-memory backends.
+
+        `sort` is a field name, prefixed with "-" for descending order.
+        Tasks without a deadline sort after all dated tasks ascending and
+        before them descending, so one order is the exact reverse of the
+        other.
+    """
+
+    statuses: Optional[tuple[str, ...]] = None
+    deadline_from: Optional[date] = None
+    deadline_to: Optional[date] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+    overdue_on: Optional[date] = None
+    sort: str = "created_at"
+
+    @property
+    def sort_field(self) -> str:
+        return self.sort.lstrip("-")
+
+    @property
+    def descending(self) -> bool:
+        return self.sort.startswith("-")
+
+
+@dataclass(frozen=True)
+class TaskShard:
+    """
+        A disjoint slice of the tasks, for jobs that split their work:
+        task ids from `min_id` to `max_id` (inclusive, open when None),
+        and only the tasks of `project_ids` when given.
+    """
+
+    min_id: Optional[int] = None
+    max_id: Optional[int] = None
+    project_ids: Optional[tuple[int, ...]] = None
+
+    def __str__(self) -> str:
+        parts = []
+        if self.min_id is not None or self.max_id is not None:
+            low = "" if self.min_id is None else self.min_id
+            high = "" if self.max_id is None else self.max_id
+            parts.append(f"ids {low}-{high}")
+        if self.project_ids is not None:
+            parts.append(
+                "projects " + ",".join(map(str, self.project_ids))
+            )
+        return " ".join(parts) or "all tasks"
+
+    def contains(self, task_id: int, project_id: int) -> bool:
+        return (
+            (self.min_id is None or task_id >= self.min_id)
+            and (self.max_id is None or task_id <= self.max_id)
+            and (self.project_ids is None or project_id in self.project_ids)
+        )
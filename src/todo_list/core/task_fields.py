@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+from .validators import (
+    TASK_DESCRIPTION_MAX_LENGTH,
+    TASK_TITLE_MAX_LENGTH,
+    Validator,
+)
+
+
+def validate_title(title: str) -> str:
+    return Validator.validate_text(title, "Task title", TASK_TITLE_MAX_LENGTH)
+
+
+def validate_description(description: str) -> str:
+    return Validator.validate_text(
+        description, "Task description", TASK_DESCRIPTION_MAX_LENGTH
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class TaskFields:
+    """
+        The fields of a new task, validated and typed.
+
+        `parse()` builds one from raw values; the request schemas run the
+        same validators and build it directly. Services and repositories
+        take it as it is, so a request is validated exactly once.
+    """
+
+    title: str
+    description: str
+    status: str = "todo"
+    deadline: Optional[date] = None
+
+    @classmethod
+    def parse(
+        cls,
+        title: str,
+        description: str,
+        status: str = "todo",
+        deadline: Optional[str | date] = None,
+    ) -> "TaskFields":
+        return cls(
+            title=validate_title(title),
+            description=validate_description(description),
+            status=Validator.validate_status(status),
+            deadline=Validator.parse_deadline(deadline),
+        )
+
+    def as_row(self) -> dict:
+        return {
+            "title": self.title,
+            "description": self.description,
+            "status": self.status,
+            "deadline": self.deadline,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class TaskChanges:
+    """
+        A validated partial update of a task; None leaves a field as it is.
+    """
+
+    title: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[str] = None
+    deadline: Optional[date] = None
+
+    @classmethod
+    def parse(
+        cls,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[str] = None,
+        deadline: Optional[str | date] = None,
+    ) -> "TaskChanges":
+        return cls(
+            title=validate_title(title) if title is not None else None,
+            description=(
+                validate_description(description)
+                if description is not None
+                else None
+            ),
+            status=(
+                Validator.validate_status(status) if status is not None else None
+            ),
+            deadline=Validator.parse_deadline(deadline),
+        )
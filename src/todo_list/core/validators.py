@@ -1,7 +1,22 @@
-from datetime import datetime
+import re
+from datetime import date
 from typing import Optional
 from .exceptions import ValidationError
 
+# The rules every entry point shares: the request schemas, the services
+# (for the CLI and imports) and the entities.
+TASK_STATUSES = ("todo", "doing", "done")
+TASK_TITLE_MAX_LENGTH = 30
+TASK_DESCRIPTION_MAX_LENGTH = 150
+PROJECT_NAME_MAX_LENGTH = 30
+PROJECT_DESCRIPTION_MAX_LENGTH = 150
+SEARCH_QUERY_MAX_LENGTH = 200
+
+_STATUSES = frozenset(TASK_STATUSES)
+_ALLOWED_STATUSES = ", ".join(sorted(TASK_STATUSES))
+# What strptime("%Y-%m-%d") accepted: unpadded months and days included.
+_DEADLINE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+
 
 class Validator:
 
@@ -28,23 +43,43 @@ class Validator:
     @staticmethod
     def validate_status(status: str) -> str:
 
-        valid_statuses = {"todo", "doing", "done"}
-        if status not in valid_statuses:
+        if status not in _STATUSES:
             raise ValidationError(
-                f"stauts{', '.join(valid_statuses)} be"
+                f"Invalid status '{status}'. Allowed values: {_ALLOWED_STATUSES}"
             )
         return status
 
     @staticmethod
-    def validate_deadline(deadline: Optional[str]) -> Optional[str]:
+    def parse_deadline(deadline: Optional[str | date]) -> Optional[date]:
 
-        if deadline is None:
-            return None
-
-        try:
-            datetime.strptime(deadline, "%Y-%m-%d")
+        # A date has been parsed already; strings take the C fast path of
+        # fromisoformat, and the regex only for the unpadded form.
+        if deadline is None or isinstance(deadline, date):
             return deadline
-        except ValueError:
-            raise ValidationError(
-                "Deadline must be in format YYYY-MM-DD"
-            )
+        if (
+            isinstance(deadline, str)
+            and len(deadline) == 10
+            and deadline[4] == deadline[7] == "-"
+        ):
+            # The dashes rule out the ISO week form ("2024-W05-1").
+            try:
+                return date.fromisoformat(deadline)
+            except ValueError:
+                pass
+        match = (
+            _DEADLINE_RE.fullmatch(deadline)
+            if isinstance(deadline, str)
+            else None
+        )
+        if match is not None:
+            try:
+                return date(*map(int, match.groups()))
+            except ValueError:
+                pass
+        raise ValidationError("Deadline must be in format YYYY-MM-DD")
+
+    @staticmethod
+    def validate_deadline(deadline: Optional[str]) -> Optional[str]:
+
+        Validator.parse_deadline(deadline)
+        return deadline
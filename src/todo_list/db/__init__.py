@@ -1,4 +1,5 @@
 from .base import Base
 from .session import engine, SessionLocal, get_session
+from .unit_of_work import UnitOfWork
 
-__all__ = ["Base", "engine", "SessionLocal", "get_session"]
+__all__ = ["Base", "engine", "SessionLocal", "get_session", "UnitOfWork"]
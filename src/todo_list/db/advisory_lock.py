@@ -0,0 +1,67 @@
+from typing import Optional
+
+from sqlalchemy import Connection, Engine, text
+
+
+class AdvisoryLock:
+    """PostgreSQL session-level advisory lock, to elect one leader."""
+
+    def __init__(self, engine: Engine, key: int) -> None:
+        self._engine = engine
+        self._key = key
+        self._connection: Optional[Connection] = None
+
+    def acquire(self) -> bool:
+        if self._connection is not None:
+            return True
+        # Held on a connection of its own in autocommit mode, so it never
+        # sits idle in a transaction; if that connection breaks, the lock
+        # goes with it and is_held() says so.
+        connection = self._engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        )
+        try:
+            acquired = connection.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": self._key}
+            ).scalar()
+        except Exception:
+            connection.invalidate()
+            connection.close()
+            raise
+        if not acquired:
+            # Followers do not keep a connection out of the pool.
+            connection.close()
+            return False
+        self._connection = connection
+        return True
+
+    def is_held(self) -> bool:
+        if self._connection is None:
+            return False
+        try:
+            self._connection.execute(text("SELECT 1"))
+        except Exception:
+            self._discard()
+            return False
+        return True
+
+    def release(self) -> None:
+        if self._connection is None:
+            return
+        try:
+            self._connection.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": self._key}
+            )
+        except Exception:
+            # Never hand a connection that may still hold the lock back to
+            # the pool.
+            self._discard()
+            return
+        self._connection.close()
+        self._connection = None
+
+    def _discard(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            connection.invalidate()
+            connection.close()
@@ -1,8 +1,68 @@
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Optional
+
 from sqlalchemy import text
 
+from ..core.exceptions import ValidationError
 from .session import engine
 
 
+def _probe_ttl_seconds() -> float:
+    try:
+        return float(os.getenv("DB_PROBE_TTL_SECONDS", "2"))
+    except ValueError:
+        raise ValidationError("DB_PROBE_TTL_SECONDS must be a number")
+
+
+PROBE_TTL_SECONDS = _probe_ttl_seconds()
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    ok: bool
+    latency_ms: float
+    checked_at: float
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+_probe_lock = threading.Lock()
+_last_probe: Optional[ProbeResult] = None
+
+
+def check_connection() -> ProbeResult:
+    started = time.perf_counter()
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1")).scalar_one()
+    except Exception as exc:
+        return ProbeResult(
+            ok=False,
+            latency_ms=(time.perf_counter() - started) * 1000,
+            checked_at=time.time(),
+            error=str(exc),
+        )
+    return ProbeResult(
+        ok=True,
+        latency_ms=(time.perf_counter() - started) * 1000,
+        checked_at=time.time(),
+    )
+
+
+def cached_check_connection(ttl: float = PROBE_TTL_SECONDS) -> ProbeResult:
+    """Probe the database at most once per `ttl` seconds across all callers."""
+    global _last_probe
+    with _probe_lock:
+        if _last_probe is None or time.time() - _last_probe.checked_at >= ttl:
+            _last_probe = check_connection()
+        return _last_probe
+
+
 def main() -> None:
     print("Trying to connect to the database...")
     with engine.connect() as conn:
@@ -0,0 +1,108 @@
+import bisect
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# Upper bounds (milliseconds) of the checkout latency histogram buckets.
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class PoolMetrics:
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+
+    def observe(self, wait_ms: float, error: Exception | None = None) -> None:
+        index = bisect.bisect_left(LATENCY_BUCKETS_MS, wait_ms)
+        with self._lock:
+            self._buckets[index] += 1
+            self.wait_ms_total += wait_ms
+            self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+            if error is None:
+                self.checkouts += 1
+            elif isinstance(error, exc.TimeoutError):
+                self.timeouts += 1
+            else:
+                self.errors += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            buckets = list(self._buckets)
+            observed = self.checkouts + self.timeouts + self.errors
+            result = {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "errors": self.errors,
+                "wait_ms_total": round(self.wait_ms_total, 3),
+                "wait_ms_avg": round(self.wait_ms_total / observed, 3)
+                if observed
+                else 0.0,
+                "wait_ms_max": round(self.wait_ms_max, 3),
+            }
+
+        histogram: dict[str, int] = {}
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, buckets):
+            cumulative += count
+            histogram[f"le_{bound}ms"] = cumulative
+        histogram["le_inf"] = cumulative + buckets[-1]
+        result["checkout_latency_histogram"] = histogram
+        return result
+
+
+class _InstrumentedPoolMixin:
+    """Times every `Pool.connect()`, i.e. how long callers wait for a connection."""
+
+    metrics: PoolMetrics
+
+    def connect(self):  # type: ignore[no-untyped-def]
+        started = time.perf_counter()
+        try:
+            connection = super().connect()  # type: ignore[misc]
+        except Exception as error:
+            self.metrics.observe((time.perf_counter() - started) * 1000, error)
+            raise
+        self.metrics.observe((time.perf_counter() - started) * 1000)
+        return connection
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+
+class InstrumentedAsyncAdaptedQueuePool(
+    _InstrumentedPoolMixin, AsyncAdaptedQueuePool
+):
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+
+def pool_status(engine: Engine) -> dict[str, Any]:
+    pool: Pool = engine.pool
+    status: dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    metrics = getattr(pool, "metrics", None)
+    if isinstance(metrics, PoolMetrics):
+        status.update(metrics.snapshot())
+    return status
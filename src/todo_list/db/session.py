@@ -6,6 +6,9 @@ from sqlalchemy.orm import sessionmaker, Session
 
 from dotenv import load_dotenv
 
+from ..core.exceptions import ValidationError
+from .pool_metrics import InstrumentedQueuePool
+
 load_dotenv()
 
 POSTGRES_DB = os.getenv("POSTGRES_DB", "todolist")
@@ -19,10 +22,33 @@ DATABASE_URL = (
     f"@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
 )
 
+
+
+def _int_from_env(name: str, default: int) -> int:
+    raw = os.getenv(name, str(default))
+    try:
+        return int(raw)
+    except ValueError:
+        raise ValidationError(f"{name} must be an integer")
+
+
+def pool_options() -> dict:
+    return {
+        "pool_size": _int_from_env("DB_POOL_SIZE", 5),
+        "max_overflow": _int_from_env("DB_MAX_OVERFLOW", 10),
+        "pool_timeout": _int_from_env("DB_POOL_TIMEOUT", 30),
+        "pool_recycle": _int_from_env("DB_POOL_RECYCLE", 1800),
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower()
+        in {"1", "true", "yes"},
+    }
+
+
 engine = create_engine(
     DATABASE_URL,
     echo=False,
     future=True,
+    poolclass=InstrumentedQueuePool,
+    **pool_options(),
 )
 
 SessionLocal = sessionmaker(
@@ -0,0 +1,453 @@
+import heapq
+from datetime import date, datetime
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+from ..core.entities import Project, Task
+from ..core.exceptions import NotFoundError, ValidationError
+from ..core.filters import TaskFilter, TaskShard
+from ..core.task_fields import TaskChanges
+from ..repositories.pagination import (
+    Page,
+    build_page,
+    decode_created_at_cursor,
+    decode_cursor,
+    encode_cursor,
+)
+from .storage.in_memory_storage import InMemoryStorage
+
+
+def _ordinal(value: Optional[date]) -> Optional[int]:
+    return value.toordinal() if value is not None else None
+
+
+def _created_at_key(item: Project | Task) -> tuple:
+    return (item.created_at, item.id)
+
+
+def _deadline_key(task: Task) -> tuple:
+    # The storage's deadline order: undated tasks last ascending, first
+    # descending.
+    return (task.deadline_day is None, task.deadline_day or 0, task.id)
+
+
+def _keyset_page(
+    items: Iterable[Any],
+    limit: int,
+    is_after: Optional[Callable[[Any], bool]],
+) -> List[Any]:
+    # Items arrive in page order, so the cursor only has to skip ahead.
+    rows: List[Any] = []
+    for item in items:
+        if is_after is not None and not is_after(item):
+            continue
+        rows.append(item)
+        if len(rows) > limit:
+            break
+    return rows
+
+
+class StatusCount(NamedTuple):
+    project_id: int
+    status: Optional[str]
+    total: int
+    overdue: int
+
+
+class InMemoryProjectRepository:
+    """
+        `ProjectRepositoryProtocol` over an `InMemoryStorage`.
+
+        Changes are applied to the storage immediately, there is no
+        transaction to commit or roll back.
+    """
+
+    def __init__(self, storage: InMemoryStorage) -> None:
+        self._storage = storage
+
+    def create(self, name: str, description: str) -> Project:
+        return self._storage.create_project(name, description)
+
+    def get_by_id(
+        self,
+        project_id: int,
+        *,
+        cached: bool = True,
+        version: Optional[int] = None,
+    ) -> Project:
+        return self._storage.get_project(project_id)
+
+    def count(self) -> int:
+        return self._storage.count_projects()
+
+    def get_version(self, project_id: int) -> int:
+        return self._storage.get_project(project_id).version
+
+    def list_fingerprint(self) -> tuple[int, int, int]:
+        projects = self._storage.get_all_projects()
+        return (
+            len(projects),
+            sum(p.version for p in projects),
+            max((p.id for p in projects), default=0),
+        )
+
+    def status_counts(
+        self,
+        today: date,
+        project_id: Optional[int] = None,
+    ) -> List[StatusCount]:
+        if project_id is None:
+            projects = self._storage.get_all_projects()
+        else:
+            try:
+                projects = [self._storage.get_project(project_id)]
+            except NotFoundError:
+                return []
+
+        day = today.toordinal()
+        rows: List[StatusCount] = []
+        for project in projects:
+            totals: dict[str, int] = {}
+            overdue: dict[str, int] = {}
+            for task in list(project.tasks.values()):
+                totals[task.status] = totals.get(task.status, 0) + 1
+                if (
+                    task.status != "done"
+                    and task.deadline_day is not None
+                    and task.deadline_day < day
+                ):
+                    overdue[task.status] = overdue.get(task.status, 0) + 1
+            if not totals:
+                rows.append(StatusCount(project.id, None, 0, 0))
+            rows.extend(
+                StatusCount(project.id, status, total, overdue.get(status, 0))
+                for status, total in totals.items()
+            )
+        return rows
+
+    def list_all(self) -> List[Project]:
+        return self._storage.get_all_projects()
+
+    def list_page(
+        self,
+        *,
+        limit: int,
+        after: Optional[str] = None,
+    ) -> Page[Project]:
+        is_after = None
+        if after is not None:
+            is_after = self._after_cursor(after)
+        rows = _keyset_page(self._storage.get_all_projects(), limit, is_after)
+        return build_page(rows, limit, "created_at", "id")
+
+    def _after_cursor(self, after: str) -> Callable[[Project], bool]:
+        created_at, project_id = decode_created_at_cursor(after)
+        cursor = (created_at.isoformat(), project_id)
+        return lambda project: _created_at_key(project) > cursor
+
+    def update(
+        self,
+        project_id: int,
+        *,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Project:
+        return self._storage.update_project(
+            project_id, name=name, description=description
+        )
+
+    def delete(self, project_id: int) -> None:
+        self._storage.delete_project(project_id)
+
+
+class InMemoryTaskRepository:
+    """
+        `TaskRepositoryProtocol` over an `InMemoryStorage`.
+
+        Changes go through the storage, which keeps its indexes in step;
+        tasks handed out are the stored ones and are not changed directly.
+    """
+
+    def __init__(self, storage: InMemoryStorage) -> None:
+        self._storage = storage
+
+    def create(
+        self,
+        project_id: int,
+        title: str,
+        description: str,
+        *,
+        status: str = "todo",
+        deadline: Optional[date] = None,
+    ) -> Task:
+        return self._storage.create_task(
+            project_id,
+            title,
+            description,
+            status=status,
+            deadline=deadline,
+        )
+
+    def create_many(
+        self,
+        project_id: int,
+        rows: Sequence[Mapping[str, Any]],
+    ) -> List[Task]:
+        return [self.create(project_id, **row) for row in rows]
+
+    def import_rows(
+        self,
+        project_id: int,
+        rows: Sequence[Mapping[str, Any]],
+    ) -> int:
+        return len(self.create_many(project_id, rows))
+
+    def get_version(self, task_id: int) -> tuple[int, int]:
+        task = self._storage.get_task(task_id)
+        project = self._storage.get_project(task.project_id)
+        return project.id, project.version
+
+    def get_by_id(
+        self,
+        task_id: int,
+        *,
+        cached: bool = True,
+        version: Optional[int] = None,
+    ) -> Task:
+        return self._storage.get_task(task_id)
+
+    def list_by_project(self, project_id: int) -> List[Task]:
+        return self._storage.get_project_tasks(project_id)
+
+    def list_page_by_project(
+        self,
+        project_id: int,
+        *,
+        limit: int,
+        after: Optional[str] = None,
+        filters: Optional[TaskFilter] = None,
+    ) -> Page[Task]:
+        if filters is None:
+            filters = TaskFilter()
+
+        tasks = self._storage.get_project_tasks(project_id, filters)
+        is_after = None
+        if after is not None:
+            is_after = self._after_cursor(filters, after)
+        rows = _keyset_page(tasks, limit, is_after)
+        return build_page(
+            rows, limit, filters.sort_field, "id", prefix=(filters.sort,)
+        )
+
+    def _after_cursor(
+        self,
+        filters: TaskFilter,
+        after: str,
+    ) -> Callable[[Task], bool]:
+        sort, value, task_id = decode_cursor(after, 3)
+        if sort != filters.sort:
+            raise ValidationError("Pagination cursor belongs to another sort")
+        try:
+            task_id = int(task_id)
+            if filters.sort_field == "created_at":
+                value = datetime.fromisoformat(value).isoformat()
+            elif value is not None:
+                value = date.fromisoformat(value).toordinal()
+        except (TypeError, ValueError):
+            raise ValidationError("Invalid pagination cursor")
+
+        if filters.sort_field == "created_at":
+            key, cursor = _created_at_key, (value, task_id)
+        else:
+            key, cursor = _deadline_key, (value is None, value or 0, task_id)
+        if filters.descending:
+            return lambda task: key(task) < cursor
+        return lambda task: key(task) > cursor
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int,
+        after: Optional[str] = None,
+        project_id: Optional[int] = None,
+    ) -> Page[Task]:
+        ranked = self._storage.search_tasks_ranked(query, project_id)
+        is_after = None
+        if after is not None:
+            is_after = self._after_rank_cursor(after)
+        rows = _keyset_page(ranked, limit, is_after)
+        next_cursor = None
+        if len(rows) > limit:
+            rank, task = rows[limit - 1]
+            next_cursor = encode_cursor(rank, task.id)
+        return Page(
+            items=[task for _, task in rows[:limit]],
+            next_cursor=next_cursor,
+        )
+
+    def _after_rank_cursor(
+        self,
+        after: str,
+    ) -> Callable[[tuple[float, Task]], bool]:
+        rank_after, id_after = decode_cursor(after, 2)
+        try:
+            rank_after, id_after = float(rank_after), int(id_after)
+        except (TypeError, ValueError):
+            raise ValidationError("Invalid pagination cursor")
+
+        def is_after(item: tuple[float, Task]) -> bool:
+            rank, task = item
+            return rank < rank_after or (
+                rank == rank_after and task.id > id_after
+            )
+
+        return is_after
+
+    def stream_by_project(
+        self,
+        project_id: int,
+        *,
+        batch_size: int,
+    ) -> Iterator[Sequence[Task]]:
+        tasks = self._storage.get_project_tasks(project_id)
+        for start in range(0, len(tasks), batch_size):
+            yield tasks[start:start + batch_size]
+
+    def update(
+        self,
+        task_id: int,
+        changes: TaskChanges,
+        *,
+        closed_at: Optional[datetime] = None,
+    ) -> Task:
+        # Only the changed fields, in one call under the stripe lock, so
+        # concurrent updates of different fields do not undo each other.
+        return self._storage.update_task(
+            task_id,
+            title=changes.title,
+            description=changes.description,
+            status=changes.status,
+            deadline=changes.deadline,
+            closed_at=closed_at.isoformat() if closed_at is not None else None,
+        )
+
+    def delete(self, task_id: int) -> None:
+        self._storage.delete_task(task_id)
+
+    def get_overdue_tasks(self, now: datetime) -> List[Task]:
+        return self._storage.get_overdue_tasks(now.date())
+
+    def count_overdue(
+        self,
+        today: date,
+        shard: Optional[TaskShard] = None,
+    ) -> int:
+        return len(self._storage.get_overdue_task_ids(today, shard))
+
+    def overdue_project_ids(self, today: date) -> List[int]:
+        tasks = self._storage.get_overdue_tasks(today)
+        return sorted({t.project_id for t in tasks})
+
+    def overdue_id_range(self, today: date) -> Optional[tuple[int, int]]:
+        ids = self._storage.get_overdue_task_ids(today)
+        return (min(ids), max(ids)) if ids else None
+
+    def close_overdue(
+        self,
+        today: date,
+        closed_at: datetime,
+        *,
+        limit: int,
+        shard: Optional[TaskShard] = None,
+    ) -> List[int]:
+        # The lowest ids first, like the SQL repository. Closed tasks leave
+        # the storage's overdue index, so each chunk only looks at the
+        # tasks still open.
+        ids = heapq.nsmallest(
+            limit, self._storage.get_overdue_task_ids(today, shard)
+        )
+        tasks = [task for task in map(self._find_task, ids) if task is not None]
+        return self._set_status(tasks, "done", closed_at)
+
+    def upcoming_deadlines(self, today: date) -> List[date]:
+        days = self._storage.get_upcoming_deadline_days(today)
+        return [date.fromordinal(day) for day in days]
+
+    def bulk_set_status(
+        self,
+        status: str,
+        closed_at: Optional[datetime],
+        *,
+        ids: Optional[Sequence[int]] = None,
+        project_id: Optional[int] = None,
+        current_status: Optional[str] = None,
+        deadline_from: Optional[date] = None,
+        deadline_to: Optional[date] = None,
+    ) -> List[int]:
+        # Start from the narrowest index the criteria allow.
+        if ids is not None:
+            candidates: Iterable[Task] = (
+                task
+                for task in map(self._find_task, dict.fromkeys(ids))
+                if task is not None
+                and (project_id is None or task.project_id == project_id)
+            )
+        elif current_status is not None:
+            candidates = self._storage.get_tasks_by_status(
+                current_status, project_id
+            )
+        elif project_id is not None:
+            candidates = self._storage.get_project_tasks(project_id)
+        else:
+            candidates = [
+                task
+                for project in self._storage.get_all_projects()
+                for task in list(project.tasks.values())
+            ]
+
+        deadline_from_day = _ordinal(deadline_from)
+        deadline_to_day = _ordinal(deadline_to)
+        tasks = [
+            task
+            for task in candidates
+            if task.status != status
+            and (current_status is None or task.status == current_status)
+            and (
+                deadline_from_day is None
+                or (task.deadline_day is not None
+                    and task.deadline_day >= deadline_from_day)
+            )
+            and (
+                deadline_to_day is None
+                or (task.deadline_day is not None
+                    and task.deadline_day <= deadline_to_day)
+            )
+        ]
+        return self._set_status(tasks, status, closed_at)
+
+    def _find_task(self, task_id: int) -> Optional[Task]:
+        try:
+            return self._storage.get_task(task_id)
+        except NotFoundError:
+            return None
+
+    def _set_status(
+        self,
+        tasks: Sequence[Task],
+        status: str,
+        closed_at: Optional[datetime],
+    ) -> List[int]:
+        closed_at_iso = closed_at.isoformat() if closed_at is not None else None
+        for task in tasks:
+            self._storage.set_task_status(task.id, status, closed_at_iso)
+        return [task.id for task in tasks]
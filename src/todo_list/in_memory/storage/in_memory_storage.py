@@ -1,8 +1,15 @@
-from typing import Dict, List, Optional
+import heapq
+import threading
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 import os
+import re
 
-from ..core.entities import Project, Task
-from ..core.exceptions import (
+from ...core.entities import Project, Task
+from ...core.filters import TaskFilter, TaskShard
+from ...core.exceptions import (
     DuplicateError,
     LimitExceededError,
     NotFoundError,
@@ -12,163 +19,667 @@ from ..core.exceptions import (
 MAX_NUMBER_OF_PROJECTS = int(os.getenv("MAX_NUMBER_OF_PROJECTS", "100"))
 MAX_NUMBER_OF_TASKS = int(os.getenv("MAX_NUMBER_OF_TASKS", "1000"))
 
+DEFAULT_LOCK_STRIPES = 64
+
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _iso(value: Optional[date]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _ordinal(value: Optional[date]) -> Optional[int]:
+    return value.toordinal() if value is not None else None
+
+
+def _tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _task_tokens(task: Task) -> List[str]:
+    return _tokenize(f"{task.title} {task.description}")
+
+
+class _Stripe:
+    """
+        The lock shared by a group of projects, and the deadline index of
+        their tasks, which only changes under that lock.
+    """
+
+    __slots__ = ("lock", "task_count", "deadline_heap", "overdue", "overdue_as_of")
 
-class InMemoryStorage:
-    
     def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.task_count = 0
+        # (deadline as a day ordinal, task id) min-heap. Entries are never
+        # removed in place: a deleted task or a changed deadline leaves a
+        # stale entry that is recognised and dropped when it reaches the top.
+        self.deadline_heap: List[tuple[int, int]] = []
+        # ids of the open tasks already popped off the heap as overdue, and
+        # the day (ordinal) that was checked against
+        self.overdue: Dict[int, None] = {}
+        self.overdue_as_of: Optional[int] = None
+
+
+class InMemoryStorage:
+    """Projects and tasks held in process memory, safe for concurrent use."""
+
+    # Project creation, renames and deletion take the global names lock;
+    # task changes take the owning project's stripe lock. Readers take no
+    # locks and may see a task halfway through an update. Task fields are
+    # stored as given: the services validate them (see core.task_fields).
+
+    def __init__(
+        self,
+        max_projects: Optional[int] = None,
+        max_tasks: Optional[int] = None,
+        lock_stripes: int = DEFAULT_LOCK_STRIPES,
+    ) -> None:
+        self._max_projects = (
+            MAX_NUMBER_OF_PROJECTS if max_projects is None else max_projects
+        )
+        self._max_tasks = MAX_NUMBER_OF_TASKS if max_tasks is None else max_tasks
         self._projects: Dict[int, Project] = {}
         self._tasks: Dict[int, Task] = {}
         self._project_counter: int = 0
         self._task_counter: int = 0
         self._project_names: set[str] = set()
-    
+        self._names_lock = threading.Lock()
+        self._task_counter_lock = threading.Lock()
+        # Tasks stored plus tasks being created, checked against the limit
+        # and taken in one step so concurrent creates cannot overshoot it.
+        self._task_slots = 0
+        self._task_slots_lock = threading.Lock()
+        self._stripes = [_Stripe() for _ in range(max(1, lock_stripes))]
+        # Secondary indexes, kept in step with every mutation:
+        # task id -> owning project id
+        self._task_projects: Dict[int, int] = {}
+        # status -> ids of the tasks in it (dicts as insertion-ordered sets)
+        self._status_index: Dict[str, Dict[int, None]] = {}
+        # token -> ids of the tasks whose title or description contain it,
+        # each token guarded by one of the token locks
+        self._token_index: Dict[str, set[int]] = {}
+        self._token_locks = [threading.Lock() for _ in range(len(self._stripes))]
+
+    def _stripe(self, project_id: int) -> _Stripe:
+        return self._stripes[project_id % len(self._stripes)]
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        # Every writer lock, in the one order writers take them (names
+        # first, then stripes), for a consistent view of the whole state.
+        with ExitStack() as stack:
+            stack.enter_context(self._names_lock)
+            for stripe in self._stripes:
+                stack.enter_context(stripe.lock)
+            yield
+
+    def _record(self, operation: str, *args: Any) -> None:
+        # Called with every change, inside the lock that serialised it, so
+        # changes to one project are recorded in the order they were made.
+        # Persistence hooks in here; plain storage records nothing.
+        pass
+
     def _get_next_project_id(self) -> int:
         self._project_counter += 1
         return self._project_counter
-    
+
     def _get_next_task_id(self) -> int:
-        self._task_counter += 1
-        return self._task_counter
-    
-    
+        with self._task_counter_lock:
+            self._task_counter += 1
+            return self._task_counter
+
+    def _reserve_task_slot(self) -> None:
+        with self._task_slots_lock:
+            if self._task_slots >= self._max_tasks:
+                raise LimitExceededError(
+                    f"Task limit reached ({self._max_tasks})"
+                )
+            self._task_slots += 1
+
+    def _count_tasks(self, delta: int) -> None:
+        with self._task_slots_lock:
+            self._task_slots += delta
+
+    def _insert_project(self, project: Project) -> None:
+        self._projects[project.id] = project
+        self._project_names.add(project.name)
+
+    def _insert_task(self, task: Task) -> None:
+        self._tasks[task.id] = task
+        self._projects[task.project_id].add_task(task)
+        self._index_task(task, task.project_id)
+
+    def _insert_tasks(self, tasks: Iterable[Task]) -> None:
+        # Bulk _insert_task for restoring saved state: the same structures,
+        # built with local lookups and one heapify per stripe instead of a
+        # heap push per task. Not for use while other threads run.
+        all_tasks = self._tasks
+        projects = self._projects
+        task_projects = self._task_projects
+        status_index = self._status_index
+        token_index = self._token_index
+        stripes = self._stripes
+        findall = _TOKEN_RE.findall
+        count = 0
+        for task in tasks:
+            count += 1
+            task_id = task.id
+            all_tasks[task_id] = task
+            projects[task.project_id].tasks[task_id] = task
+            task_projects[task_id] = task.project_id
+            stripe = stripes[task.project_id % len(stripes)]
+            stripe.task_count += 1
+            bucket = status_index.get(task.status)
+            if bucket is None:
+                bucket = status_index[task.status] = {}
+            bucket[task_id] = None
+            if task.deadline_day is not None:
+                stripe.deadline_heap.append((task.deadline_day, task_id))
+            for token in set(
+                findall(f"{task.title} {task.description}".lower())
+            ):
+                postings = token_index.get(token)
+                if postings is None:
+                    token_index[token] = {task_id}
+                else:
+                    postings.add(task_id)
+        for stripe in stripes:
+            heapq.heapify(stripe.deadline_heap)
+        self._count_tasks(count)
+
+    def _index_task(self, task: Task, project_id: int) -> None:
+        self._task_projects[task.id] = project_id
+        self._status_index.setdefault(task.status, {})[task.id] = None
+        stripe = self._stripe(project_id)
+        stripe.task_count += 1
+        if task.deadline_day is not None:
+            self._push_deadline(stripe, task)
+        self._index_tokens(task.id, set(_task_tokens(task)))
+
+    def _unindex_task(self, task: Task) -> None:
+        stripe = self._stripe(self._task_projects.pop(task.id))
+        stripe.task_count -= 1
+        stripe.overdue.pop(task.id, None)
+        del self._status_index[task.status][task.id]
+        self._unindex_tokens(task.id, set(_task_tokens(task)))
+
+    def _push_deadline(self, stripe: _Stripe, task: Task) -> None:
+        # Compact once stale entries outnumber the live tasks, so churn on
+        # deadlines cannot grow the heap without bound.
+        if len(stripe.deadline_heap) > 2 * stripe.task_count + 64:
+            self._rebuild_deadline_heap(stripe)
+        heapq.heappush(stripe.deadline_heap, (task.deadline_day, task.id))
+
+    def _token_lock(self, token: str) -> threading.Lock:
+        return self._token_locks[hash(token) % len(self._token_locks)]
+
+    def _index_tokens(self, task_id: int, tokens: set[str]) -> None:
+        for token in tokens:
+            with self._token_lock(token):
+                self._token_index.setdefault(token, set()).add(task_id)
+
+    def _unindex_tokens(self, task_id: int, tokens: set[str]) -> None:
+        for token in tokens:
+            with self._token_lock(token):
+                task_ids = self._token_index.get(token)
+                if task_ids is not None:
+                    task_ids.discard(task_id)
+                    if not task_ids:
+                        del self._token_index[token]
+
+
     def create_project(self, name: str, description: str) -> Project:
-     
-        if len(self._projects) >= MAX_NUMBER_OF_PROJECTS:
-            raise LimitExceededError(
-                f"Project limit reached ({MAX_NUMBER_OF_PROJECTS})"
+
+        with self._names_lock:
+            if len(self._projects) >= self._max_projects:
+                raise LimitExceededError(
+                    f"Project limit reached ({self._max_projects})"
+                )
+
+            if name in self._project_names:
+                raise DuplicateError(
+                    f"Project with name '{name}' already exists"
+                )
+
+            project_id = self._get_next_project_id()
+            project = Project(id=project_id, name=name, description=description)
+            # Recorded before it becomes visible, ahead of its first task.
+            self._record(
+                "project+",
+                project.id,
+                project.name,
+                project.description,
+                project.created_at,
             )
-        
-        if name in self._project_names:
-            raise DuplicateError(f"Project with name '{name}' already exists")
-        
-        project_id = self._get_next_project_id()
-        project = Project(id=project_id, name=name, description=description)
-        
-        self._projects[project_id] = project
-        self._project_names.add(name)
-        
+            self._insert_project(project)
+
         return project
-    
+
     def get_project(self, project_id: int) -> Project:
-     
-        if project_id not in self._projects:
+
+        project = self._projects.get(project_id)
+        if project is None:
             raise NotFoundError(f"Project with ID {project_id} not found")
-        return self._projects[project_id]
-    
+        return project
+
     def update_project(
         self, project_id: int, name: Optional[str] = None, description: Optional[str] = None
     ) -> Project:
-        
-      
-        project = self.get_project(project_id)
-        
-        old_name = project.name
-        new_name = name if name is not None else old_name
-        
-        if new_name != old_name and new_name in self._project_names:
-            raise DuplicateError(f"Project with name '{new_name}' already exists")
-        
-        project.update(name=name, description=description)
-        
-        if new_name != old_name:
-            self._project_names.remove(old_name)
-            self._project_names.add(new_name)
-        
+
+        with self._names_lock, self._stripe(project_id).lock:
+            project = self.get_project(project_id)
+
+            old_name = project.name
+            new_name = name if name is not None else old_name
+
+            if new_name != old_name and new_name in self._project_names:
+                raise DuplicateError(
+                    f"Project with name '{new_name}' already exists"
+                )
+
+            project.update(name=name, description=description)
+            project.version += 1
+
+            if new_name != old_name:
+                self._project_names.remove(old_name)
+                self._project_names.add(new_name)
+            self._record(
+                "project=", project.id, project.name, project.description
+            )
+
         return project
-    
+
     def delete_project(self, project_id: int) -> None:
-        
-        project = self.get_project(project_id)
-        
-        for task_id in list(project.tasks.keys()):
-            del self._tasks[task_id]
-            project.remove_task(task_id)
-        
-        self._project_names.remove(project.name)
-        del self._projects[project_id]
-    
+
+        with self._names_lock, self._stripe(project_id).lock:
+            project = self.get_project(project_id)
+
+            task_ids = list(project.tasks.keys())
+            for task_id in task_ids:
+                self._unindex_task(self._tasks.pop(task_id))
+                project.remove_task(task_id)
+            self._count_tasks(-len(task_ids))
+
+            self._project_names.remove(project.name)
+            del self._projects[project_id]
+            self._record("project-", project_id)
+
+    def count_projects(self) -> int:
+
+        return len(self._projects)
+
     def get_all_projects(self) -> List[Project]:
-      
-        return sorted(
-            self._projects.values(),
-            key=lambda p: p.created_at
-        )
-    
-    
+
+        # Projects are stored in creation order, which is created_at order.
+        return list(self._projects.values())
+
+
     def create_task(
         self,
         project_id: int,
         title: str,
         description: str,
         status: str = "todo",
-        deadline: Optional[str] = None,
+        deadline: Optional[str | date] = None,
     ) -> Task:
-        
-      
-        if len(self._tasks) >= MAX_NUMBER_OF_TASKS:
-            raise LimitExceededError(
-                f"Task limit reached ({MAX_NUMBER_OF_TASKS})"
-            )
-        
-        project = self.get_project(project_id)
-        
-        task_id = self._get_next_task_id()
-        task = Task(
-            id=task_id,
-            title=title,
-            description=description,
-            status=status,
-            deadline=deadline,
-        )
-        
-        self._tasks[task_id] = task
-        project.add_task(task)
-        
+
+        self._reserve_task_slot()
+        try:
+            with self._stripe(project_id).lock:
+                project = self.get_project(project_id)
+
+                task = Task.create_trusted(
+                    self._get_next_task_id(),
+                    title,
+                    description,
+                    status,
+                    deadline,
+                    project_id,
+                )
+
+                # Recorded before it becomes visible, like a new project,
+                # so a failed log write leaves nothing to undo.
+                self._record(
+                    "task+",
+                    task.id,
+                    task.title,
+                    task.description,
+                    task.status,
+                    task.deadline,
+                    task.created_at,
+                    task.project_id,
+                )
+                self._insert_task(task)
+                project.version += 1
+        except BaseException:
+            # Gives the reserved slot back.
+            self._count_tasks(-1)
+            raise
+
         return task
-    
+
     def get_task(self, task_id: int) -> Task:
- 
-        if task_id not in self._tasks:
+
+        task = self._tasks.get(task_id)
+        if task is None:
+            raise NotFoundError(f"Task with ID {task_id} not found")
+        return task
+
+    @contextmanager
+    def _locked_task(self, task_id: int) -> Iterator[Task]:
+        # The owner is looked up before locking; a project never changes,
+        # but the task may have been deleted in the meantime.
+        project_id = self._task_projects.get(task_id)
+        if project_id is None:
             raise NotFoundError(f"Task with ID {task_id} not found")
-        return self._tasks[task_id]
-    
+        with self._stripe(project_id).lock:
+            yield self.get_task(task_id)
+
     def update_task(
         self,
         task_id: int,
         title: Optional[str] = None,
         description: Optional[str] = None,
         status: Optional[str] = None,
-        deadline: Optional[str] = None,
+        deadline: Optional[str | date] = None,
+        closed_at: Optional[str] = None,
+    ) -> Task:
+        # closed_at is stamped if the status becomes "done" (now when not
+        # given) and cleared if it changes to anything else.
+        with self._locked_task(task_id) as task:
+            old_status = task.status
+            try:
+                return self._update_task(
+                    task, title, description, status, deadline
+                )
+            finally:
+                if task.status != old_status:
+                    if task.status != "done":
+                        task.closed_at = None
+                    elif closed_at is not None:
+                        task.closed_at = closed_at
+                    else:
+                        task.closed_at = datetime.utcnow().isoformat()
+                self._record_task_state(task)
+
+    def set_task_status(
+        self, task_id: int, status: str, closed_at: Optional[str]
+    ) -> Task:
+
+        with self._locked_task(task_id) as task:
+            try:
+                self._update_task(task, status=status)
+                task.closed_at = closed_at
+            finally:
+                self._record_task_state(task)
+        return task
+
+    def _record_task_state(self, task: Task) -> None:
+        # The resulting state, not the request: a failed update can still
+        # have changed some fields (and the project version).
+        self._record(
+            "task=",
+            task.id,
+            task.title,
+            task.description,
+            task.status,
+            task.deadline,
+            task.closed_at,
+        )
+
+    def _update_task(
+        self,
+        task: Task,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[str] = None,
+        deadline: Optional[str | date] = None,
     ) -> Task:
-  
-        task = self.get_task(task_id)
-        task.update(
-            title=title,
-            description=description,
-            status=status,
-            deadline=deadline,
+
+        old_status = task.status
+        old_deadline = task.deadline_day
+        old_tokens = (
+            set(_task_tokens(task))
+            if title is not None or description is not None
+            else None
         )
+        # Task.update_trusted assigns field by field, so a bad deadline can
+        # leave it partially updated; the indexes follow either way.
+        try:
+            task.update_trusted(
+                title=title,
+                description=description,
+                status=status,
+                deadline=deadline,
+            )
+        finally:
+            if task.status != old_status:
+                del self._status_index[old_status][task.id]
+                self._status_index.setdefault(task.status, {})[task.id] = None
+            stripe = self._stripe(task.project_id)
+            if task.deadline_day != old_deadline:
+                stripe.overdue.pop(task.id, None)
+                if task.deadline_day is not None:
+                    self._push_deadline(stripe, task)
+            elif task.status == "done":
+                stripe.overdue.pop(task.id, None)
+            elif (
+                old_status == "done"
+                and task.deadline_day is not None
+                and stripe.overdue_as_of is not None
+                and task.deadline_day < stripe.overdue_as_of
+            ):
+                # Reopened after its heap entry was popped.
+                stripe.overdue[task.id] = None
+            if old_tokens is not None:
+                new_tokens = set(_task_tokens(task))
+                self._unindex_tokens(task.id, old_tokens - new_tokens)
+                self._index_tokens(task.id, new_tokens - old_tokens)
+            self._projects[task.project_id].version += 1
         return task
-    
+
     def delete_task(self, task_id: int) -> None:
-    
-        task = self.get_task(task_id)
-        
-        for project in self._projects.values():
-            if task_id in project.tasks:
-                project.remove_task(task_id)
-                break
-        
-        del self._tasks[task_id]
-    
-    def get_project_tasks(self, project_id: int) -> List[Task]:
-        
+
+        with self._locked_task(task_id) as task:
+            project = self._projects[task.project_id]
+            project.remove_task(task_id)
+            project.version += 1
+
+            self._unindex_task(task)
+            del self._tasks[task_id]
+            self._count_tasks(-1)
+            self._record("task-", task_id)
+
+    def get_project_tasks(
+        self, project_id: int, filters: Optional[TaskFilter] = None
+    ) -> List[Task]:
+
         project = self.get_project(project_id)
+        # Tasks are stored in creation order, which is created_at order.
+        tasks = list(project.tasks.values())
+        if filters is None:
+            return tasks
+
+        # The bounds are converted once: deadlines are compared as day
+        # ordinals, creation times as ISO strings.
+        statuses = set(filters.statuses) if filters.statuses else None
+        deadline_from = _ordinal(filters.deadline_from)
+        deadline_to = _ordinal(filters.deadline_to)
+        created_from = _iso(filters.created_from)
+        created_to = _iso(filters.created_to)
+        overdue_on = _ordinal(filters.overdue_on)
+
+        matching = []
+        for task in tasks:
+            if statuses is not None and task.status not in statuses:
+                continue
+            if deadline_from is not None and (
+                task.deadline_day is None or task.deadline_day < deadline_from
+            ):
+                continue
+            if deadline_to is not None and (
+                task.deadline_day is None or task.deadline_day > deadline_to
+            ):
+                continue
+            if created_from is not None and task.created_at < created_from:
+                continue
+            if created_to is not None and task.created_at > created_to:
+                continue
+            if overdue_on is not None and (
+                task.status == "done"
+                or task.deadline_day is None
+                or task.deadline_day >= overdue_on
+            ):
+                continue
+            matching.append(task)
+
+        if filters.sort_field == "deadline":
+            # Same order as the SQL backend: undated tasks last ascending,
+            # first descending.
+            matching.sort(
+                key=lambda t: (t.deadline_day is None, t.deadline_day or 0, t.id),
+                reverse=filters.descending,
+            )
+        elif filters.descending:
+            matching.reverse()
+        return matching
+
+    def get_tasks_by_status(
+        self, status: str, project_id: Optional[int] = None
+    ) -> List[Task]:
+
+        task_ids = list(self._status_index.get(status, ()))
+        if project_id is None:
+            tasks = map(self._tasks.get, task_ids)
+            return [t for t in tasks if t is not None and t.status == status]
+
+        # Walk whichever side is smaller.
+        project_tasks = self.get_project(project_id).tasks
+        if len(project_tasks) < len(task_ids):
+            return [
+                t for t in list(project_tasks.values()) if t.status == status
+            ]
+        tasks = map(project_tasks.get, task_ids)
+        return [t for t in tasks if t is not None and t.status == status]
+
+    def get_overdue_tasks(self, today: Optional[date] = None) -> List[Task]:
+
+        tasks = [
+            task
+            for task in map(self._tasks.get, self.get_overdue_task_ids(today))
+            if task is not None and task.status != "done"
+        ]
+        tasks.sort(key=lambda t: (t.deadline_day, t.id))
+        return tasks
+
+    def get_overdue_task_ids(
+        self,
+        today: Optional[date] = None,
+        shard: Optional[TaskShard] = None,
+    ) -> List[int]:
+
+        # In no particular order. Advancing a heap changes it, so this takes
+        # the stripe locks, one at a time and only for the pops.
+        day = (today or date.today()).toordinal()
+        task_ids: List[int] = []
+        for stripe in self._stripes:
+            with stripe.lock:
+                task_ids.extend(self._advance_overdue(stripe, day))
+        if shard is None:
+            return task_ids
+        projects = self._task_projects
+        return [
+            task_id
+            for task_id in task_ids
+            if shard.contains(task_id, projects.get(task_id))
+        ]
+
+    def get_upcoming_deadline_days(self, today: date) -> List[int]:
+
+        # Distinct deadline ordinals of open tasks, from today on.
+        day = today.toordinal()
         return sorted(
-            project.tasks.values(),
-            key=lambda t: t.created_at
+            {
+                task.deadline_day
+                for task in list(self._tasks.values())
+                if task.deadline_day is not None
+                and task.deadline_day >= day
+                and task.status != "done"
+            }
+        )
+
+    def _advance_overdue(self, stripe: _Stripe, day: int) -> List[int]:
+        if stripe.overdue_as_of is not None and day < stripe.overdue_as_of:
+            # Asked about an earlier day than before: the popped entries
+            # no longer apply, so start over from the live tasks.
+            self._rebuild_deadline_heap(stripe)
+
+        # Only entries that became overdue since the last call are popped,
+        # so a call costs O(k log n) for k newly overdue tasks.
+        heap = stripe.deadline_heap
+        while heap and heap[0][0] < day:
+            deadline, task_id = heapq.heappop(heap)
+            task = self._tasks.get(task_id)
+            if (
+                task is not None
+                and task.deadline_day == deadline
+                and task.status != "done"
+            ):
+                stripe.overdue[task_id] = None
+        stripe.overdue_as_of = day
+        return list(stripe.overdue)
+
+    def _rebuild_deadline_heap(self, stripe: _Stripe) -> None:
+        stripe.deadline_heap = [
+            (task.deadline_day, task.id)
+            for project in list(self._projects.values())
+            if self._stripe(project.id) is stripe
+            for task in list(project.tasks.values())
+            if task.deadline_day is not None
+        ]
+        heapq.heapify(stripe.deadline_heap)
+        stripe.overdue.clear()
+        stripe.overdue_as_of = None
+
+    def search_tasks(
+        self, query: str, project_id: Optional[int] = None
+    ) -> List[Task]:
+
+        return [task for _, task in self.search_tasks_ranked(query, project_id)]
+
+    def search_tasks_ranked(
+        self, query: str, project_id: Optional[int] = None
+    ) -> List[tuple[float, Task]]:
+
+        tokens = set(_tokenize(query))
+        if not tokens:
+            return []
+
+        # Intersect the posting sets starting from the rarest token, so the
+        # cost follows the smallest posting list, not the number of tasks.
+        postings = sorted(
+            (self._token_index.get(token, set()) for token in tokens),
+            key=len,
         )
-    
+        task_ids = postings[0].intersection(*postings[1:])
+        if project_id is not None:
+            project_tasks = self.get_project(project_id).tasks
+            task_ids = {i for i in task_ids if i in project_tasks}
+
+        # Ranked like ts_rank: share of the task's words that match.
+        ranked = []
+        for task_id in task_ids:
+            task = self._tasks.get(task_id)
+            if task is None:
+                continue
+            words = Counter(_task_tokens(task))
+            score = sum(words[t] for t in tokens) / sum(words.values())
+            ranked.append((score, task))
+        ranked.sort(key=lambda item: (-item[0], item[1].id))
+        return ranked
+
     def change_task_status(self, task_id: int, status: str) -> Task:
-       
-        return self.update_task(task_id, status=status)
\ No newline at end of file
+
+        return self.update_task(task_id, status=status)
@@ -0,0 +1,183 @@
+import marshal
+import mmap
+import os
+import struct
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, List, Optional
+
+from ...core.exceptions import TodoListError
+
+SNAPSHOT_MAGIC = b"TODOSNAP"
+# 2: entity rows with integer timestamps and deadlines (Task.to_row).
+SNAPSHOT_FORMAT = 2
+
+# Every log record is framed as (payload length, crc32 of payload).
+_RECORD_HEADER = struct.Struct("<II")
+
+
+class OperationLog:
+    """Append-only, numbered log of storage operations with group commit."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        sequence: int = 0,
+        fsync_batch: int = 64,
+        fsync_interval: float = 0.05,
+    ) -> None:
+        self._path = Path(path)
+        self._file = open(self._path, "ab")
+        self._sequence = sequence
+        self._appended = 0
+        self._fsync_batch = max(1, fsync_batch)
+        self._fsync_interval = fsync_interval
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if fsync_interval > 0 and self._fsync_batch > 1:
+            self._flusher = threading.Thread(
+                target=self._sync_periodically,
+                name="storage-log-sync",
+                daemon=True,
+            )
+            self._flusher.start()
+
+    @property
+    def sequence(self) -> int:
+        return self._sequence
+
+    @property
+    def appended(self) -> int:
+        """Records appended since the log was opened or last rotated."""
+        return self._appended
+
+    # Fsynced once `fsync_batch` records are pending or `fsync_interval`
+    # seconds after the last sync; a crash loses at most that window.
+    # Sequence numbers keep increasing across rotate() for the snapshots.
+    def append(self, *fields: Any) -> int:
+        with self._lock:
+            self._sequence += 1
+            payload = marshal.dumps((self._sequence, *fields))
+            header = _RECORD_HEADER.pack(len(payload), zlib.crc32(payload))
+            self._file.write(header + payload)
+            self._appended += 1
+            self._pending += 1
+            if self._pending >= self._fsync_batch:
+                self._sync()
+            return self._sequence
+
+    def sync(self) -> None:
+        with self._lock:
+            self._sync()
+
+    def rotate(self, archive_path: str | Path) -> None:
+        # Moves everything logged so far to `archive_path` and continues
+        # in an empty file at the same path.
+        with self._lock:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            os.replace(self._path, archive_path)
+            _fsync_directory(self._path.parent)
+            self._file = open(self._path, "ab")
+            self._appended = 0
+            self._pending = 0
+
+    def close(self) -> None:
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        with self._lock:
+            if not self._file.closed:
+                self._sync()
+                self._file.close()
+
+    def _sync(self) -> None:
+        if self._pending:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._pending = 0
+
+    def _sync_periodically(self) -> None:
+        while not self._closed.wait(self._fsync_interval):
+            self.sync()
+
+
+def read_log(path: str | Path) -> tuple[List[tuple], int]:
+    # Also returns where the last intact record ends: a torn or corrupt
+    # tail (a crash mid-append) ends the log there.
+    path = Path(path)
+    if not path.exists():
+        return [], 0
+
+    data = path.read_bytes()
+    records: List[tuple] = []
+    offset = 0
+    while offset + _RECORD_HEADER.size <= len(data):
+        length, crc = _RECORD_HEADER.unpack_from(data, offset)
+        start = offset + _RECORD_HEADER.size
+        payload = data[start:start + length]
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            break
+        records.append(marshal.loads(payload))
+        offset = start + length
+    return records, offset
+
+
+def write_snapshot(path: str | Path, state: Any) -> None:
+    # Written next to the target and renamed over it, so a crash leaves
+    # either the old snapshot or the new one, never a partial file.
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(SNAPSHOT_MAGIC)
+        marshal.dump((SNAPSHOT_FORMAT, state), f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    _fsync_directory(path.parent)
+
+
+def read_snapshot(path: str | Path) -> Optional[Any]:
+    path = Path(path)
+    if not path.exists() or path.stat().st_size == 0:
+        return None
+
+    # Decoded straight from the page cache through a memory map instead of
+    # being read into an intermediate bytes object first.
+    with open(path, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        if mapped[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            raise TodoListError(f"{path} is not a storage snapshot")
+        view = memoryview(mapped)
+        try:
+            snapshot_format, state = marshal.loads(view[len(SNAPSHOT_MAGIC):])
+        except (EOFError, ValueError, TypeError):
+            raise TodoListError(f"Storage snapshot {path} is corrupt")
+        finally:
+            view.release()
+
+    if snapshot_format != SNAPSHOT_FORMAT:
+        raise TodoListError(
+            f"Storage snapshot {path} has unsupported format {snapshot_format}"
+        )
+    return state
+
+
+def _fsync_directory(path: Path) -> None:
+    # Makes the rename itself durable; not possible on every platform.
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,197 @@
+import gc
+import os
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from ...core.entities import Project, Task
+from ...core.exceptions import TodoListError
+from .in_memory_storage import DEFAULT_LOCK_STRIPES, InMemoryStorage
+from .persistence import OperationLog, read_log, read_snapshot, write_snapshot
+
+SNAPSHOT_FILE = "storage.snapshot"
+LOG_FILE = "storage.log"
+PREVIOUS_LOG_FILE = "storage.log.previous"
+
+DEFAULT_SNAPSHOT_EVERY = 100_000
+
+
+class PersistentInMemoryStorage(InMemoryStorage):
+    """InMemoryStorage persisted as a snapshot plus an operation log."""
+
+    def __init__(
+        self,
+        data_dir: str | Path,
+        *,
+        fsync_batch: int = 64,
+        fsync_interval: float = 0.05,
+        snapshot_every: int = DEFAULT_SNAPSHOT_EVERY,
+        max_projects: Optional[int] = None,
+        max_tasks: Optional[int] = None,
+        lock_stripes: int = DEFAULT_LOCK_STRIPES,
+    ) -> None:
+        super().__init__(
+            max_projects=max_projects,
+            max_tasks=max_tasks,
+            lock_stripes=lock_stripes,
+        )
+        data_dir = Path(data_dir)
+        data_dir.mkdir(parents=True, exist_ok=True)
+        self._snapshot_path = data_dir / SNAPSHOT_FILE
+        self._log_path = data_dir / LOG_FILE
+        self._previous_log_path = data_dir / PREVIOUS_LOG_FILE
+        self._snapshot_every = snapshot_every
+        self._checkpoint_lock = threading.Lock()
+        self._checkpoint_scheduled = threading.Event()
+        # No log while loading, so replayed changes are not recorded again.
+        self._log: Optional[OperationLog] = None
+
+        # Loading allocates millions of objects and no garbage; the cyclic
+        # collector would keep rescanning them all the same.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            sequence = self._load()
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        if self._previous_log_path.exists():
+            # A checkpoint stopped between setting the log aside and
+            # writing the snapshot; everything is loaded now, so finish it.
+            write_snapshot(self._snapshot_path, self._snapshot_state(sequence))
+            os.remove(self._previous_log_path)
+
+        self._log = OperationLog(
+            self._log_path,
+            sequence=sequence,
+            fsync_batch=fsync_batch,
+            fsync_interval=fsync_interval,
+        )
+
+    def checkpoint(self) -> None:
+        with self._checkpoint_lock:
+            self._checkpoint()
+
+    def sync(self) -> None:
+        self._log.sync()
+
+    def close(self) -> None:
+        # Lets a running checkpoint finish instead of cutting it short.
+        with self._checkpoint_lock:
+            self._log.close()
+
+    def _record(self, operation: str, *args: Any) -> None:
+        # Logged by the writer while it still holds its lock, so the log
+        # order is the order the changes were made in.
+        if self._log is None:
+            return
+        self._log.append(operation, *args)
+        if (
+            self._log.appended >= self._snapshot_every
+            and not self._checkpoint_scheduled.is_set()
+        ):
+            # Not on this thread: the checkpoint needs every writer lock,
+            # and this writer is holding one.
+            self._checkpoint_scheduled.set()
+            threading.Thread(
+                target=self._checkpoint_when_due,
+                name="storage-checkpoint",
+                daemon=True,
+            ).start()
+
+    def _checkpoint_when_due(self) -> None:
+        try:
+            with self._checkpoint_lock:
+                if self._log.appended >= self._snapshot_every:
+                    self._checkpoint()
+        finally:
+            self._checkpoint_scheduled.clear()
+
+    def _checkpoint(self) -> None:
+        # Writers only wait while the state is copied; it is encoded and
+        # written after they resume, and what they log meanwhile goes to
+        # the fresh log file, numbered after the snapshot's sequence.
+        with self._exclusive():
+            state = self._snapshot_state(self._log.sequence)
+            # Still there if the last snapshot failed to write; the new
+            # one covers it as well.
+            if not self._previous_log_path.exists():
+                self._log.rotate(self._previous_log_path)
+        write_snapshot(self._snapshot_path, state)
+        os.remove(self._previous_log_path)
+
+    def _snapshot_state(self, sequence: int) -> tuple:
+        # The entities' compact rows: integer timestamps and deadlines go to
+        # disk and come back without a string conversion either way.
+        projects = [project.to_row() for project in self._projects.values()]
+        tasks = [task.to_row() for task in self._tasks.values()]
+        return (
+            sequence,
+            self._project_counter,
+            self._task_counter,
+            projects,
+            tasks,
+        )
+
+    def _load(self) -> int:
+        # Returns the sequence number of the last operation loaded.
+        sequence = 0
+        state = read_snapshot(self._snapshot_path)
+        if state is not None:
+            (
+                sequence,
+                self._project_counter,
+                self._task_counter,
+                projects,
+                tasks,
+            ) = state
+            for row in projects:
+                self._insert_project(Project.from_row(row))
+            self._insert_tasks(map(Task.from_row, tasks))
+
+        for path in (self._previous_log_path, self._log_path):
+            records, end = read_log(path)
+            for record in records:
+                record_sequence, operation, *args = record
+                if record_sequence <= sequence:
+                    continue
+                self._replay(operation, args)
+                sequence = record_sequence
+
+            if path.exists() and path.stat().st_size > end:
+                # Drop the torn tail so new records are not appended after it.
+                with open(path, "r+b") as f:
+                    f.truncate(end)
+        return sequence
+
+    def _replay(self, operation: str, args: list) -> None:
+        if operation == "project+":
+            project_id, name, description, created_at = args
+            self._insert_project(
+                Project.restore(project_id, name, description, created_at, 1)
+            )
+            self._project_counter = max(self._project_counter, project_id)
+        elif operation == "project=":
+            project_id, name, description = args
+            self.update_project(project_id, name, description)
+        elif operation == "project-":
+            self.delete_project(args[0])
+        elif operation == "task+":
+            task = Task.restore(*args, closed_at=None)
+            self._insert_task(task)
+            self._count_tasks(1)
+            self._projects[task.project_id].version += 1
+            self._task_counter = max(self._task_counter, task.id)
+        elif operation == "task=":
+            task_id, title, description, status, deadline, closed_at = args
+            task = self._update_task(
+                self.get_task(task_id), title, description, status, deadline
+            )
+            task.closed_at = closed_at
+        elif operation == "task-":
+            self.delete_task(args[0])
+        else:
+            raise TodoListError(
+                f"Unknown storage log operation {operation!r}"
+            )
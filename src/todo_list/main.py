@@ -1,9 +1,21 @@
+from typing import Optional
+
 from dotenv import load_dotenv
 from sqlalchemy.orm import Session
 
+from .backend import get_default_storage, uses_in_memory_storage
 from .cli.interface import CLIInterface
 from .db.session import SessionLocal
+from .db.unit_of_work import UnitOfWork
+from .in_memory.repositories import (
+    InMemoryProjectRepository,
+    InMemoryTaskRepository,
+)
 from .repositories.project_repository import ProjectRepository
+from .repositories.protocols import (
+    ProjectRepositoryProtocol,
+    TaskRepositoryProtocol,
+)
 from .repositories.task_repository import TaskRepository
 from .services import ProjectService, TaskService
 
@@ -11,20 +23,41 @@ from .services import ProjectService, TaskService
 def main() -> None:
     load_dotenv()
 
+    if uses_in_memory_storage():
+        # Everything lives in this process and is gone on exit; changes
+        # apply at once, so there is no unit of work.
+        storage = get_default_storage()
+        run_cli(
+            InMemoryProjectRepository(storage),
+            InMemoryTaskRepository(storage),
+        )
+        return
+
     session: Session = SessionLocal()
     try:
-        project_repo = ProjectRepository(session)
-        task_repo = TaskRepository(session)
+        uow = UnitOfWork(session)
+        run_cli(ProjectRepository(session), TaskRepository(session), uow)
+    finally:
+        session.close()
 
+
+def run_cli(
+    project_repo: ProjectRepositoryProtocol,
+    task_repo: TaskRepositoryProtocol,
+    uow: Optional[UnitOfWork] = None,
+) -> None:
+    try:
         project_service = ProjectService(project_repository=project_repo)
         task_service = TaskService(
             task_repository=task_repo,
             project_repository=project_repo,
+            unit_of_work=uow,
         )
 
         cli = CLIInterface(
             project_service=project_service,
             task_service=task_service,
+            unit_of_work=uow,
         )
 
         cli.run()
@@ -32,8 +65,6 @@ def main() -> None:
         print("\n\nExiting...")
     except Exception as e:
         print(f"Unexpected error: {e}")
-    finally:
-        session.close()
 
 
 if __name__ == "__main__":
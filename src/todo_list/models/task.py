@@ -1,14 +1,63 @@
 from datetime import datetime, date
 from typing import Optional
 
-from sqlalchemy import String, ForeignKey, Date, DateTime
+from sqlalchemy import (
+    Column,
+    Computed,
+    String,
+    ForeignKey,
+    Date,
+    DateTime,
+    Index,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..db.base import Base
 
 
+SEARCH_CONFIG = "simple"
+
+
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index(
+            "ix_tasks_project_id_created_at_id",
+            "project_id",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "ix_tasks_project_id_deadline_id",
+            "project_id",
+            "deadline",
+            "id",
+        ),
+        Index(
+            "ix_tasks_project_id_status_deadline",
+            "project_id",
+            "status",
+            "deadline",
+        ),
+        Index(
+            "ix_tasks_open_deadline",
+            "deadline",
+            postgresql_where=text("status <> 'done'"),
+        ),
+        Index(
+            "ix_tasks_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+    )
+    # search_vector exists only for matching in SQL; leaving it unmapped
+    # keeps it out of every ORM SELECT and of the eager-defaults RETURNING.
+    __mapper_args__ = {
+        "eager_defaults": True,
+        "exclude_properties": ["search_vector"],
+    }
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
 
@@ -42,6 +91,15 @@ class Task(Base):
         nullable=False
     )
 
+    search_vector = Column(
+        TSVECTOR,
+        Computed(
+            f"to_tsvector('{SEARCH_CONFIG}', "
+            "coalesce(title, '') || ' ' || coalesce(description, ''))",
+            persisted=True,
+        ),
+    )
+
     project = relationship(
         "Project",
         back_populates="tasks"
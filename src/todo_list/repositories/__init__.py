@@ -1,9 +1,19 @@
 from .base import SqlAlchemyRepository
+from .pagination import Page
 from .project_repository import ProjectRepository
+from .protocols import (
+    ProjectRepositoryProtocol,
+    TaskRepositoryProtocol,
+    UnitOfWorkProtocol,
+)
 from .task_repository import TaskRepository
 
 __all__ = [
     "SqlAlchemyRepository",
+    "Page",
     "ProjectRepository",
+    "ProjectRepositoryProtocol",
+    "TaskRepositoryProtocol",
+    "UnitOfWorkProtocol",
     "TaskRepository",
 ]
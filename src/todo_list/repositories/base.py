@@ -1,8 +1,105 @@
 from abc import ABC
-from sqlalchemy.orm import Session
+from typing import Any, Hashable, Optional, Type, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
+
+from ..cache.base import Cache
+from ..db.base import Base
+
+ModelT = TypeVar("ModelT", bound=Base)
+
+_PENDING_INVALIDATIONS = "cache_pending_invalidations"
+
+
+def _replay_invalidations(session: Session) -> None:
+    # Keys are evicted again once the transaction ended, so a concurrent
+    # reader that cached the pre-commit row in between cannot leave it
+    # behind; after a rollback this drops anything read from our own
+    # uncommitted writes.
+    cache, keys = session.info[_PENDING_INVALIDATIONS]
+    if keys:
+        cache.delete(*keys)
+        keys.clear()
 
 
 class SqlAlchemyRepository(ABC):
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: Session, cache: Optional[Cache] = None) -> None:
         self._session = session
+        self._cache = cache
+
+    def _cached_get(
+        self,
+        model: Type[ModelT],
+        key: Hashable,
+        object_id: int,
+        *,
+        version: Optional[int] = None,
+    ) -> Optional[ModelT]:
+        """Read-through lookup by primary key; None when the row does not exist."""
+        if self._cache is None:
+            return self._session.get(model, object_id)
+
+        in_session = self._session.identity_map.get(identity_key(model, object_id))
+        if in_session is not None:
+            return in_session
+
+        # Entries are stamped with the version they were read at; asked for
+        # another one (a write from another process), they count as a miss.
+        entry = self._cache.get(key)
+        if entry is not None and version in (None, entry[0]):
+            # Rebuild the row as a clean persistent object without any SQL.
+            instance = model(**entry[1])
+            make_transient_to_detached(instance)
+            self._session.add(instance)
+            return instance
+
+        instance, loaded_version = self._load_versioned(model, object_id)
+        if instance is not None and not self._is_pending(key):
+            self._cache.set(
+                key,
+                (
+                    loaded_version,
+                    {
+                        attr.key: getattr(instance, attr.key)
+                        for attr in model.__mapper__.column_attrs
+                    },
+                ),
+            )
+        return instance
+
+    def _load_versioned(
+        self,
+        model: Type[ModelT],
+        object_id: int,
+    ) -> tuple[Optional[ModelT], Optional[int]]:
+        # The row and the version its ETag is built on, read together.
+        instance = self._session.get(model, object_id)
+        return instance, getattr(instance, "version", None)
+
+    def _is_pending(self, key: Hashable) -> bool:
+        pending = self._session.info.get(_PENDING_INVALIDATIONS)
+        return pending is not None and key in pending[1]
+
+    def _invalidate(self, *keys: Hashable) -> None:
+        if self._cache is None or not keys:
+            return
+        self._cache.delete(*keys)
+
+        pending: Any = self._session.info.get(_PENDING_INVALIDATIONS)
+        if pending is None:
+            pending = (self._cache, set())
+            self._session.info[_PENDING_INVALIDATIONS] = pending
+            event.listen(self._session, "after_commit", _replay_invalidations)
+            event.listen(self._session, "after_rollback", _replay_invalidations)
+        pending[1].update(keys)
+
+
+def project_cache_key(project_id: int) -> str:
+    return f"project:{project_id}"
+
+
+def task_cache_key(task_id: int) -> str:
+    return f"task:{task_id}"
@@ -0,0 +1,71 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Generic, List, Optional, Sequence, TypeVar
+
+from ..core.exceptions import ValidationError
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(*values: Any) -> str:
+    payload = json.dumps(
+        [v.isoformat() if hasattr(v, "isoformat") else v for v in values],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValidationError("Invalid pagination cursor")
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValidationError("Invalid pagination cursor")
+    return values
+
+
+def decode_created_at_cursor(cursor: str) -> tuple[datetime, int]:
+    created_at, row_id = decode_cursor(cursor, 2)
+    try:
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (TypeError, ValueError):
+        raise ValidationError("Invalid pagination cursor")
+
+
+def validate_page_size(limit: int) -> int:
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        raise ValidationError(
+            f"limit must be between 1 and {MAX_PAGE_SIZE}"
+        )
+    return limit
+
+
+def build_page(
+    rows: Sequence[T],
+    limit: int,
+    *key_attrs: str,
+    prefix: Sequence[Any] = (),
+) -> Page[T]:
+    items = list(rows[:limit])
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(
+            *prefix, *(getattr(last, a) for a in key_attrs)
+        )
+    return Page(items=items, next_cursor=next_cursor)
@@ -1,17 +1,21 @@
+from datetime import date
 from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import Row, func, select, tuple_
 from sqlalchemy.orm import Session
 
+from ..cache.base import Cache
 from ..core.exceptions import NotFoundError, DuplicateError
 from ..models.project import Project
-from .base import SqlAlchemyRepository
+from ..models.task import Task
+from .base import SqlAlchemyRepository, project_cache_key, task_cache_key
+from .pagination import Page, build_page, decode_created_at_cursor
 
 
 class ProjectRepository(SqlAlchemyRepository):
 
-    def __init__(self, session: Session) -> None:
-        super().__init__(session)
+    def __init__(self, session: Session, cache: Optional[Cache] = None) -> None:
+        super().__init__(session, cache)
 
     def create(self, name: str, description: str) -> Project:
         existing = self.get_by_name(name)
@@ -20,12 +24,27 @@ class ProjectRepository(SqlAlchemyRepository):
 
         project = Project(name=name, description=description)
         self._session.add(project)
-        self._session.commit()
-        self._session.refresh(project)
+        self._session.flush()
         return project
 
-    def get_by_id(self, project_id: int) -> Project:
-        project = self._session.get(Project, project_id)
+    def get_by_id(
+        self,
+        project_id: int,
+        *,
+        cached: bool = True,
+        version: Optional[int] = None,
+    ) -> Project:
+        if cached:
+            project = self._cached_get(
+                Project,
+                project_cache_key(project_id),
+                project_id,
+                version=version,
+            )
+        else:
+            project = self._session.get(
+                Project, project_id, populate_existing=True
+            )
         if project is None:
             raise NotFoundError(f"Project with id {project_id} not found")
         return project
@@ -35,11 +54,78 @@ class ProjectRepository(SqlAlchemyRepository):
         result = self._session.execute(stmt).scalar_one_or_none()
         return result
 
+    def count(self) -> int:
+        stmt = select(func.count()).select_from(Project)
+        return self._session.execute(stmt).scalar_one()
+
+    def get_version(self, project_id: int) -> int:
+        stmt = select(Project.version).where(Project.id == project_id)
+        version = self._session.execute(stmt).scalar_one_or_none()
+        if version is None:
+            raise NotFoundError(f"Project with id {project_id} not found")
+        return version
+
+    def list_fingerprint(self) -> tuple[int, int, int]:
+        # Changes on any create (count, max id), delete (count) or update
+        # (sum of versions), without reading the rows themselves.
+        stmt = select(
+            func.count(),
+            func.coalesce(func.sum(Project.version), 0),
+            func.coalesce(func.max(Project.id), 0),
+        )
+        count, versions, max_id = self._session.execute(stmt).one()
+        return int(count), int(versions), int(max_id)
+
+    def status_counts(
+        self,
+        today: date,
+        project_id: Optional[int] = None,
+    ) -> List[Row]:
+        # One row per (project, status); projects without tasks come back
+        # once with a NULL status. Only project_id, status and deadline of
+        # tasks are read, so PostgreSQL can answer from
+        # ix_tasks_project_id_status_deadline with an index-only scan.
+        stmt = (
+            select(
+                Project.id.label("project_id"),
+                Task.status,
+                func.count(Task.project_id).label("total"),
+                func.count(Task.project_id)
+                .filter(Task.deadline < today, Task.status != "done")
+                .label("overdue"),
+            )
+            .outerjoin(Task, Task.project_id == Project.id)
+            .group_by(Project.id, Task.status)
+            .order_by(Project.id)
+        )
+        if project_id is not None:
+            stmt = stmt.where(Project.id == project_id)
+        return list(self._session.execute(stmt).all())
+
     def list_all(self) -> List[Project]:
         stmt = select(Project).order_by(Project.created_at.asc())
         result = self._session.execute(stmt).scalars().all()
         return list(result)
 
+    def list_page(
+        self,
+        *,
+        limit: int,
+        after: Optional[str] = None,
+    ) -> Page[Project]:
+        stmt = select(Project)
+        if after is not None:
+            created_at, project_id = decode_created_at_cursor(after)
+            stmt = stmt.where(
+                tuple_(Project.created_at, Project.id)
+                > tuple_(created_at, project_id)
+            )
+        stmt = stmt.order_by(
+            Project.created_at.asc(), Project.id.asc()
+        ).limit(limit + 1)
+        rows = self._session.execute(stmt).scalars().all()
+        return build_page(rows, limit, "created_at", "id")
+
     def update(
         self,
         project_id: int,
@@ -47,7 +133,9 @@ class ProjectRepository(SqlAlchemyRepository):
         name: Optional[str] = None,
         description: Optional[str] = None,
     ) -> Project:
-        project = self.get_by_id(project_id)
+        # Uncached: a stale name would make the rename below look like a
+        # no-op.
+        project = self.get_by_id(project_id, cached=False)
 
         if name is not None and name != project.name:
             existing = self.get_by_name(name)
@@ -58,11 +146,19 @@ class ProjectRepository(SqlAlchemyRepository):
         if description is not None:
             project.description = description
 
-        self._session.commit()
-        self._session.refresh(project)
+        project.version = Project.version + 1
+        self._session.flush()
+        self._invalidate(project_cache_key(project_id))
         return project
 
     def delete(self, project_id: int) -> None:
-        project = self.get_by_id(project_id)
+        project = self.get_by_id(project_id, cached=False)
+        if self._cache is not None:
+            # Tasks go away through ON DELETE CASCADE; evict them exactly.
+            task_ids = self._session.execute(
+                select(Task.id).where(Task.project_id == project_id)
+            ).scalars().all()
+            self._invalidate(*(task_cache_key(t) for t in task_ids))
         self._session.delete(project)
-        self._session.commit()
+        self._session.flush()
+        self._invalidate(project_cache_key(project_id))
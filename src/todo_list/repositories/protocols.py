@@ -0,0 +1,214 @@
+from datetime import date, datetime
+from typing import Any, Iterator, List, Mapping, Optional, Protocol, Sequence
+
+from ..core.filters import TaskFilter, TaskShard
+from ..core.task_fields import TaskChanges
+from .pagination import Page
+
+
+class UnitOfWorkProtocol(Protocol):
+    """
+        What services need from a unit of work: the SQL `UnitOfWork`, or
+        nothing at all (None) for backends that apply changes immediately.
+    """
+
+    def commit(self) -> None:
+        ...
+
+    def rollback(self) -> None:
+        ...
+
+
+class ProjectRepositoryProtocol(Protocol):
+    """
+        Interface of the project repositories used by the services.
+
+        `ProjectRepository` implements it over a SQLAlchemy session and
+        `InMemoryProjectRepository` over an `InMemoryStorage`. Returned
+        projects only need the attributes of `ProjectResponse` plus
+        `task_count`.
+    """
+
+    def create(self, name: str, description: str) -> Any:
+        ...
+
+    def get_by_id(
+        self,
+        project_id: int,
+        *,
+        cached: bool = True,
+        version: Optional[int] = None,
+    ) -> Any:
+        ...
+
+    def count(self) -> int:
+        ...
+
+    def get_version(self, project_id: int) -> int:
+        ...
+
+    def list_fingerprint(self) -> tuple[int, int, int]:
+        ...
+
+    def status_counts(
+        self,
+        today: date,
+        project_id: Optional[int] = None,
+    ) -> Sequence[Any]:
+        ...
+
+    def list_all(self) -> List[Any]:
+        ...
+
+    def list_page(
+        self,
+        *,
+        limit: int,
+        after: Optional[str] = None,
+    ) -> Page[Any]:
+        ...
+
+    def update(
+        self,
+        project_id: int,
+        *,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Any:
+        ...
+
+    def delete(self, project_id: int) -> None:
+        ...
+
+
+class TaskRepositoryProtocol(Protocol):
+    """
+        Interface of the task repositories used by the services.
+
+        `TaskRepository` implements it over a SQLAlchemy session and
+        `InMemoryTaskRepository` over an `InMemoryStorage`. Returned tasks
+        only need the attributes of `TaskResponse`; deadlines are passed
+        in as dates.
+    """
+
+    def create(
+        self,
+        project_id: int,
+        title: str,
+        description: str,
+        *,
+        status: str = "todo",
+        deadline: Optional[date] = None,
+    ) -> Any:
+        ...
+
+    def create_many(
+        self,
+        project_id: int,
+        rows: Sequence[Mapping[str, Any]],
+    ) -> List[Any]:
+        ...
+
+    def import_rows(
+        self,
+        project_id: int,
+        rows: Sequence[Mapping[str, Any]],
+    ) -> int:
+        ...
+
+    def get_version(self, task_id: int) -> tuple[int, int]:
+        ...
+
+    def get_by_id(
+        self,
+        task_id: int,
+        *,
+        cached: bool = True,
+        version: Optional[int] = None,
+    ) -> Any:
+        ...
+
+    def list_by_project(self, project_id: int) -> List[Any]:
+        ...
+
+    def list_page_by_project(
+        self,
+        project_id: int,
+        *,
+        limit: int,
+        after: Optional[str] = None,
+        filters: Optional[TaskFilter] = None,
+    ) -> Page[Any]:
+        ...
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int,
+        after: Optional[str] = None,
+        project_id: Optional[int] = None,
+    ) -> Page[Any]:
+        ...
+
+    def stream_by_project(
+        self,
+        project_id: int,
+        *,
+        batch_size: int,
+    ) -> Iterator[Sequence[Any]]:
+        ...
+
+    def update(
+        self,
+        task_id: int,
+        changes: TaskChanges,
+        *,
+        closed_at: Optional[datetime] = None,
+    ) -> Any:
+        ...
+
+    def delete(self, task_id: int) -> None:
+        ...
+
+    def get_overdue_tasks(self, now: datetime) -> List[Any]:
+        ...
+
+    def count_overdue(
+        self,
+        today: date,
+        shard: Optional[TaskShard] = None,
+    ) -> int:
+        ...
+
+    def overdue_project_ids(self, today: date) -> List[int]:
+        ...
+
+    def overdue_id_range(self, today: date) -> Optional[tuple[int, int]]:
+        ...
+
+    def close_overdue(
+        self,
+        today: date,
+        closed_at: datetime,
+        *,
+        limit: int,
+        shard: Optional[TaskShard] = None,
+    ) -> List[int]:
+        ...
+
+    def upcoming_deadlines(self, today: date) -> List[date]:
+        ...
+
+    def bulk_set_status(
+        self,
+        status: str,
+        closed_at: Optional[datetime],
+        *,
+        ids: Optional[Sequence[int]] = None,
+        project_id: Optional[int] = None,
+        current_status: Optional[str] = None,
+        deadline_from: Optional[date] = None,
+        deadline_to: Optional[date] = None,
+    ) -> List[int]:
+        ...
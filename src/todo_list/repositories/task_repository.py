@@ -1,18 +1,59 @@
+import csv
+import io
 from datetime import datetime, date
-from typing import List, Optional
+from typing import Any, Iterator, List, Mapping, Optional, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    Row,
+    Select,
+    and_,
+    cast,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    text,
+    tuple_,
+    update,
+)
 from sqlalchemy.orm import Session
+from sqlalchemy.util import await_only
 
-from ..core.exceptions import NotFoundError
-from ..models.task import Task
-from .base import SqlAlchemyRepository
+from ..cache.base import Cache
+from ..core.exceptions import NotFoundError, ValidationError
+from ..core.filters import TaskFilter, TaskShard
+from ..core.task_fields import TaskChanges
+from ..models.project import Project
+from ..models.task import SEARCH_CONFIG, Task
+from .base import SqlAlchemyRepository, project_cache_key, task_cache_key
+from .pagination import Page, build_page, decode_cursor, encode_cursor
+
+IMPORT_COLUMNS = ("title", "description", "status", "deadline")
+
+CREATE_IMPORT_STAGING = text(
+    "CREATE TEMPORARY TABLE IF NOT EXISTS tasks_import_staging ("
+    "title varchar(30) NOT NULL, "
+    "description varchar(150) NOT NULL, "
+    "status varchar(10) NOT NULL, "
+    "deadline date"
+    ") ON COMMIT DROP"
+)
+
+INSERT_FROM_IMPORT_STAGING = text(
+    "INSERT INTO tasks "
+    "(title, description, status, deadline, created_at, project_id) "
+    "SELECT title, description, status, deadline, :created_at, :project_id "
+    "FROM tasks_import_staging"
+)
 
 
 class TaskRepository(SqlAlchemyRepository):
 
-    def __init__(self, session: Session) -> None:
-        super().__init__(session)
+    def __init__(self, session: Session, cache: Optional[Cache] = None) -> None:
+        super().__init__(session, cache)
 
     def create(
         self,
@@ -31,16 +72,170 @@ class TaskRepository(SqlAlchemyRepository):
             deadline=deadline,
         )
         self._session.add(task)
-        self._session.commit()
-        self._session.refresh(task)
+        self._touch_projects([project_id], task_count_delta=1)
+        self._session.flush()
         return task
 
-    def get_by_id(self, task_id: int) -> Task:
-        task = self._session.get(Task, task_id)
+    def create_many(
+        self,
+        project_id: int,
+        rows: Sequence[Mapping[str, Any]],
+    ) -> List[Row]:
+        if not rows:
+            return []
+
+        # One multi-row INSERT ... RETURNING; plain rows come back so no
+        # Task objects are hydrated for the response.
+        stmt = insert(Task).returning(
+            *Task.__mapper__.columns,
+            sort_by_parameter_order=True,
+        )
+        params = [dict(row, project_id=project_id) for row in rows]
+        created = list(self._session.execute(stmt, params).all())
+        self._touch_projects([project_id], task_count_delta=len(created))
+        return created
+
+    def import_rows(
+        self,
+        project_id: int,
+        rows: Sequence[Mapping[str, Any]],
+    ) -> int:
+        if not rows:
+            return 0
+
+        connection = self._session.connection()
+        dialect = connection.dialect
+        if dialect.name == "postgresql" and dialect.driver in {
+            "psycopg2",
+            "asyncpg",
+        }:
+            self._copy_rows(project_id, rows)
+        else:
+            # Executemany of one INSERT, which SQLAlchemy sends as batched
+            # multi-row VALUES statements where the driver supports it.
+            params = [dict(row, project_id=project_id) for row in rows]
+            self._session.execute(insert(Task), params)
+
+        self._touch_projects([project_id], task_count_delta=len(rows))
+        return len(rows)
+
+    def _copy_rows(
+        self,
+        project_id: int,
+        rows: Sequence[Mapping[str, Any]],
+    ) -> None:
+        # COPY the batch into a temporary staging table in one round trip,
+        # then move it with a single set-based INSERT ... SELECT so the
+        # foreign key and column checks run once for the whole batch.
+        connection = self._session.connection()
+        connection.execute(CREATE_IMPORT_STAGING)
+
+        dbapi_connection = connection.connection
+        if connection.dialect.driver == "asyncpg":
+            records = [tuple(row[c] for c in IMPORT_COLUMNS) for row in rows]
+            await_only(
+                dbapi_connection.driver_connection.copy_records_to_table(
+                    "tasks_import_staging",
+                    records=records,
+                    columns=IMPORT_COLUMNS,
+                )
+            )
+        else:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            for row in rows:
+                deadline = row["deadline"]
+                writer.writerow((
+                    row["title"],
+                    row["description"],
+                    row["status"],
+                    deadline.isoformat() if deadline is not None else None,
+                ))
+            buffer.seek(0)
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.copy_expert(
+                    "COPY tasks_import_staging "
+                    f"({', '.join(IMPORT_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+                    buffer,
+                )
+            finally:
+                cursor.close()
+
+        connection.execute(
+            INSERT_FROM_IMPORT_STAGING,
+            {"created_at": datetime.utcnow(), "project_id": project_id},
+        )
+        connection.execute(text("TRUNCATE tasks_import_staging"))
+
+    def _touch_projects(
+        self,
+        project_ids: Sequence[int],
+        *,
+        task_count_delta: int = 0,
+    ) -> None:
+        # Any change to a project's tasks bumps the project's version, which
+        # is what the ETags of the project and task listings are built on.
+        project_ids = sorted(set(project_ids))
+        if not project_ids:
+            return
+        values: dict[str, Any] = {"version": Project.version + 1}
+        if task_count_delta:
+            values["task_count"] = Project.task_count + task_count_delta
+        stmt = (
+            update(Project)
+            .where(Project.id.in_(project_ids))
+            .values(**values)
+        )
+        self._session.execute(stmt)
+        self._invalidate(*(project_cache_key(p) for p in project_ids))
+
+    def get_version(self, task_id: int) -> tuple[int, int]:
+        stmt = (
+            select(Task.project_id, Project.version)
+            .join(Project, Project.id == Task.project_id)
+            .where(Task.id == task_id)
+        )
+        row = self._session.execute(stmt).one_or_none()
+        if row is None:
+            raise NotFoundError(f"Task with id {task_id} not found")
+        return row.project_id, row.version
+
+    def get_by_id(
+        self,
+        task_id: int,
+        *,
+        cached: bool = True,
+        version: Optional[int] = None,
+    ) -> Task:
+        # version: the owning project's, as returned by get_version.
+        if cached:
+            task = self._cached_get(
+                Task, task_cache_key(task_id), task_id, version=version
+            )
+        else:
+            task = self._session.get(Task, task_id, populate_existing=True)
         if task is None:
             raise NotFoundError(f"Task with id {task_id} not found")
         return task
 
+    def _load_versioned(
+        self,
+        model: type[Task],
+        object_id: int,
+    ) -> tuple[Optional[Task], Optional[int]]:
+        # One statement, so the task is stamped with the project version
+        # that was current when it was read.
+        stmt = (
+            select(Task, Project.version)
+            .join(Project, Project.id == Task.project_id)
+            .where(Task.id == object_id)
+        )
+        row = self._session.execute(stmt).one_or_none()
+        if row is None:
+            return None, None
+        return row[0], row[1]
+
     def list_by_project(self, project_id: int) -> List[Task]:
         stmt = (
             select(Task)
@@ -50,16 +245,202 @@ class TaskRepository(SqlAlchemyRepository):
         result = self._session.execute(stmt).scalars().all()
         return list(result)
 
-    def save(self, task: Task) -> Task:
-        self._session.add(task)
-        self._session.commit()
-        self._session.refresh(task)
+    def list_page_by_project(
+        self,
+        project_id: int,
+        *,
+        limit: int,
+        after: Optional[str] = None,
+        filters: Optional[TaskFilter] = None,
+    ) -> Page[Task]:
+        if filters is None:
+            filters = TaskFilter()
+
+        stmt = select(Task).where(
+            Task.project_id == project_id,
+            *self._filter_criteria(filters),
+        )
+        if after is not None:
+            stmt = stmt.where(self._after_cursor(filters, after))
+        stmt = stmt.order_by(*self._sort_order(filters)).limit(limit + 1)
+        rows = self._session.execute(stmt).scalars().all()
+        # The sort key is part of the cursor, so a cursor cannot be replayed
+        # against a different ordering.
+        return build_page(
+            rows, limit, filters.sort_field, "id", prefix=(filters.sort,)
+        )
+
+    def _filter_criteria(self, filters: TaskFilter) -> List[ColumnElement]:
+        criteria: List[ColumnElement] = []
+        if filters.statuses:
+            criteria.append(Task.status.in_(filters.statuses))
+        if filters.deadline_from is not None:
+            criteria.append(Task.deadline >= filters.deadline_from)
+        if filters.deadline_to is not None:
+            criteria.append(Task.deadline <= filters.deadline_to)
+        if filters.created_from is not None:
+            criteria.append(Task.created_at >= filters.created_from)
+        if filters.created_to is not None:
+            criteria.append(Task.created_at <= filters.created_to)
+        if filters.overdue_on is not None:
+            criteria.append(Task.deadline < filters.overdue_on)
+            criteria.append(Task.status != "done")
+        return criteria
+
+    def _sort_order(self, filters: TaskFilter) -> List[ColumnElement]:
+        column = getattr(Task, filters.sort_field)
+        if filters.sort_field == "deadline":
+            # Spelled out to match PostgreSQL's btree order, so both
+            # directions are a plain forward or backward index scan.
+            if filters.descending:
+                return [column.desc().nulls_first(), Task.id.desc()]
+            return [column.asc().nulls_last(), Task.id.asc()]
+        if filters.descending:
+            return [column.desc(), Task.id.desc()]
+        return [column.asc(), Task.id.asc()]
+
+    def _after_cursor(self, filters: TaskFilter, after: str) -> ColumnElement:
+        sort, value, task_id = decode_cursor(after, 3)
+        if sort != filters.sort:
+            raise ValidationError("Pagination cursor belongs to another sort")
+        try:
+            task_id = int(task_id)
+            if filters.sort_field == "created_at":
+                value = datetime.fromisoformat(value)
+            elif value is not None:
+                value = date.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise ValidationError("Invalid pagination cursor")
+
+        column = getattr(Task, filters.sort_field)
+        key = tuple_(column, Task.id)
+        if filters.sort_field == "created_at":
+            if filters.descending:
+                return key < tuple_(value, task_id)
+            return key > tuple_(value, task_id)
+
+        # Tasks without a deadline come last ascending and first descending.
+        if value is None:
+            if filters.descending:
+                return or_(
+                    column.is_not(None),
+                    and_(column.is_(None), Task.id < task_id),
+                )
+            return and_(column.is_(None), Task.id > task_id)
+        if filters.descending:
+            return key < tuple_(value, task_id)
+        return or_(key > tuple_(value, task_id), column.is_(None))
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int,
+        after: Optional[str] = None,
+        project_id: Optional[int] = None,
+    ) -> Page[Task]:
+        search_vector = Task.__table__.c.search_vector
+        if self._session.get_bind().dialect.name == "postgresql":
+            # websearch_to_tsquery accepts free text ("quoted phrases", or,
+            # -exclusions) and never fails on user input; @@ is answered
+            # from the GIN index on search_vector.
+            tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+            # ts_rank is a float4; as a float8 it survives the round trip
+            # through the cursor exactly, so equal ranks compare equal.
+            rank = cast(func.ts_rank(search_vector, tsquery), Float(53))
+            criteria = [search_vector.op("@@")(tsquery)]
+        else:
+            # Unranked fallback for other backends: every word must occur in
+            # the title or the description.
+            rank = literal(0.0)
+            criteria = [
+                or_(
+                    Task.title.icontains(word, autoescape=True),
+                    Task.description.icontains(word, autoescape=True),
+                )
+                for word in query.split()
+            ]
+
+        stmt = select(Task, rank.label("rank")).where(*criteria)
+        if project_id is not None:
+            stmt = stmt.where(Task.project_id == project_id)
+        if after is not None:
+            rank_after, id_after = decode_cursor(after, 2)
+            try:
+                rank_after, id_after = float(rank_after), int(id_after)
+            except (TypeError, ValueError):
+                raise ValidationError("Invalid pagination cursor")
+            stmt = stmt.where(
+                or_(
+                    rank < rank_after,
+                    and_(rank == rank_after, Task.id > id_after),
+                )
+            )
+        stmt = stmt.order_by(rank.desc(), Task.id.asc()).limit(limit + 1)
+
+        rows = self._session.execute(stmt).all()
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = encode_cursor(last.rank, last.Task.id)
+        return Page(
+            items=[row.Task for row in rows[:limit]],
+            next_cursor=next_cursor,
+        )
+
+    def export_query(self, project_id: int, *, batch_size: int) -> Select:
+        # Plain columns instead of Task objects, and yield_per so the driver
+        # uses a server-side cursor and buffers one partition at a time.
+        return (
+            select(*Task.__mapper__.columns)
+            .where(Task.project_id == project_id)
+            .order_by(Task.created_at.asc(), Task.id.asc())
+            .execution_options(yield_per=batch_size)
+        )
+
+    def stream_by_project(
+        self,
+        project_id: int,
+        *,
+        batch_size: int,
+    ) -> Iterator[Sequence[Row]]:
+        stmt = self.export_query(project_id, batch_size=batch_size)
+        yield from self._session.execute(stmt).partitions()
+
+    def update(
+        self,
+        task_id: int,
+        changes: TaskChanges,
+        *,
+        closed_at: Optional[datetime] = None,
+    ) -> Task:
+        # Writes start from the row as stored, never from a cached copy
+        # another process may have outdated.
+        task = self.get_by_id(task_id, cached=False)
+        # A status change stamps closed_at on "done" and clears it on any
+        # other status, like bulk_set_status.
+        if changes.status is not None and changes.status != task.status:
+            task.closed_at = closed_at if changes.status == "done" else None
+        # Only the assigned attributes end up in the UPDATE.
+        if changes.title is not None:
+            task.title = changes.title
+        if changes.description is not None:
+            task.description = changes.description
+        if changes.status is not None:
+            task.status = changes.status
+        if changes.deadline is not None:
+            task.deadline = changes.deadline
+        self._session.flush()
+        self._touch_projects([task.project_id])
+        self._invalidate(task_cache_key(task.id))
         return task
 
     def delete(self, task_id: int) -> None:
-        task = self.get_by_id(task_id)
+        task = self.get_by_id(task_id, cached=False)
         self._session.delete(task)
-        self._session.commit()
+        self._touch_projects([task.project_id], task_count_delta=-1)
+        self._session.flush()
+        self._invalidate(task_cache_key(task_id))
 
     def get_overdue_tasks(self, now: datetime) -> List[Task]:
         today = now.date()
@@ -74,3 +455,125 @@ class TaskRepository(SqlAlchemyRepository):
         )
         result = self._session.execute(stmt).scalars().all()
         return list(result)
+
+    def _overdue_criteria(
+        self,
+        today: date,
+        shard: Optional[TaskShard] = None,
+    ) -> List[ColumnElement]:
+        criteria: List[ColumnElement] = [
+            Task.deadline.is_not(None),
+            Task.deadline < today,
+            Task.status != "done",
+        ]
+        if shard is not None:
+            if shard.min_id is not None:
+                criteria.append(Task.id >= shard.min_id)
+            if shard.max_id is not None:
+                criteria.append(Task.id <= shard.max_id)
+            if shard.project_ids is not None:
+                criteria.append(Task.project_id.in_(shard.project_ids))
+        return criteria
+
+    def count_overdue(
+        self,
+        today: date,
+        shard: Optional[TaskShard] = None,
+    ) -> int:
+        stmt = select(func.count()).where(*self._overdue_criteria(today, shard))
+        return self._session.execute(stmt).scalar_one()
+
+    def overdue_project_ids(self, today: date) -> List[int]:
+        stmt = (
+            select(Task.project_id)
+            .where(*self._overdue_criteria(today))
+            .distinct()
+            .order_by(Task.project_id.asc())
+        )
+        return list(self._session.scalars(stmt))
+
+    def overdue_id_range(self, today: date) -> Optional[tuple[int, int]]:
+        stmt = select(func.min(Task.id), func.max(Task.id)).where(
+            *self._overdue_criteria(today)
+        )
+        low, high = self._session.execute(stmt).one()
+        return None if low is None else (low, high)
+
+    def close_overdue(
+        self,
+        today: date,
+        closed_at: datetime,
+        *,
+        limit: int,
+        shard: Optional[TaskShard] = None,
+    ) -> List[int]:
+        candidates = (
+            select(Task.id)
+            .where(*self._overdue_criteria(today, shard))
+            .order_by(Task.id.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(Task)
+            .where(Task.id.in_(candidates))
+            .values(status="done", closed_at=closed_at)
+            .returning(Task.id, Task.project_id)
+            .execution_options(synchronize_session=False)
+        )
+        changed = self._session.execute(stmt).all()
+        self._touch_projects([row.project_id for row in changed])
+        self._invalidate(*(task_cache_key(row.id) for row in changed))
+        return [row.id for row in changed]
+
+    def upcoming_deadlines(self, today: date) -> List[date]:
+        # The distinct days on which open tasks fall due: a few hundred
+        # rows however many tasks there are.
+        stmt = (
+            select(Task.deadline)
+            .where(
+                Task.deadline.is_not(None),
+                Task.deadline >= today,
+                Task.status != "done",
+            )
+            .distinct()
+            .order_by(Task.deadline.asc())
+        )
+        return list(self._session.scalars(stmt))
+
+    def bulk_set_status(
+        self,
+        status: str,
+        closed_at: Optional[datetime],
+        *,
+        ids: Optional[Sequence[int]] = None,
+        project_id: Optional[int] = None,
+        current_status: Optional[str] = None,
+        deadline_from: Optional[date] = None,
+        deadline_to: Optional[date] = None,
+    ) -> List[int]:
+        conditions = [Task.status != status]
+        if ids is not None:
+            if not ids:
+                return []
+            conditions.append(Task.id.in_(ids))
+        if project_id is not None:
+            conditions.append(Task.project_id == project_id)
+        if current_status is not None:
+            conditions.append(Task.status == current_status)
+        if deadline_from is not None:
+            conditions.append(Task.deadline >= deadline_from)
+        if deadline_to is not None:
+            conditions.append(Task.deadline <= deadline_to)
+
+        stmt = (
+            update(Task)
+            .where(*conditions)
+            .values(status=status, closed_at=closed_at)
+            .returning(Task.id, Task.project_id)
+            .execution_options(synchronize_session=False)
+        )
+        changed = self._session.execute(stmt).all()
+        self._touch_projects([row.project_id for row in changed])
+        self._invalidate(*(task_cache_key(row.id) for row in changed))
+        return [row.id for row in changed]
@@ -0,0 +1,22 @@
+from typing import Any, Callable, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+T = TypeVar("T")
+
+
+class AsyncServiceAdapter:
+    """
+        Base class for the async service variants.
+
+        The domain rules live in the sync services only. The async
+        variants run those services against `AsyncSession.sync_session`
+        through `run_sync`, so every database call goes through the async
+        driver on the event loop and never blocks a worker thread.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def _run(self, method: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        return await self._session.run_sync(lambda _: method(*args, **kwargs))
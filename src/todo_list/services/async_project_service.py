@@ -0,0 +1,98 @@
+from datetime import date
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..cache import get_default_cache
+from ..models.project import Project
+from ..repositories.pagination import Page
+from ..repositories.project_repository import ProjectRepository
+from .async_base import AsyncServiceAdapter
+from .project_service import ProjectService, ProjectSummary
+
+
+class AsyncProjectService(AsyncServiceAdapter):
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        max_projects: Optional[int] = None,
+    ) -> None:
+        super().__init__(session)
+        self._service = ProjectService(
+            project_repository=ProjectRepository(
+                session.sync_session, get_default_cache()
+            ),
+            max_projects=max_projects,
+        )
+
+    async def create_project(self, name: str, description: str) -> Project:
+        return await self._run(
+            self._service.create_project,
+            name=name,
+            description=description,
+        )
+
+    async def list_projects(self) -> List[Project]:
+        return await self._run(self._service.list_projects)
+
+    async def list_projects_page(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+    ) -> Page[Project]:
+        return await self._run(
+            self._service.list_projects_page,
+            limit=limit,
+            after=after,
+        )
+
+    async def get_project(
+        self,
+        project_id: int,
+        *,
+        version: Optional[int] = None,
+    ) -> Project:
+        return await self._run(
+            self._service.get_project, project_id, version=version
+        )
+
+    async def get_project_version(self, project_id: int) -> int:
+        return await self._run(self._service.get_project_version, project_id)
+
+    async def get_projects_fingerprint(self) -> tuple[int, int, int]:
+        return await self._run(self._service.get_projects_fingerprint)
+
+    async def get_project_summary(
+        self,
+        project_id: int,
+        today: Optional[date] = None,
+    ) -> ProjectSummary:
+        return await self._run(
+            self._service.get_project_summary,
+            project_id,
+            today=today,
+        )
+
+    async def list_project_summaries(
+        self,
+        today: Optional[date] = None,
+    ) -> List[ProjectSummary]:
+        return await self._run(self._service.list_project_summaries, today=today)
+
+    async def update_project(
+        self,
+        project_id: int,
+        *,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Project:
+        return await self._run(
+            self._service.update_project,
+            project_id=project_id,
+            name=name,
+            description=description,
+        )
+
+    async def delete_project(self, project_id: int) -> None:
+        await self._run(self._service.delete_project, project_id)
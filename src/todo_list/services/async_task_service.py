@@ -0,0 +1,273 @@
+from datetime import date, datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+)
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..cache import get_default_cache
+from ..core.filters import TaskShard
+from ..core.task_fields import TaskChanges, TaskFields
+from ..db.unit_of_work import UnitOfWork
+from ..models.task import Task
+from ..repositories.pagination import Page
+from ..repositories.project_repository import ProjectRepository
+from ..repositories.task_repository import TaskRepository
+from .async_base import AsyncServiceAdapter
+from .task_import import ImportRecord, ImportReport, RejectedRow
+from .task_service import (
+    DEFAULT_CLOSE_CHUNK_SIZE,
+    DEFAULT_EXPORT_BATCH_SIZE,
+    DEFAULT_IMPORT_BATCH_SIZE,
+    DeadlineObserver,
+    TaskService,
+)
+
+
+class AsyncTaskService(AsyncServiceAdapter):
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        max_tasks_per_project: Optional[int] = None,
+        deadline_observer: Optional[DeadlineObserver] = None,
+    ) -> None:
+        super().__init__(session)
+        cache = get_default_cache()
+        self._task_repository = TaskRepository(session.sync_session, cache)
+        self._project_repository = ProjectRepository(session.sync_session, cache)
+        self._service = TaskService(
+            task_repository=self._task_repository,
+            project_repository=self._project_repository,
+            max_tasks_per_project=max_tasks_per_project,
+            unit_of_work=UnitOfWork(session.sync_session),
+            deadline_observer=deadline_observer,
+        )
+
+    async def create_task(
+        self,
+        project_id: int,
+        title: str,
+        description: str,
+        *,
+        status: str = "todo",
+        deadline: Optional[str | date] = None,
+    ) -> Task:
+        return await self._run(
+            self._service.create_task,
+            project_id=project_id,
+            title=title,
+            description=description,
+            status=status,
+            deadline=deadline,
+        )
+
+    async def create_validated_task(
+        self,
+        project_id: int,
+        fields: TaskFields,
+    ) -> Task:
+        return await self._run(
+            self._service.create_validated_task,
+            project_id=project_id,
+            fields=fields,
+        )
+
+    async def create_tasks(
+        self,
+        project_id: int,
+        tasks: Sequence[Mapping[str, Any] | TaskFields],
+    ) -> List[Any]:
+        return await self._run(
+            self._service.create_tasks,
+            project_id=project_id,
+            tasks=tasks,
+        )
+
+    async def import_tasks(
+        self,
+        project_id: int,
+        records: Iterable[ImportRecord],
+        *,
+        batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+        on_reject: Optional[Callable[[RejectedRow], None]] = None,
+    ) -> ImportReport:
+        return await self._run(
+            self._service.import_tasks,
+            project_id,
+            records,
+            batch_size=batch_size,
+            on_reject=on_reject,
+        )
+
+    async def list_tasks_for_project(self, project_id: int) -> List[Task]:
+        return await self._run(
+            self._service.list_tasks_for_project,
+            project_id,
+        )
+
+    async def list_tasks_page(
+        self,
+        project_id: int,
+        limit: int,
+        after: Optional[str] = None,
+        *,
+        statuses: Optional[Sequence[str]] = None,
+        deadline_from: Optional[str] = None,
+        deadline_to: Optional[str] = None,
+        created_from: Optional[str] = None,
+        created_to: Optional[str] = None,
+        overdue: bool = False,
+        sort: str = "created_at",
+        now: Optional[datetime] = None,
+    ) -> Page[Task]:
+        return await self._run(
+            self._service.list_tasks_page,
+            project_id,
+            limit=limit,
+            after=after,
+            statuses=statuses,
+            deadline_from=deadline_from,
+            deadline_to=deadline_to,
+            created_from=created_from,
+            created_to=created_to,
+            overdue=overdue,
+            sort=sort,
+            now=now,
+        )
+
+    async def search_tasks(
+        self,
+        query: str,
+        limit: int,
+        after: Optional[str] = None,
+        *,
+        project_id: Optional[int] = None,
+    ) -> Page[Task]:
+        return await self._run(
+            self._service.search_tasks,
+            query,
+            limit=limit,
+            after=after,
+            project_id=project_id,
+        )
+
+    async def export_tasks(
+        self,
+        project_id: int,
+        batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+    ) -> AsyncIterator[Sequence[Row]]:
+        # Streaming cannot go through run_sync, so only the statement comes
+        # from the repository and the rows are read with AsyncSession.stream.
+        await self._run(self._project_repository.get_by_id, project_id)
+        stmt = self._task_repository.export_query(
+            project_id,
+            batch_size=batch_size,
+        )
+        result = await self._session.stream(stmt)
+        async for rows in result.partitions():
+            yield rows
+
+    async def get_task(
+        self,
+        task_id: int,
+        *,
+        version: Optional[int] = None,
+    ) -> Task:
+        return await self._run(
+            self._service.get_task, task_id, version=version
+        )
+
+    async def get_project_version(self, project_id: int) -> int:
+        return await self._run(self._service.get_project_version, project_id)
+
+    async def get_task_version(self, task_id: int) -> tuple[int, int]:
+        return await self._run(self._service.get_task_version, task_id)
+
+    async def update_task(
+        self,
+        task_id: int,
+        *,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[str] = None,
+        deadline: Optional[str | date] = None,
+    ) -> Task:
+        return await self._run(
+            self._service.update_task,
+            task_id=task_id,
+            title=title,
+            description=description,
+            status=status,
+            deadline=deadline,
+        )
+
+    async def update_validated_task(
+        self,
+        task_id: int,
+        changes: TaskChanges,
+    ) -> Task:
+        return await self._run(
+            self._service.update_validated_task,
+            task_id=task_id,
+            changes=changes,
+        )
+
+    async def change_status(self, task_id: int, status: str) -> Task:
+        return await self._run(
+            self._service.change_status,
+            task_id=task_id,
+            status=status,
+        )
+
+    async def change_status_bulk(
+        self,
+        status: str,
+        *,
+        ids: Optional[Sequence[int]] = None,
+        project_id: Optional[int] = None,
+        current_status: Optional[str] = None,
+        deadline_from: Optional[str | date] = None,
+        deadline_to: Optional[str | date] = None,
+        now: Optional[datetime] = None,
+    ) -> List[int]:
+        return await self._run(
+            self._service.change_status_bulk,
+            status,
+            ids=ids,
+            project_id=project_id,
+            current_status=current_status,
+            deadline_from=deadline_from,
+            deadline_to=deadline_to,
+            now=now,
+        )
+
+    async def delete_task(self, task_id: int) -> None:
+        await self._run(self._service.delete_task, task_id)
+
+    async def upcoming_deadlines(
+        self,
+        today: Optional[date] = None,
+    ) -> List[date]:
+        return await self._run(self._service.upcoming_deadlines, today)
+
+    async def close_overdue_tasks(
+        self,
+        now: Optional[datetime] = None,
+        chunk_size: int = DEFAULT_CLOSE_CHUNK_SIZE,
+        shard: Optional[TaskShard] = None,
+    ) -> List[int]:
+        return await self._run(
+            self._service.close_overdue_tasks,
+            now=now,
+            chunk_size=chunk_size,
+            shard=shard,
+        )
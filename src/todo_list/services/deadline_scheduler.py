@@ -0,0 +1,189 @@
+import asyncio
+import heapq
+import logging
+import math
+import time
+from contextlib import AbstractContextManager, suppress
+from datetime import date, datetime, time as day_start
+from typing import Callable, List, Optional, Protocol
+
+from .task_service import DEFAULT_CLOSE_CHUNK_SIZE, TaskService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESYNC_INTERVAL = 3600.0
+DEFAULT_RETRY_INTERVAL = 30.0
+
+
+class LeaderLock(Protocol):
+    """Elects the process that closes overdue tasks; methods block."""
+
+    def acquire(self) -> bool:
+        ...
+
+    def is_held(self) -> bool:
+        ...
+
+    def release(self) -> None:
+        ...
+
+
+class DeadlineScheduler:
+    """Closes overdue tasks in-process, when they become overdue."""
+
+    def __init__(
+        self,
+        service_scope: Callable[[], AbstractContextManager[TaskService]],
+        *,
+        leader_lock: Optional[LeaderLock] = None,
+        chunk_size: int = DEFAULT_CLOSE_CHUNK_SIZE,
+        resync_interval: float = DEFAULT_RESYNC_INTERVAL,
+        retry_interval: float = DEFAULT_RETRY_INTERVAL,
+        clock: Callable[[], datetime] = datetime.utcnow,
+    ) -> None:
+        self._service_scope = service_scope
+        self._leader_lock = leader_lock
+        self._chunk_size = chunk_size
+        self._resync_interval = resync_interval
+        self._retry_interval = retry_interval
+        self._clock = clock
+        # Days on which open tasks fall due, as date ordinals, each at most
+        # once. Reloaded every resync_interval, which also picks up other
+        # processes' changes; notice() adds days in between.
+        self._heap: List[int] = []
+        self._queued: set[int] = set()
+        self._wakeup = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._leading = False
+
+    @property
+    def leading(self) -> bool:
+        return self._leading
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._task = self._loop.create_task(
+            self._run(), name="deadline-scheduler"
+        )
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self._step_down()
+        self._loop = None
+
+    def notice(self, deadline: date) -> None:
+        # Called by the services from any thread; the heap belongs to the
+        # event loop.
+        loop = self._loop
+        day = deadline.toordinal()
+        if loop is None or day in self._queued:
+            return
+        with suppress(RuntimeError):
+            # The loop is closing: the next start loads the heap anyway.
+            loop.call_soon_threadsafe(self._push, day)
+
+    def _push(self, day: int) -> None:
+        if day in self._queued:
+            return
+        self._queued.add(day)
+        heapq.heappush(self._heap, day)
+        if self._heap[0] == day:
+            # Earlier than the day the loop is sleeping towards.
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if await self._lead():
+                    await self._serve()
+                    logger.warning("Deadline scheduler lost its leader lock")
+                    await self._step_down()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception(
+                    "Deadline scheduler failed; retrying in %ss",
+                    self._retry_interval,
+                )
+                await self._step_down()
+            await asyncio.sleep(self._retry_interval)
+
+    async def _lead(self) -> bool:
+        # With a leader lock only its holder closes tasks; the others retry
+        # every retry_interval and take over when the leader goes away.
+        if self._leader_lock is not None:
+            self._leading = await asyncio.to_thread(self._leader_lock.acquire)
+        else:
+            self._leading = True
+        return self._leading
+
+    async def _still_leading(self) -> bool:
+        if self._leader_lock is None:
+            return True
+        return await asyncio.to_thread(self._leader_lock.is_held)
+
+    async def _step_down(self) -> None:
+        if self._leading and self._leader_lock is not None:
+            with suppress(Exception):
+                await asyncio.to_thread(self._leader_lock.release)
+        self._leading = False
+
+    async def _serve(self) -> None:
+        # Returns when the leader lock is gone.
+        resync_at = 0.0
+        while True:
+            if time.monotonic() >= resync_at:
+                await self._resync()
+                resync_at = time.monotonic() + self._resync_interval
+                # Whatever fell due while nobody was leading.
+                due = True
+            else:
+                due = False
+
+            today = self._clock().date().toordinal()
+            while self._heap and self._heap[0] < today:
+                self._queued.discard(heapq.heappop(self._heap))
+                due = True
+            if due:
+                if not await self._still_leading():
+                    return
+                await asyncio.to_thread(self._close_overdue)
+
+            self._wakeup.clear()
+            timeout = min(
+                self._seconds_until_due(),
+                max(resync_at - time.monotonic(), 0.0),
+            )
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+
+    async def _resync(self) -> None:
+        deadlines = await asyncio.to_thread(self._upcoming_deadlines)
+        for deadline in deadlines:
+            self._push(deadline.toordinal())
+
+    def _seconds_until_due(self) -> float:
+        if not self._heap:
+            return math.inf
+        # The earliest deadline is overdue from midnight after it.
+        due = datetime.combine(date.fromordinal(self._heap[0] + 1), day_start())
+        return max((due - self._clock()).total_seconds(), 0.0)
+
+    def _upcoming_deadlines(self) -> List[date]:
+        with self._service_scope() as service:
+            return service.upcoming_deadlines(self._clock().date())
+
+    def _close_overdue(self) -> None:
+        with self._service_scope() as service:
+            closed = service.close_overdue_tasks(
+                now=self._clock(), chunk_size=self._chunk_size
+            )
+        if closed:
+            logger.info(
+                "Deadline scheduler closed %d overdue task(s)", len(closed)
+            )
@@ -1,4 +1,6 @@
 import os
+from dataclasses import dataclass
+from datetime import date, datetime
 from typing import List, Optional
 
 from ..core.exceptions import (
@@ -7,16 +9,34 @@ from ..core.exceptions import (
     NotFoundError,
     DuplicateError,
 )
-from ..core.validators import Validator
+from ..core.validators import (
+    PROJECT_DESCRIPTION_MAX_LENGTH,
+    PROJECT_NAME_MAX_LENGTH,
+    Validator,
+)
 from ..models.project import Project
-from ..repositories.project_repository import ProjectRepository
+from ..repositories.pagination import Page, validate_page_size
+from ..repositories.protocols import ProjectRepositoryProtocol
+
+
+@dataclass
+class ProjectSummary:
+    project_id: int
+    todo: int = 0
+    doing: int = 0
+    done: int = 0
+    overdue: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.todo + self.doing + self.done
 
 
 class ProjectService:
 
     def __init__(
         self,
-        project_repository: ProjectRepository,
+        project_repository: ProjectRepositoryProtocol,
         max_projects: Optional[int] = None,
     ) -> None:
         self._project_repository = project_repository
@@ -32,13 +52,14 @@ class ProjectService:
 
 
     def create_project(self, name: str, description: str) -> Project:
-        name = Validator.validate_text(name, "Project name", 30)
+        name = Validator.validate_text(
+            name, "Project name", PROJECT_NAME_MAX_LENGTH
+        )
         description = Validator.validate_text(
-            description, "Project description", 150
+            description, "Project description", PROJECT_DESCRIPTION_MAX_LENGTH
         )
 
-        existing_projects = self._project_repository.list_all()
-        if len(existing_projects) >= self._max_projects:
+        if self._project_repository.count() >= self._max_projects:
             raise LimitExceededError(
                 f"Cannot create more than {self._max_projects} projects"
             )
@@ -54,8 +75,62 @@ class ProjectService:
     def list_projects(self) -> List[Project]:
         return self._project_repository.list_all()
 
-    def get_project(self, project_id: int) -> Project:
-        return self._project_repository.get_by_id(project_id)
+    def list_projects_page(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+    ) -> Page[Project]:
+        limit = validate_page_size(limit)
+        return self._project_repository.list_page(limit=limit, after=after)
+
+    def get_project(
+        self,
+        project_id: int,
+        *,
+        version: Optional[int] = None,
+    ) -> Project:
+        # With the version an ETag was built from, the body matches it.
+        return self._project_repository.get_by_id(project_id, version=version)
+
+    def get_project_version(self, project_id: int) -> int:
+        return self._project_repository.get_version(project_id)
+
+    def get_projects_fingerprint(self) -> tuple[int, int, int]:
+        return self._project_repository.list_fingerprint()
+
+    def get_project_summary(
+        self,
+        project_id: int,
+        today: Optional[date] = None,
+    ) -> ProjectSummary:
+        summaries = self._summaries(today, project_id)
+        if not summaries:
+            raise NotFoundError(f"Project with id {project_id} not found")
+        return summaries[0]
+
+    def list_project_summaries(
+        self,
+        today: Optional[date] = None,
+    ) -> List[ProjectSummary]:
+        return self._summaries(today)
+
+    def _summaries(
+        self,
+        today: Optional[date],
+        project_id: Optional[int] = None,
+    ) -> List[ProjectSummary]:
+        if today is None:
+            today = datetime.utcnow().date()
+
+        summaries: dict[int, ProjectSummary] = {}
+        for row in self._project_repository.status_counts(today, project_id):
+            summary = summaries.setdefault(
+                row.project_id, ProjectSummary(row.project_id)
+            )
+            if row.status is not None:
+                setattr(summary, row.status, row.total)
+                summary.overdue += row.overdue
+        return list(summaries.values())
 
     def update_project(
         self,
@@ -65,10 +140,14 @@ class ProjectService:
         description: Optional[str] = None,
     ) -> Project:
         if name is not None:
-            name = Validator.validate_text(name, "Project name", 30)
+            name = Validator.validate_text(
+                name, "Project name", PROJECT_NAME_MAX_LENGTH
+            )
         if description is not None:
             description = Validator.validate_text(
-                description, "Project description", 150
+                description,
+                "Project description",
+                PROJECT_DESCRIPTION_MAX_LENGTH,
             )
 
         try:
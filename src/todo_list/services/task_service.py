@@ -1,30 +1,72 @@
 import os
+import time
 from datetime import datetime, date
-from typing import List, Optional
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+)
+
+from sqlalchemy import Row
 
 from ..core.exceptions import (
+    TodoListError,
     ValidationError,
     LimitExceededError,
-    NotFoundError,
 )
-from ..core.validators import Validator
+from ..core.filters import TASK_SORT_KEYS, TaskFilter, TaskShard
+from ..core.task_fields import TaskChanges, TaskFields
+from ..core.validators import (
+    SEARCH_QUERY_MAX_LENGTH,
+    TASK_STATUSES,
+    Validator,
+)
 from ..models.task import Task
-from ..repositories.project_repository import ProjectRepository
-from ..repositories.task_repository import TaskRepository
+from ..repositories.pagination import Page, validate_page_size
+from ..repositories.protocols import (
+    ProjectRepositoryProtocol,
+    TaskRepositoryProtocol,
+    UnitOfWorkProtocol,
+)
+from .task_import import (
+    ImportRecord,
+    ImportReport,
+    RejectedRow,
+    check_field_types,
+)
+
+DEFAULT_CLOSE_CHUNK_SIZE = 1000
+DEFAULT_EXPORT_BATCH_SIZE = 1000
+DEFAULT_IMPORT_BATCH_SIZE = 5000
+
+OVERDUE_SHARD_KEYS = ("id", "project")
+
+# Told about every deadline set through the service, such as
+# DeadlineScheduler.notice; it must return quickly and never raise.
+DeadlineObserver = Callable[[date], None]
 
 
 class TaskService:
 
-    ALLOWED_STATUSES = {"todo", "doing", "done"}
+    ALLOWED_STATUSES = frozenset(TASK_STATUSES)
 
     def __init__(
         self,
-        task_repository: TaskRepository,
-        project_repository: ProjectRepository,
+        task_repository: TaskRepositoryProtocol,
+        project_repository: ProjectRepositoryProtocol,
         max_tasks_per_project: Optional[int] = None,
+        unit_of_work: Optional[UnitOfWorkProtocol] = None,
+        deadline_observer: Optional[DeadlineObserver] = None,
     ) -> None:
         self._task_repository = task_repository
         self._project_repository = project_repository
+        self._unit_of_work = unit_of_work
+        self._deadline_observer = deadline_observer
 
         if max_tasks_per_project is None:
             max_tasks_env = os.getenv("MAX_NUMBER_OF_TASKS", "1000")
@@ -36,21 +78,19 @@ class TaskService:
                 )
         self._max_tasks_per_project = max_tasks_per_project
 
-    def _validate_status(self, status: str) -> str:
-        if status not in self.ALLOWED_STATUSES:
-            allowed = ", ".join(sorted(self.ALLOWED_STATUSES))
+    def _parse_datetime(
+        self,
+        value: Optional[str],
+        field_name: str,
+    ) -> Optional[datetime]:
+        if value is None:
+            return None
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
             raise ValidationError(
-                f"Invalid status '{status}'. Allowed values: {allowed}"
+                f"{field_name} must be an ISO 8601 date or datetime"
             )
-        return status
-
-    def _parse_deadline(self, deadline: Optional[str]) -> Optional[date]:
-        if deadline is None:
-            return None
-
-        Validator.validate_deadline(deadline)
-        return date.fromisoformat(deadline)
-
 
     def create_task(
         self,
@@ -59,41 +99,246 @@ class TaskService:
         description: str,
         *,
         status: str = "todo",
-        deadline: Optional[str] = None,
+        deadline: Optional[str | date] = None,
     ) -> Task:
-
-        self._project_repository.get_by_id(project_id)
-
-        title = Validator.validate_text(title, "Task title", 30)
-        description = Validator.validate_text(
-            description, "Task description", 150
+        return self.create_validated_task(
+            project_id,
+            TaskFields.parse(title, description, status, deadline),
         )
 
-        status = self._validate_status(status)
-        deadline_date = self._parse_deadline(deadline)
+    def create_validated_task(
+        self,
+        project_id: int,
+        fields: TaskFields,
+    ) -> Task:
+        project = self._project_repository.get_by_id(project_id, cached=False)
 
-        existing_tasks = self._task_repository.list_by_project(project_id)
-        if len(existing_tasks) >= self._max_tasks_per_project:
+        if project.task_count >= self._max_tasks_per_project:
             raise LimitExceededError(
                 f"Cannot create more than {self._max_tasks_per_project} "
                 f"tasks for project {project_id}"
             )
 
         task = self._task_repository.create(
-            project_id=project_id,
-            title=title,
-            description=description,
-            status=status,
-            deadline=deadline_date,
+            project_id,
+            fields.title,
+            fields.description,
+            status=fields.status,
+            deadline=fields.deadline,
         )
+        self._notice_deadlines([fields.deadline])
         return task
 
+    def create_tasks(
+        self,
+        project_id: int,
+        tasks: Sequence[Mapping[str, Any] | TaskFields],
+    ) -> List[Any]:
+        """Create several tasks in one transaction (all-or-nothing)."""
+        project = self._project_repository.get_by_id(project_id, cached=False)
+
+        rows: List[dict] = []
+        errors: List[str] = []
+        for index, item in enumerate(tasks):
+            if isinstance(item, TaskFields):
+                rows.append(item.as_row())
+                continue
+            try:
+                rows.append(
+                    self._validate_new_task(
+                        item.get("title"),
+                        item.get("description"),
+                        item.get("status") or "todo",
+                        item.get("deadline"),
+                    )
+                )
+            except TodoListError as exc:
+                errors.append(f"item {index}: {exc}")
+
+        if errors:
+            raise ValidationError("; ".join(errors))
+
+        if project.task_count + len(rows) > self._max_tasks_per_project:
+            raise LimitExceededError(
+                f"Cannot create {len(rows)} tasks for project {project_id}: "
+                f"limit is {self._max_tasks_per_project}, "
+                f"{project.task_count} already exist"
+            )
+
+        tasks = self._task_repository.create_many(project_id, rows)
+        self._notice_deadlines(row["deadline"] for row in rows)
+        return tasks
+
+    def import_tasks(
+        self,
+        project_id: int,
+        records: Iterable[ImportRecord],
+        *,
+        batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+        on_reject: Optional[Callable[[RejectedRow], None]] = None,
+    ) -> ImportReport:
+        """Load a stream of records batch by batch, skipping rejects."""
+        if batch_size < 1:
+            raise ValidationError("batch_size must be a positive integer")
+
+        started = time.perf_counter()
+        project = self._project_repository.get_by_id(project_id, cached=False)
+        room = self._max_tasks_per_project - project.task_count
+        report = ImportReport()
+        batch: List[dict] = []
+
+        def reject(record: ImportRecord, error: str) -> None:
+            report.rejected += 1
+            if on_reject is not None:
+                on_reject(RejectedRow(record.line, error, record.raw))
+
+        for record in records:
+            if record.error is not None:
+                reject(record, record.error)
+                continue
+            data = record.data or {}
+            try:
+                check_field_types(data)
+                fields = self._validate_new_task(
+                    data.get("title"),
+                    data.get("description"),
+                    data.get("status") or "todo",
+                    data.get("deadline"),
+                )
+            except TodoListError as exc:
+                reject(record, str(exc))
+                continue
+            if report.imported + len(batch) >= room:
+                reject(
+                    record,
+                    f"project {project_id} reached its limit of "
+                    f"{self._max_tasks_per_project} tasks",
+                )
+                continue
+
+            batch.append(fields)
+            if len(batch) >= batch_size:
+                report.imported += self._load_import_batch(project_id, batch)
+                batch = []
+
+        report.imported += self._load_import_batch(project_id, batch)
+        report.seconds = time.perf_counter() - started
+        return report
+
+    def _load_import_batch(self, project_id: int, batch: List[dict]) -> int:
+        loaded = self._task_repository.import_rows(project_id, batch)
+        # Committed per batch, so the transaction stays bounded by the batch.
+        if loaded and self._unit_of_work is not None:
+            self._unit_of_work.commit()
+        self._notice_deadlines(row["deadline"] for row in batch)
+        return loaded
+
+    def _notice_deadlines(self, deadlines: Iterable[Optional[date]]) -> None:
+        if self._deadline_observer is None:
+            return
+        for deadline in set(deadlines):
+            if deadline is not None:
+                self._deadline_observer(deadline)
+
+    def _validate_new_task(
+        self,
+        title: str,
+        description: str,
+        status: str,
+        deadline: Optional[str],
+    ) -> dict:
+        return TaskFields.parse(title, description, status, deadline).as_row()
+
     def list_tasks_for_project(self, project_id: int) -> List[Task]:
         self._project_repository.get_by_id(project_id)
         return self._task_repository.list_by_project(project_id)
 
-    def get_task(self, task_id: int) -> Task:
-        return self._task_repository.get_by_id(task_id)
+    def list_tasks_page(
+        self,
+        project_id: int,
+        limit: int,
+        after: Optional[str] = None,
+        *,
+        statuses: Optional[Sequence[str]] = None,
+        deadline_from: Optional[str] = None,
+        deadline_to: Optional[str] = None,
+        created_from: Optional[str] = None,
+        created_to: Optional[str] = None,
+        overdue: bool = False,
+        sort: str = "created_at",
+        now: Optional[datetime] = None,
+    ) -> Page[Task]:
+        limit = validate_page_size(limit)
+        if sort not in TASK_SORT_KEYS:
+            raise ValidationError(
+                f"Invalid sort '{sort}'. Allowed values: "
+                f"{', '.join(TASK_SORT_KEYS)}"
+            )
+        if overdue and now is None:
+            now = datetime.utcnow()
+
+        filters = TaskFilter(
+            statuses=(
+                tuple(sorted({Validator.validate_status(s) for s in statuses}))
+                if statuses
+                else None
+            ),
+            deadline_from=Validator.parse_deadline(deadline_from),
+            deadline_to=Validator.parse_deadline(deadline_to),
+            created_from=self._parse_datetime(created_from, "created_from"),
+            created_to=self._parse_datetime(created_to, "created_to"),
+            overdue_on=now.date() if overdue else None,
+            sort=sort,
+        )
+        self._project_repository.get_by_id(project_id)
+        return self._task_repository.list_page_by_project(
+            project_id,
+            limit=limit,
+            after=after,
+            filters=filters,
+        )
+
+    def search_tasks(
+        self,
+        query: str,
+        limit: int,
+        after: Optional[str] = None,
+        *,
+        project_id: Optional[int] = None,
+    ) -> Page[Task]:
+        query = Validator.validate_text(
+            query, "Search query", SEARCH_QUERY_MAX_LENGTH
+        )
+        limit = validate_page_size(limit)
+        if project_id is not None:
+            self._project_repository.get_by_id(project_id)
+        return self._task_repository.search(
+            query,
+            limit=limit,
+            after=after,
+            project_id=project_id,
+        )
+
+    def export_tasks(
+        self,
+        project_id: int,
+        batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+    ) -> Iterator[Sequence[Row]]:
+        self._project_repository.get_by_id(project_id)
+        return self._task_repository.stream_by_project(
+            project_id,
+            batch_size=batch_size,
+        )
+
+    def get_task(self, task_id: int, *, version: Optional[int] = None) -> Task:
+        # version: the project version from get_task_version, see get_project.
+        return self._task_repository.get_by_id(task_id, version=version)
+
+    def get_project_version(self, project_id: int) -> int:
+        return self._project_repository.get_version(project_id)
+
+    def get_task_version(self, task_id: int) -> tuple[int, int]:
+        return self._task_repository.get_version(task_id)
 
     def update_task(
         self,
@@ -102,49 +347,156 @@ class TaskService:
         title: Optional[str] = None,
         description: Optional[str] = None,
         status: Optional[str] = None,
-        deadline: Optional[str] = None,
+        deadline: Optional[str | date] = None,
     ) -> Task:
-        task = self._task_repository.get_by_id(task_id)
+        return self.update_validated_task(
+            task_id,
+            TaskChanges.parse(title, description, status, deadline),
+        )
 
-        if title is not None:
-            task.title = Validator.validate_text(
-                title, "Task title", 30
-            )
+    def update_validated_task(
+        self,
+        task_id: int,
+        changes: TaskChanges,
+        *,
+        now: Optional[datetime] = None,
+    ) -> Task:
+        # closed_at follows the status as in change_status_bulk.
+        updated = self._task_repository.update(
+            task_id,
+            changes,
+            closed_at=datetime.utcnow() if now is None else now,
+        )
+        self._notice_deadlines([changes.deadline])
+        return updated
 
-        if description is not None:
-            task.description = Validator.validate_text(
-                description, "Task description", 150
-            )
+    def change_status(
+        self,
+        task_id: int,
+        status: str,
+        *,
+        now: Optional[datetime] = None,
+    ) -> Task:
+        status = Validator.validate_status(status)
+        return self._task_repository.update(
+            task_id,
+            TaskChanges(status=status),
+            closed_at=datetime.utcnow() if now is None else now,
+        )
+
+    def change_status_bulk(
+        self,
+        status: str,
+        *,
+        ids: Optional[Sequence[int]] = None,
+        project_id: Optional[int] = None,
+        current_status: Optional[str] = None,
+        deadline_from: Optional[str | date] = None,
+        deadline_to: Optional[str | date] = None,
+        now: Optional[datetime] = None,
+    ) -> List[int]:
+        status = Validator.validate_status(status)
+        if current_status is not None:
+            current_status = Validator.validate_status(current_status)
 
-        if status is not None:
-            task.status = self._validate_status(status)
+        filters = (project_id, current_status, deadline_from, deadline_to)
+        if ids is None and all(f is None for f in filters):
+            raise ValidationError(
+                "Provide task ids or at least one filter "
+                "(project_id, current_status, deadline_from, deadline_to)"
+            )
 
-        if deadline is not None:
-            task.deadline = self._parse_deadline(deadline)
+        if project_id is not None:
+            self._project_repository.get_by_id(project_id)
 
-        updated = self._task_repository.save(task)
-        return updated
+        if now is None:
+            now = datetime.utcnow()
 
-    def change_status(self, task_id: int, status: str) -> Task:
-        status = self._validate_status(status)
-        task = self._task_repository.get_by_id(task_id)
-        task.status = status
-        return self._task_repository.save(task)
+        return self._task_repository.bulk_set_status(
+            status,
+            now if status == "done" else None,
+            ids=ids,
+            project_id=project_id,
+            current_status=current_status,
+            deadline_from=Validator.parse_deadline(deadline_from),
+            deadline_to=Validator.parse_deadline(deadline_to),
+        )
 
     def delete_task(self, task_id: int) -> None:
         self._task_repository.delete(task_id)
 
-    def close_overdue_tasks(self, now: Optional[datetime] = None) -> int:
+    def upcoming_deadlines(self, today: Optional[date] = None) -> List[date]:
+        if today is None:
+            today = datetime.utcnow().date()
+        return self._task_repository.upcoming_deadlines(today)
+
+    def count_overdue_tasks(
+        self,
+        now: Optional[datetime] = None,
+        shard: Optional[TaskShard] = None,
+    ) -> int:
+        if now is None:
+            now = datetime.utcnow()
+        return self._task_repository.count_overdue(now.date(), shard)
+
+    def plan_overdue_shards(
+        self,
+        shard_by: str,
+        shard_size: int,
+        now: Optional[datetime] = None,
+    ) -> List[TaskShard]:
+        """Split the overdue tasks into disjoint shards of `shard_size`."""
+        if shard_by not in OVERDUE_SHARD_KEYS:
+            raise ValidationError(
+                f"shard_by must be one of: {', '.join(OVERDUE_SHARD_KEYS)}"
+            )
+        if shard_size < 1:
+            raise ValidationError("shard_size must be a positive integer")
         if now is None:
             now = datetime.utcnow()
+        today = now.date()
+
+        if shard_by == "project":
+            project_ids = self._task_repository.overdue_project_ids(today)
+            return [
+                TaskShard(project_ids=tuple(project_ids[i:i + shard_size]))
+                for i in range(0, len(project_ids), shard_size)
+            ]
 
-        overdue_tasks = self._task_repository.get_overdue_tasks(now)
-        if not overdue_tasks:
-            return 0
+        bounds = self._task_repository.overdue_id_range(today)
+        if bounds is None:
+            return []
+        low, high = bounds
+        return [
+            TaskShard(min_id=start, max_id=min(start + shard_size - 1, high))
+            for start in range(low, high + 1, shard_size)
+        ]
 
-        for task in overdue_tasks:
-            task.status = "done"
-            task.closed_at = now
-            self._task_repository.save(task)
+    def close_overdue_tasks(
+        self,
+        now: Optional[datetime] = None,
+        chunk_size: int = DEFAULT_CLOSE_CHUNK_SIZE,
+        shard: Optional[TaskShard] = None,
+    ) -> List[int]:
+        if now is None:
+            now = datetime.utcnow()
+        if chunk_size < 1:
+            raise ValidationError("chunk_size must be a positive integer")
+
+        closed_ids: List[int] = []
+        while True:
+            chunk = self._task_repository.close_overdue(
+                now.date(),
+                now,
+                limit=chunk_size,
+                shard=shard,
+            )
+            # Commit per chunk so a large backlog never turns into one
+            # long transaction holding row locks.
+            if self._unit_of_work is not None:
+                self._unit_of_work.commit()
+            closed_ids.extend(chunk)
+            if len(chunk) < chunk_size:
+                break
 
-        return len(overdue_tasks)
+        return closed_ids
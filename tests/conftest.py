@@ -0,0 +1,62 @@
+import os
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+from todo_list.cache.lru import LRUCache
+from todo_list.db.base import Base
+from todo_list.models import project, task  # noqa: F401
+
+
+# The tasks table carries a PostgreSQL full-text column; on SQLite it is
+# plain text filled with the raw words, which is all these tests need.
+@compiles(TSVECTOR, "sqlite")
+def _compile_tsvector(type_, compiler, **kw) -> str:
+    return "TEXT"
+
+
+@pytest.fixture
+def engine(tmp_path):
+    # A database file rather than ":memory:", so every session has its own
+    # connection and does not see another one's uncommitted writes.
+    engine = create_engine(f"sqlite:///{tmp_path / 'todo.db'}", future=True)
+
+    @event.listens_for(engine, "connect")
+    def _connect(dbapi_connection, connection_record) -> None:
+        dbapi_connection.create_function(
+            "to_tsvector", 2, lambda config, text: text, deterministic=True
+        )
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine, autoflush=False, future=True)
+
+
+@pytest.fixture
+def cache():
+    return LRUCache(max_size=100, ttl_seconds=3600)
+
+
+@pytest.fixture
+def pg_session_factory():
+    # Tests of PostgreSQL-only SQL run against TEST_DATABASE_URL, an empty
+    # database they create and drop the tables in.
+    url = os.getenv("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    engine = create_engine(url, future=True)
+    Base.metadata.create_all(engine)
+    try:
+        yield sessionmaker(bind=engine, autoflush=False, future=True)
+    finally:
+        Base.metadata.drop_all(engine)
+        engine.dispose()
@@ -0,0 +1,244 @@
+from contextlib import contextmanager
+
+import pytest
+from fastapi import Response
+
+from todo_list.api.controllers.project_controller import get_project
+from todo_list.api.controllers.task_controller import get_task
+from todo_list.core.exceptions import NotFoundError
+from todo_list.core.task_fields import TaskChanges
+from todo_list.db.unit_of_work import UnitOfWork
+from todo_list.repositories.base import task_cache_key
+from todo_list.repositories.project_repository import ProjectRepository
+from todo_list.repositories.task_repository import TaskRepository
+from todo_list.services.project_service import ProjectService
+from todo_list.services.task_service import TaskService
+
+
+@pytest.fixture
+def scope(session_factory, cache):
+    # One unit of work with the shared cache, like one HTTP request.
+    @contextmanager
+    def request_scope():
+        session = session_factory()
+        try:
+            with UnitOfWork(session) as uow:
+                yield (
+                    TaskService(
+                        TaskRepository(session, cache),
+                        ProjectRepository(session, cache),
+                        max_tasks_per_project=100,
+                        unit_of_work=uow,
+                    ),
+                    ProjectService(
+                        ProjectRepository(session, cache), max_projects=100
+                    ),
+                )
+        finally:
+            session.close()
+
+    return request_scope
+
+
+@pytest.fixture
+def project_with_tasks(scope):
+    with scope() as (tasks, projects):
+        project_id = projects.create_project("p1", "d").id
+        task_ids = [
+            tasks.create_task(project_id, f"t{i}", "x").id for i in range(2)
+        ]
+    return project_id, task_ids
+
+
+def read_title(scope, task_id: int) -> str:
+    with scope() as (tasks, _):
+        return tasks.get_task(task_id).title
+
+
+def counters(cache) -> tuple[int, int, int]:
+    stats = cache.stats()
+    return stats["hits"], stats["misses"], stats["invalidations"]
+
+
+def cached_title(cache, task_id: int):
+    entry = cache.get(task_cache_key(task_id))
+    return None if entry is None else entry[1]["title"]
+
+
+def test_update_evicts_the_cached_task(scope, cache, project_with_tasks):
+    _, (task_id, _) = project_with_tasks
+
+    assert read_title(scope, task_id) == "t0"
+    hits, misses, invalidations = counters(cache)
+    assert read_title(scope, task_id) == "t0"
+    assert counters(cache) == (hits + 1, misses, invalidations)
+
+    with scope() as (tasks, _):
+        tasks.update_validated_task(task_id, TaskChanges(title="renamed"))
+    assert counters(cache)[2] > invalidations
+
+    hits, misses, _ = counters(cache)
+    assert read_title(scope, task_id) == "renamed"
+    assert counters(cache)[:2] == (hits, misses + 1)
+    assert cached_title(cache, task_id) == "renamed"
+
+
+def test_delete_evicts_the_cached_task(scope, cache, project_with_tasks):
+    _, (task_id, other_id) = project_with_tasks
+    read_title(scope, task_id)
+    _, _, invalidations = counters(cache)
+
+    with scope() as (tasks, _):
+        tasks.delete_task(task_id)
+
+    assert counters(cache)[2] > invalidations
+    assert cache.get(task_cache_key(task_id)) is None
+    with pytest.raises(NotFoundError):
+        read_title(scope, task_id)
+    assert read_title(scope, other_id) == "t1"
+
+
+def test_project_delete_evicts_its_cascaded_tasks(
+    scope, cache, project_with_tasks
+):
+    project_id, task_ids = project_with_tasks
+    for task_id in task_ids:
+        read_title(scope, task_id)
+    with scope() as (_, projects):
+        projects.get_project(project_id)
+    _, _, invalidations = counters(cache)
+
+    with scope() as (_, projects):
+        projects.delete_project(project_id)
+
+    assert counters(cache)[2] >= invalidations + len(task_ids) + 1
+    for task_id in task_ids:
+        assert cache.get(task_cache_key(task_id)) is None
+        with pytest.raises(NotFoundError):
+            read_title(scope, task_id)
+    with pytest.raises(NotFoundError):
+        with scope() as (_, projects):
+            projects.get_project(project_id)
+
+
+def test_commit_evicts_what_a_concurrent_reader_cached(
+    scope, cache, project_with_tasks
+):
+    _, (task_id, _) = project_with_tasks
+
+    with scope() as (tasks, _):
+        tasks.update_validated_task(task_id, TaskChanges(title="renamed"))
+        # Another request reads the committed row before this one commits.
+        assert read_title(scope, task_id) == "t0"
+        assert cached_title(cache, task_id) == "t0"
+
+    assert cache.get(task_cache_key(task_id)) is None
+    assert read_title(scope, task_id) == "renamed"
+
+
+def test_rollback_leaves_no_uncommitted_values(
+    scope, cache, project_with_tasks
+):
+    _, (task_id, _) = project_with_tasks
+    read_title(scope, task_id)
+
+    with pytest.raises(RuntimeError):
+        with scope() as (tasks, _):
+            tasks.update_validated_task(
+                task_id, TaskChanges(title="uncommitted")
+            )
+            # Read back through the same session: must not be cached.
+            assert tasks.get_task(task_id).title == "uncommitted"
+            assert cache.get(task_cache_key(task_id)) is None
+            assert read_title(scope, task_id) == "t0"
+            raise RuntimeError("request failed")
+
+    assert cached_title(cache, task_id) in (None, "t0")
+    hits, misses, _ = counters(cache)
+    assert read_title(scope, task_id) == "t0"
+    assert counters(cache)[:2] == (hits, misses + 1)
+    assert cached_title(cache, task_id) == "t0"
+
+
+@pytest.fixture
+def other_process(session_factory):
+    # A writer with no access to the cache, like the autoclose command or
+    # another API worker.
+    @contextmanager
+    def writer_scope():
+        session = session_factory()
+        try:
+            with UnitOfWork(session) as uow:
+                yield (
+                    TaskService(
+                        TaskRepository(session),
+                        ProjectRepository(session),
+                        unit_of_work=uow,
+                    ),
+                    ProjectService(ProjectRepository(session)),
+                )
+        finally:
+            session.close()
+
+    return writer_scope
+
+
+def test_task_etag_and_body_agree_after_an_outside_write(
+    scope, other_process, project_with_tasks
+):
+    _, (task_id, _) = project_with_tasks
+    with scope() as (tasks, _):
+        response = Response()
+        body = get_task(task_id, response, None, tasks)
+    etag = response.headers["ETag"]
+    assert body.status == "todo"
+
+    with other_process() as (tasks, _):
+        tasks.change_status(task_id, "done")
+
+    with scope() as (tasks, _):
+        response = Response()
+        body = get_task(task_id, response, etag, tasks)
+    assert response.headers["ETag"] != etag
+    assert body.status == "done"
+
+
+def test_project_etag_and_body_agree_after_an_outside_write(
+    scope, other_process, project_with_tasks
+):
+    project_id, _ = project_with_tasks
+    with scope() as (_, projects):
+        response = Response()
+        get_project(project_id, response, None, projects)
+    etag = response.headers["ETag"]
+
+    with other_process() as (_, projects):
+        projects.update_project(project_id, name="renamed")
+
+    with scope() as (_, projects):
+        response = Response()
+        body = get_project(project_id, response, etag, projects)
+    assert response.headers["ETag"] != etag
+    assert body.name == "renamed"
+
+
+def test_writes_are_not_based_on_stale_cached_rows(
+    scope, other_process, project_with_tasks
+):
+    project_id, (task_id, _) = project_with_tasks
+    read_title(scope, task_id)
+    with scope() as (_, projects):
+        projects.get_project(project_id)
+
+    with other_process() as (tasks, projects):
+        tasks.update_validated_task(task_id, TaskChanges(title="outside"))
+        projects.update_project(project_id, name="outside")
+
+    with scope() as (tasks, projects):
+        # The cached copies still say "t0" and "p1".
+        task = tasks.change_status(task_id, "doing")
+        assert (task.title, task.status) == ("outside", "doing")
+        assert projects.update_project(project_id, name="p1").name == "p1"
+
+    with other_process() as (_, projects):
+        assert projects.get_project(project_id).name == "p1"
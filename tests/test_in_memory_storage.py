@@ -0,0 +1,26 @@
+import pytest
+
+from todo_list.core.exceptions import NotFoundError
+from todo_list.in_memory.storage.in_memory_storage import InMemoryStorage
+
+
+class FailingLogStorage(InMemoryStorage):
+    # Stands in for a PersistentInMemoryStorage whose log write fails.
+    def _record(self, operation, *args):
+        if operation == "task+":
+            raise OSError("disk full")
+
+
+def test_failed_task_record_leaves_no_task_behind():
+    storage = FailingLogStorage(max_tasks=1)
+    project = storage.create_project("p1", "d")
+
+    with pytest.raises(OSError):
+        storage.create_task(project.id, "report", "x", deadline="2020-01-01")
+
+    assert storage._tasks == {} and project.tasks == {}
+    assert storage._task_slots == 0
+    assert storage._token_index == {} and storage._task_projects == {}
+    assert project.version == 1
+    with pytest.raises(NotFoundError):
+        storage.get_task(1)
@@ -0,0 +1,37 @@
+from todo_list.in_memory.repositories import (
+    InMemoryProjectRepository,
+    InMemoryTaskRepository,
+)
+from todo_list.in_memory.storage.in_memory_storage import InMemoryStorage
+from todo_list.services.task_import import read_records
+from todo_list.services.task_service import TaskService
+
+
+def test_import_names_the_field_of_a_non_string_value():
+    storage = InMemoryStorage()
+    project_id = storage.create_project("p1", "d").id
+    service = TaskService(
+        InMemoryTaskRepository(storage),
+        InMemoryProjectRepository(storage),
+        max_tasks_per_project=100,
+    )
+    lines = [
+        '{"title": "ok", "description": "x"}',
+        '{"title": "a", "description": "x", "status": ["done"]}',
+        '{"title": "b", "description": "x", "deadline": 20250101}',
+        '{"title": {"en": "c"}, "description": "x"}',
+        '{"title": "d", "description": "x", "status": 0}',
+    ]
+    rejects = []
+
+    report = service.import_tasks(
+        project_id, read_records(lines, "ndjson"), on_reject=rejects.append
+    )
+
+    assert (report.imported, report.rejected) == (1, 4)
+    assert [(r.line, r.error) for r in rejects] == [
+        (2, "status must be string"),
+        (3, "deadline must be string"),
+        (4, "title must be string"),
+        (5, "status must be string"),
+    ]
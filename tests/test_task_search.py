@@ -0,0 +1,36 @@
+from todo_list.repositories.project_repository import ProjectRepository
+from todo_list.repositories.task_repository import TaskRepository
+
+
+def test_search_pages_through_equal_ranks(pg_session_factory):
+    with pg_session_factory() as session:
+        project = ProjectRepository(session).create("p1", "d")
+        # The same words everywhere, so every task gets the same rank and
+        # only the id orders them.
+        tasks = TaskRepository(session).create_many(
+            project.id,
+            [
+                {
+                    "title": "write quarterly report",
+                    "description": "numbers",
+                    "status": "todo",
+                    "deadline": None,
+                }
+                for _ in range(7)
+            ],
+        )
+        session.commit()
+        expected = sorted(task.id for task in tasks)
+
+    seen = []
+    after = None
+    with pg_session_factory() as session:
+        repository = TaskRepository(session)
+        while True:
+            page = repository.search("report", limit=2, after=after)
+            seen.extend(task.id for task in page.items)
+            after = page.next_cursor
+            if after is None:
+                break
+
+    assert seen == expected
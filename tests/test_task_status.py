@@ -0,0 +1,70 @@
+from datetime import datetime
+
+import pytest
+
+from todo_list.core.task_fields import TaskChanges
+from todo_list.db.unit_of_work import UnitOfWork
+from todo_list.in_memory.repositories import (
+    InMemoryProjectRepository,
+    InMemoryTaskRepository,
+)
+from todo_list.in_memory.storage.in_memory_storage import InMemoryStorage
+from todo_list.repositories.project_repository import ProjectRepository
+from todo_list.repositories.task_repository import TaskRepository
+from todo_list.services.task_service import TaskService
+
+NOW = datetime(2026, 1, 2, 3, 4, 5)
+
+
+@pytest.fixture(params=["sql", "memory"])
+def task_service(request, session_factory):
+    if request.param == "memory":
+        storage = InMemoryStorage()
+        storage.create_project("p1", "d")
+        yield TaskService(
+            InMemoryTaskRepository(storage),
+            InMemoryProjectRepository(storage),
+        )
+        return
+
+    session = session_factory()
+    try:
+        with UnitOfWork(session) as uow:
+            ProjectRepository(session).create("p1", "d")
+            yield TaskService(
+                TaskRepository(session),
+                ProjectRepository(session),
+                unit_of_work=uow,
+            )
+    finally:
+        session.close()
+
+
+def closed_at(task):
+    # SQL tasks carry a datetime, in-memory ones an ISO string.
+    value = task.closed_at
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def test_single_and_bulk_status_changes_agree_on_closed_at(task_service):
+    single, bulk = (
+        task_service.create_task(1, f"t{i}", "x").id for i in range(2)
+    )
+
+    done = task_service.change_status(single, "done", now=NOW)
+    task_service.change_status_bulk("done", ids=[bulk], now=NOW)
+    assert closed_at(done) == NOW.isoformat()
+    assert closed_at(task_service.get_task(bulk)) == NOW.isoformat()
+
+    # Done again: still closed at the first time.
+    later = datetime(2026, 2, 1)
+    assert closed_at(task_service.change_status(single, "done", now=later)) == (
+        NOW.isoformat()
+    )
+
+    reopened = task_service.update_validated_task(
+        single, TaskChanges(status="doing"), now=later
+    )
+    task_service.change_status_bulk("doing", ids=[bulk], now=later)
+    assert closed_at(reopened) is None
+    assert closed_at(task_service.get_task(bulk)) is None